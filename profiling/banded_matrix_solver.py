@@ -4,7 +4,10 @@ import time
 import random
 import csv
 from pathlib import Path
-from ezdxf.math.linalg import Matrix, BandedMatrixLU, banded_matrix, LUDecomposition
+from ezdxf.math.linalg import (
+    Matrix, BandedMatrixLU, banded_matrix, LUDecomposition, compact_banded_matrix_from_rows,
+    banded_matrix_batch_solver,
+)
 
 DIR = Path('~/Desktop/Outbox').expanduser()
 
@@ -33,6 +36,30 @@ def profile_banded_matrix_solver(count, A: Matrix, B: Matrix):
         lu.solve_matrix(B)
 
 
+def profile_banded_matrix_from_rows(count, rows, B: Matrix):
+    for _ in range(count):
+        lu = BandedMatrixLU(*compact_banded_matrix_from_rows(rows))
+        lu.solve_matrix(B)
+
+
+def profile_banded_matrix_batch_solver(count, rows, B: Matrix, batch: int):
+    A, m1, m2 = compact_banded_matrix_from_rows(rows)
+    for _ in range(count):
+        banded_matrix_batch_solver([A] * batch, m1, m2, [B] * batch)
+
+
+def random_sparse_rows(n, m1: int, m2: int):
+    # diagonal dominant rows, stable without pivoting
+    rows = []
+    for i in range(n):
+        first = max(0, i - m1)
+        last = min(n - 1, i + m2)
+        values = random_values(last - first + 1)
+        values[i - first] = 10.0
+        rows.append((first, values))
+    return rows
+
+
 def profile(func, *args):
     t0 = time.perf_counter()
     func(*args)
@@ -57,6 +84,13 @@ with open(DIR / 'profiling_banded_matrix.csv', mode='wt', newline='') as f:
                 f'Matrix {size}x{size}, m1={m1}, m2={m2}, {REPEAT}x: Standard LU {t0:0.3f}s Banded LU {t1:0.3}s factor: x{factor:.1f}')
             writer.writerow([f"N={size}, m1+m2+1={m1 + m2 + 1}", round(t0, 3), round(t1, 3), round(factor, 1)])
 
+for size in (1000, 10000):
+    rows = random_sparse_rows(size, 2, 2)
+    B = Matrix(list(zip(random_values(size), random_values(size), random_values(size))))
+    t0 = profile(profile_banded_matrix_from_rows, REPEAT, rows, B)
+    t1 = profile(profile_banded_matrix_batch_solver, 1, rows, B, REPEAT)
+    print(f'Sparse rows {size}x{size}, m1=2, m2=2, {REPEAT}x: Banded LU {t0:0.3f}s Batch solver {t1:0.3f}s')
+
 # Advantage Banded Matrix starts at ~ N=15
 # Matrix 10x10, m1=1, m2=1, 5x: Standard LU 0.001s Banded LU 0.00057s factor: x2.1
 # Matrix 10x10, m1=2, m2=1, 5x: Standard LU 0.001s Banded LU 0.000922s factor: x1.4
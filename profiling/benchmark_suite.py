@@ -0,0 +1,347 @@
+# Copyright (c) 2020 Manfred Moitzi
+# License: MIT License
+"""
+Benchmark suite based on reproducible synthetic drawings.
+
+Each benchmark creates a deterministic drawing (fixed random seed) with `scale` entities of a specific
+kind and measures the throughput of loading, querying, transforming, rendering and saving this drawing,
+plus the peak memory of these operations. The results are written as JSON to compare runs of different
+ezdxf versions:
+
+    python benchmark_suite.py --scale 2000 --json new.json --compare old.json
+
+"""
+from typing import Callable, Dict, List, Any
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from io import StringIO
+
+import ezdxf
+from ezdxf.addons.drawing import Frontend, RenderContext
+from ezdxf.addons.drawing.backend import Backend
+from ezdxf.addons.drawing.text import FontMeasurements
+from ezdxf.math import Matrix44
+from ezdxf.render import forms
+
+SEED = 2020
+OPERATIONS = ['load', 'query', 'transform', 'render', 'save']
+LAYERS = ['WALLS', 'DOORS', 'WINDOWS', 'FURNITURE', 'TEXT']
+
+
+class CountingBackend(Backend):
+    """ Rendering backend without output, counts the drawing primitives. """
+
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def set_background(self, color) -> None:
+        pass
+
+    def draw_line(self, start, end, properties) -> None:
+        self.count += 1
+
+    def draw_path(self, path, properties) -> None:
+        self.count += 1
+
+    def draw_point(self, pos, properties) -> None:
+        self.count += 1
+
+    def draw_filled_polygon(self, points, properties) -> None:
+        self.count += 1
+
+    def draw_text(self, text, transform, properties, cap_height) -> None:
+        self.count += 1
+
+    def get_font_measurements(self, cap_height: float) -> FontMeasurements:
+        return FontMeasurements(baseline=0.0, cap_top=cap_height, x_top=cap_height * 0.5, bottom=-cap_height * 0.2)
+
+    def get_text_line_width(self, text: str, cap_height: float) -> float:
+        return len(text) * cap_height
+
+    def clear(self) -> None:
+        self.count = 0
+
+
+def random_point(rng: random.Random, size: float = 1000.):
+    return rng.uniform(0, size), rng.uniform(0, size)
+
+
+def random_attribs(rng: random.Random) -> dict:
+    return {'layer': rng.choice(LAYERS), 'color': rng.randint(1, 7)}
+
+
+def polygon(rng: random.Random, count: int, radius: float):
+    x, y = random_point(rng)
+    return [
+        (x + math.cos(angle) * radius, y + math.sin(angle) * radius)
+        for angle in (math.tau * i / count for i in range(count))
+    ]
+
+
+def make_lines(msp, rng: random.Random, count: int) -> None:
+    for _ in range(count):
+        msp.add_line(random_point(rng), random_point(rng), dxfattribs=random_attribs(rng))
+
+
+def make_polylines(msp, rng: random.Random, count: int) -> None:
+    for index in range(count):
+        points = [random_point(rng) for _ in range(rng.randint(3, 20))]
+        if index % 4:
+            msp.add_lwpolyline(points, format='xy', dxfattribs=random_attribs(rng))
+        else:
+            msp.add_polyline2d(points, dxfattribs=random_attribs(rng))
+
+
+def make_splines(msp, rng: random.Random, count: int) -> None:
+    for index in range(count):
+        points = [random_point(rng) for _ in range(rng.randint(4, 12))]
+        if index % 2:
+            msp.add_open_spline(points, dxfattribs=random_attribs(rng))
+        else:
+            msp.add_spline(points, dxfattribs=random_attribs(rng))
+
+
+def make_hatches(msp, rng: random.Random, count: int) -> None:
+    for _ in range(count):
+        hatch = msp.add_hatch(color=rng.randint(1, 7), dxfattribs={'layer': rng.choice(LAYERS)})
+        hatch.paths.add_polyline_path(polygon(rng, rng.randint(3, 12), rng.uniform(1, 20)), is_closed=True)
+
+
+def make_inserts(msp, rng: random.Random, count: int) -> None:
+    doc = msp.doc
+    for index in range(10):
+        block = doc.blocks.new(f'BLK{index}')
+        make_lines(block, rng, 10)
+        block.add_circle((0, 0), radius=rng.uniform(1, 5))
+        block.add_attdef('NUMBER', (0, 0), dxfattribs={'height': 0.5})
+    for index in range(count):
+        name = f'BLK{index % 10}'
+        if index % 5:
+            msp.add_blockref(name, random_point(rng), dxfattribs={
+                'layer': rng.choice(LAYERS),
+                'rotation': rng.uniform(0, 360),
+                'xscale': rng.uniform(0.5, 2),
+                'yscale': rng.uniform(0.5, 2),
+            })
+        else:
+            msp.add_auto_blockref(name, random_point(rng), {'NUMBER': str(index)})
+
+
+def make_texts(msp, rng: random.Random, count: int) -> None:
+    for index in range(count):
+        attribs = random_attribs(rng)
+        if index % 3:
+            attribs['height'] = rng.uniform(0.5, 5)
+            msp.add_text(f'TEXT {index} {rng.random()}', dxfattribs=attribs).set_pos(random_point(rng))
+        else:
+            attribs['char_height'] = rng.uniform(0.5, 5)
+            attribs['insert'] = random_point(rng)
+            msp.add_mtext(f'MTEXT {index}\\Pline two\\Pline three', dxfattribs=attribs)
+
+
+def make_meshes(msp, rng: random.Random, count: int) -> None:
+    for index in range(count):
+        if index % 2:
+            mesh = forms.cylinder(count=rng.randint(8, 24), radius=rng.uniform(1, 5))
+        else:
+            mesh = forms.cube()
+        x, y = random_point(rng)
+        matrix = Matrix44.chain(Matrix44.scale(rng.uniform(1, 10)), Matrix44.translate(x, y, 0))
+        mesh.render(msp, dxfattribs=random_attribs(rng), matrix=matrix)
+
+
+BENCHMARKS: Dict[str, Callable] = {
+    'lines': make_lines,
+    'polylines': make_polylines,
+    'splines': make_splines,
+    'hatches': make_hatches,
+    'inserts': make_inserts,
+    'texts': make_texts,
+    'meshes': make_meshes,
+}
+
+# Expensive entities are scaled down to keep the run time of all benchmarks in the same range:
+SCALE_FACTORS = {
+    'hatches': 0.5,
+    'meshes': 0.1,
+}
+
+
+def make_drawing(name: str, scale: int) -> str:
+    """ Returns the deterministic synthetic drawing of benchmark `name` as DXF string. """
+    rng = random.Random(SEED)
+    doc = ezdxf.new('R2018')
+    for layer in LAYERS:
+        doc.layers.new(layer)
+    count = max(int(scale * SCALE_FACTORS.get(name, 1.)), 1)
+    BENCHMARKS[name](doc.modelspace(), rng, count)
+    stream = StringIO()
+    doc.write(stream)
+    return stream.getvalue()
+
+
+def load(data: str):
+    return ezdxf.read(StringIO(data))
+
+
+def query(doc) -> int:
+    msp = doc.modelspace()
+    count = len(msp.query('*[layer=="WALLS" | layer=="DOORS"]'))
+    count += len(msp.query('LINE LWPOLYLINE SPLINE HATCH INSERT TEXT MTEXT MESH[layer ? "W.*" & color!=7]'))
+    count += sum(len(entities) for entities in msp.groupby(dxfattrib='layer').values())
+    return count
+
+
+def transform(doc) -> int:
+    m = Matrix44.chain(Matrix44.z_rotate(0.5), Matrix44.translate(10, 20, 0))
+    count = 0
+    for entity in doc.modelspace():
+        entity.transform(m)
+        count += 1
+    return count
+
+
+def render(doc) -> int:
+    backend = CountingBackend()
+    Frontend(RenderContext(doc), backend).draw_layout(doc.modelspace(), finalize=True)
+    return backend.count
+
+
+def save(doc) -> int:
+    stream = StringIO()
+    doc.write(stream)
+    return len(stream.getvalue())
+
+
+def run_operations(data: str) -> Dict[str, float]:
+    """ Returns the wall time of each operation for a single run. """
+    timings = dict()
+    t0 = time.perf_counter()
+    doc = load(data)
+    timings['load'] = time.perf_counter() - t0
+    for name, func in (('query', query), ('transform', transform), ('render', render), ('save', save)):
+        t0 = time.perf_counter()
+        func(doc)
+        timings[name] = time.perf_counter() - t0
+    return timings
+
+
+def peak_memory(data: str) -> Dict[str, int]:
+    """ Returns the peak of additional allocated memory for each operation in bytes, measured by :mod:`tracemalloc`
+    in a separated run, because tracing the memory allocation slows down the execution a lot.
+
+    """
+    result = dict()
+    tracemalloc.start()
+    doc = load(data)
+    result['load'] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    for name, func in (('query', query), ('transform', transform), ('render', render), ('save', save)):
+        tracemalloc.start()
+        func(doc)
+        result[name] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result
+
+
+def run_benchmark(name: str, scale: int, rounds: int, trace_memory: bool) -> Dict[str, Any]:
+    data = make_drawing(name, scale)
+    entities = len(load(data).modelspace())
+    best: Dict[str, float] = dict()
+    for _ in range(rounds):
+        for operation, seconds in run_operations(data).items():
+            best[operation] = min(seconds, best.get(operation, math.inf))
+    result = {
+        'entities': entities,
+        'file_size': len(data),
+        'operations': {
+            operation: {
+                'seconds': best[operation],
+                'entities_per_second': entities / best[operation] if best[operation] else 0.,
+            } for operation in OPERATIONS
+        },
+    }
+    if trace_memory:
+        for operation, size in peak_memory(data).items():
+            result['operations'][operation]['peak_memory'] = size
+    return result
+
+
+def run_suite(names: List[str], scale: int, rounds: int, trace_memory: bool) -> Dict[str, Any]:
+    return {
+        'ezdxf': ezdxf.__version__,
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'scale': scale,
+        'rounds': rounds,
+        'seed': SEED,
+        'benchmarks': {name: run_benchmark(name, scale, rounds, trace_memory) for name in names},
+    }
+
+
+def compare(new: Dict[str, Any], old: Dict[str, Any], threshold: float) -> int:
+    """ Prints the speed ratio of all common benchmarks and returns the count of regressions, a regression is a
+    ratio below ``1 - threshold``.
+
+    """
+    regressions = 0
+    print(f"Comparing ezdxf {new['ezdxf']} to ezdxf {old['ezdxf']}:")
+    for name, benchmark in new['benchmarks'].items():
+        old_benchmark = old['benchmarks'].get(name)
+        if old_benchmark is None:
+            continue
+        for operation, result in benchmark['operations'].items():
+            old_result = old_benchmark['operations'].get(operation)
+            if old_result is None or result['seconds'] == 0.:
+                continue
+            ratio = old_result['seconds'] / result['seconds']
+            flag = ''
+            if ratio < 1. - threshold:
+                flag = ' REGRESSION'
+                regressions += 1
+            print(f'{name:>10} {operation:>10}: {ratio:.2f}x{flag}')
+    return regressions
+
+
+def print_result(time, text):
+    print(f"Profiling: {text}; takes {time:.2f} seconds")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ezdxf benchmark suite based on synthetic drawings')
+    parser.add_argument('benchmarks', nargs='*', help=f"benchmarks to run: {', '.join(BENCHMARKS)}; default is all")
+    parser.add_argument('--scale', type=int, default=1000, help='count of entities per drawing, default is 1000')
+    parser.add_argument('--rounds', type=int, default=3, help='runs per benchmark, the best run counts')
+    parser.add_argument('--no-memory', action='store_true', help='do not measure peak memory')
+    parser.add_argument('--json', help='write results as JSON into this file')
+    parser.add_argument('--compare', help='compare results to a previous JSON file')
+    parser.add_argument('--threshold', type=float, default=0.1, help='tolerated slow down for --compare')
+    args = parser.parse_args()
+
+    names = args.benchmarks or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            parser.error(f'unknown benchmark: {name}')
+    result = run_suite(names, args.scale, args.rounds, trace_memory=not args.no_memory)
+    for name, benchmark in result['benchmarks'].items():
+        for operation, measurement in benchmark['operations'].items():
+            print_result(measurement['seconds'], f"{operation} {benchmark['entities']} entities of '{name}'")
+    if args.json:
+        with open(args.json, 'wt') as fp:
+            json.dump(result, fp, indent=2)
+    if args.compare:
+        with open(args.compare, 'rt') as fp:
+            old = json.load(fp)
+        if compare(result, old, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
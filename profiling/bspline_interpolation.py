@@ -5,7 +5,7 @@ import time
 import ezdxf
 from pathlib import Path
 import math
-from ezdxf.math import global_bspline_interpolation, BoundingBox, linspace, BSpline
+from ezdxf.math import global_bspline_interpolation, global_bspline_interpolation_batch, BoundingBox, linspace, BSpline
 from ezdxf.render import random_3d_path
 DIR = Path('~/Desktop/Outbox').expanduser()
 
@@ -15,6 +15,17 @@ def profile_bspline_interpolation(count, path):
         global_bspline_interpolation(path)
 
 
+def profile_bspline_interpolation_batch(count, paths):
+    for _ in range(count):
+        global_bspline_interpolation_batch(paths)
+
+
+def profile_bspline_interpolation_single(count, paths):
+    for _ in range(count):
+        for path in paths:
+            global_bspline_interpolation(path)
+
+
 def profile_vertex_calculation(count, spline, num):
     for _ in range(count):
         for t in linspace(0.0, spline.max_t, num):
@@ -47,3 +58,10 @@ profile('B-spline interpolation 300x: ', profile_bspline_interpolation, 300, pat
 
 spline = BSpline.from_fit_points(path, degree=3)
 profile('calculate 25x 1000 B-spline vertices: ', profile_vertex_calculation, 25, spline, 1000)
+
+big_path = list(random_3d_path(10000, max_step_size=10, max_heading=math.pi * 0.8))
+profile('B-spline interpolation 1x 10000 fit points: ', profile_bspline_interpolation, 1, big_path)
+
+paths = [list(random_3d_path(1000, max_step_size=10, max_heading=math.pi * 0.8)) for _ in range(50)]
+profile('B-spline interpolation 50 curves a 1000 fit points, single: ', profile_bspline_interpolation_single, 1, paths)
+profile('B-spline interpolation 50 curves a 1000 fit points, batch: ', profile_bspline_interpolation_batch, 1, paths)
@@ -0,0 +1,75 @@
+# Copyright (c) 2020 Manfred Moitzi
+# License: MIT License
+import sys
+import time
+from pathlib import Path
+from ezdxf.tools.binarydata import BitStream, EndOfBufferError
+from ezdxf.addons.dwg.crc import crc8, crc32
+from ezdxf.addons.dwg.const import SUPPORTED_VERSIONS
+
+ROOT = Path(__file__).parent.parent
+DWG_FILES = sorted(ROOT.glob('tests/**/*.dwg')) + sorted(ROOT.glob('docs/graphics/*.dwg'))
+ROUNDS = 20
+
+
+def decode_bit_stream(data: bytes) -> int:
+    # Decode the file data as arbitrary bit stream, the DWG files of unsupported versions are
+    # at least real world data.
+    bs = BitStream(data)
+    count = 0
+    try:
+        while True:
+            bs.read_bit_short()
+            bs.read_bit_long()
+            bs.read_bit_double()
+            bs.read_bit()
+            bs.read_unsigned_modular_chars()
+            bs.read_bits(13)
+            bs.read_unsigned_short()
+            bs.read_raw_double()
+            count += 8
+    except EndOfBufferError:
+        pass
+    return count
+
+
+def load_dwg(data: bytes) -> None:
+    from ezdxf.addons.dwg.loader import DwgDocument
+    doc = DwgDocument(data, crc_check=True)
+    doc.load()
+
+
+def main(files):
+    for filename in files:
+        data = Path(filename).read_bytes()
+        name = Path(filename).name
+        print(f'{name}: {len(data)} bytes')
+        t0 = time.perf_counter()
+        for _ in range(ROUNDS):
+            crc8(data)
+        print_result(time.perf_counter() - t0, f'{ROUNDS}x crc8 of {name}')
+
+        t0 = time.perf_counter()
+        for _ in range(ROUNDS):
+            crc32(data)
+        print_result(time.perf_counter() - t0, f'{ROUNDS}x crc32 of {name}')
+
+        t0 = time.perf_counter()
+        for _ in range(ROUNDS):
+            count = decode_bit_stream(data)
+        print_result(time.perf_counter() - t0, f'{ROUNDS}x decoding {count} values from bit stream of {name}')
+
+        if data[:6].decode(errors='ignore') in SUPPORTED_VERSIONS:
+            t0 = time.perf_counter()
+            for _ in range(ROUNDS):
+                load_dwg(data)
+            print_result(time.perf_counter() - t0, f'{ROUNDS}x loading DWG file {name}')
+
+
+def print_result(time, text):
+    print(f"Profiling: {text}; takes {time:.2f} seconds")
+
+
+if __name__ == '__main__':
+    # usage: dwg_bitstream.py [DWG files]
+    main(sys.argv[1:] or DWG_FILES)
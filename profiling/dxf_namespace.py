@@ -0,0 +1,67 @@
+# Copyright (c) 2020 Manfred Moitzi
+# License: MIT License
+import sys
+import time
+import tracemalloc
+import tempfile
+import os
+import ezdxf
+from ezdxf.tools.memory import entity_memory_usage
+
+
+def create_drawing(filename: str, count: int) -> None:
+    doc = ezdxf.new('R2010')
+    msp = doc.modelspace()
+    for index in range(count):
+        if index % 2:
+            msp.add_line((index, 0), (index, 1), dxfattribs={'layer': 'LINES', 'color': 1})
+        else:
+            msp.add_circle((index, 0), radius=1, dxfattribs={'layer': 'CIRCLES'})
+    doc.saveas(filename)
+
+
+def query(doc) -> int:
+    count = 0
+    for entity in doc.modelspace():
+        dxf = entity.dxf
+        if dxf.layer == 'LINES' and dxf.color == 1 and dxf.linetype == 'BYLAYER':
+            count += 1
+        if dxf.hasattr('lineweight'):
+            count += 1
+        count += int(dxf.get('thickness', 0) > 0)
+    return count
+
+
+def main(count: int, trace_memory: bool) -> None:
+    filename = os.path.join(tempfile.gettempdir(), 'ezdxf_dxf_namespace.dxf')
+    create_drawing(filename, count)
+    try:
+        t0 = time.perf_counter()
+        doc = ezdxf.readfile(filename)
+        print_result(time.perf_counter() - t0, f'loading {count} entities')
+
+        t0 = time.perf_counter()
+        query(doc)
+        print_result(time.perf_counter() - t0, f'querying {count} entities')
+
+        if trace_memory:  # tracing memory allocations slows down loading a lot
+            del doc
+            tracemalloc.start()
+            doc = ezdxf.readfile(filename)
+            memory, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f'Memory: loaded document with {count} entities requires {memory / 1024 / 1024:.1f} MB')
+            for dxftype, usage in sorted(entity_memory_usage(doc.entitydb.values()).items()):
+                print(f'Memory: {usage.count} {dxftype} entities require {usage.size_per_entity:.0f} bytes per entity')
+    finally:
+        os.remove(filename)
+
+
+def print_result(time, text):
+    print(f"Profiling: {text}; takes {time:.2f} seconds")
+
+
+if __name__ == '__main__':
+    # usage: dxf_namespace.py [count] [--memory]
+    args = [arg for arg in sys.argv[1:] if arg != '--memory']
+    main(int(args[0]) if args else 1_000_000, '--memory' in sys.argv)
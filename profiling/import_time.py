@@ -0,0 +1,33 @@
+# Copyright (c) 2020 Manfred Moitzi
+# License: MIT License
+import sys
+import subprocess
+import time
+
+STATEMENTS = [
+    ('import ezdxf', 'import ezdxf'),
+    ('import ezdxf; ezdxf.new()', 'import ezdxf and create new document'),
+    ('import ezdxf; ezdxf.new(setup=True)', 'import ezdxf and create new document with setup'),
+]
+
+
+def run(statement: str, count: int) -> float:
+    # the import time of ezdxf can only be measured in a new process
+    t0 = time.perf_counter()
+    for _ in range(count):
+        subprocess.run([sys.executable, '-c', statement], check=True)
+    return time.perf_counter() - t0
+
+
+def main(count):
+    base = run('pass', count)  # interpreter start up time
+    for statement, text in STATEMENTS:
+        print_result(run(statement, count) - base, f'{text} {count}x')
+
+
+def print_result(time, text):
+    print(f"Profiling: {text}; takes {time:.2f} seconds")
+
+
+if __name__ == '__main__':
+    main(20)
@@ -1,14 +1,23 @@
 # Copyright (c) 2020, Manfred Moitzi
 # License: MIT License
 import time
+import random
 
-from ezdxf.math import intersection_line_line_2d, ConstructionRay, Vec2
+from ezdxf.math import (
+    intersection_line_line_2d, ConstructionRay, Vec2, is_point_in_polygon_2d, points_in_polygon_2d,
+    intersections_segments_2d,
+)
+from ezdxf.render.forms import circle
 
 P1 = Vec2((0, 0))
 P2 = Vec2((10, 10))
 P3 = Vec2((0, 10))
 P4 = Vec2((10, 10))
 COUNT = 300000
+POLYGON = Vec2.list(circle(1000, radius=10))
+POINTS = [Vec2(random.uniform(-11, 11), random.uniform(-11, 11)) for _ in range(1000)]
+SEGMENTS1 = [(p, p + Vec2.from_deg_angle(random.uniform(0, 360), 1)) for p in POINTS]
+SEGMENTS2 = list(zip(POLYGON, POLYGON[1:]))
 
 
 def profile_construction_ray(count=COUNT):
@@ -30,6 +39,25 @@ def profile_intersection_line_line_xy(count=COUNT):
         intersection_line_line_2d(line1=(P1, P2), line2=(P3, P4))
 
 
+def profile_point_in_polygon():
+    for point in POINTS:
+        is_point_in_polygon_2d(point, POLYGON)
+
+
+def profile_points_in_polygon():
+    points_in_polygon_2d(POINTS, POLYGON)
+
+
+def profile_segment_intersections_brute_force():
+    for s1 in SEGMENTS1:
+        for s2 in SEGMENTS2:
+            intersection_line_line_2d(s1, s2, virtual=False)
+
+
+def profile_segment_intersections_sweep():
+    intersections_segments_2d(SEGMENTS1, SEGMENTS2)
+
+
 def profile(text, func):
     t0 = time.perf_counter()
     func()
@@ -40,3 +68,8 @@ def profile(text, func):
 profile('intersect ConstructionRay: ', profile_construction_ray)
 profile('intersect ConstructionRay init once: ', profile_construction_ray_init_once)
 profile('intersect line line xy: ', profile_intersection_line_line_xy)
+profile(f'{len(POINTS)} points in polygon of {len(POLYGON)} vertices: ', profile_point_in_polygon)
+profile(f'{len(POINTS)} points in polygon of {len(POLYGON)} vertices batched: ', profile_points_in_polygon)
+profile(f'segment intersections {len(SEGMENTS1)}x{len(SEGMENTS2)} brute force: ',
+        profile_segment_intersections_brute_force)
+profile(f'segment intersections {len(SEGMENTS1)}x{len(SEGMENTS2)} sweep: ', profile_segment_intersections_sweep)
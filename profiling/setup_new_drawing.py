@@ -1,4 +1,4 @@
-# Copyright (c) 2019 Manfred Moitzi
+# Copyright (c) 2019-2020 Manfred Moitzi
 # License: MIT License
 from timeit import Timer
 import ezdxf
@@ -18,6 +18,11 @@ def main(count):
     time2 = t.timeit(count)
     print_result(time2, f'setup {count} new style DXF')
 
+    ezdxf.options.use_document_templates = True
+    time3 = t.timeit(count)
+    print_result(time3, f'setup {count} new style DXF from templates')
+    ezdxf.options.use_document_templates = False
+
 
 def print_result(time, text):
     print(f"Profiling: {text}; takes {time:.2f} seconds")
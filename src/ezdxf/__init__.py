@@ -2,6 +2,8 @@
 # Copyright (C) 2011-2020, Manfred Moitzi
 # License: MIT License
 import sys
+import types
+import importlib
 from .version import version, __version__
 
 VERSION = __version__
@@ -15,11 +17,6 @@ from ezdxf.options import options
 from ezdxf.tools import transparency2float, float2transparency
 from ezdxf.tools.rgb import int2rgb, rgb2int
 from ezdxf.lldxf import const
-from ezdxf.lldxf.validator import is_dxf_file, is_dxf_stream
-from ezdxf.filemanagement import readzip, new, read, readfile, decode_base64
-from ezdxf.tools.standards import setup_linetypes, setup_styles, setup_dimstyles, setup_dimstyle
-from ezdxf.tools import pattern
-from ezdxf.render.arrows import ARROWS
 from ezdxf.lldxf.const import DXFError
 from ezdxf.lldxf.const import DXFStructureError, DXFVersionError, DXFTableEntryError, DXFAppDataError, DXFXDataError
 from ezdxf.lldxf.const import DXFAttributeError, DXFValueError, DXFKeyError, DXFIndexError, DXFTypeError, DXFInvalidLayerName
@@ -28,6 +25,45 @@ from ezdxf.lldxf.const import InsertUnits, ACI
 from ezdxf.lldxf.const import DXF12, DXF2000, DXF2004, DXF2007, DXF2010, DXF2013, DXF2018
 # name space imports - do not remove
 
+# Lazy name space imports: the heavy subsystems (entity classes, sections, layouts, pattern tables, arrow renderers
+# and standard styles) are imported at first usage of the name, key is the name, value is the source module,
+# if the name is the last part of the module name, the module itself is imported
+_LAZY_IMPORTS = {
+    'is_dxf_file': 'ezdxf.lldxf.validator',
+    'is_dxf_stream': 'ezdxf.lldxf.validator',
+    'readzip': 'ezdxf.filemanagement',
+    'new': 'ezdxf.filemanagement',
+    'read': 'ezdxf.filemanagement',
+    'readfile': 'ezdxf.filemanagement',
+    'decode_base64': 'ezdxf.filemanagement',
+    'clear_document_templates': 'ezdxf.filemanagement',
+    'setup_linetypes': 'ezdxf.tools.standards',
+    'setup_styles': 'ezdxf.tools.standards',
+    'setup_dimstyles': 'ezdxf.tools.standards',
+    'setup_dimstyle': 'ezdxf.tools.standards',
+    'pattern': 'ezdxf.tools.pattern',
+    'ARROWS': 'ezdxf.render.arrows',
+}
+
+
+class _LazyModule(types.ModuleType):
+    # Python 3.6 does not support the module level __getattr__() function
+    def __getattr__(self, name: str):
+        try:
+            module_name = _LAZY_IMPORTS[name]
+        except KeyError:
+            raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
+        module = importlib.import_module(module_name)
+        value = module if module_name.endswith('.' + name) else getattr(module, name)
+        setattr(self, name, value)  # __getattr__() is not called again for this name
+        return value
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(_LAZY_IMPORTS))
+
+
+sys.modules[__name__].__class__ = _LazyModule
+
 import codecs
 from ezdxf.lldxf.encoding import dxf_backslash_replace
 # setup DXF unicode encoder -> '\U+nnnn'
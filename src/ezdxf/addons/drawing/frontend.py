@@ -3,8 +3,9 @@
 # License: MIT License
 import copy
 import math
+import pickle
 from math import radians
-from typing import Iterable, cast, Union, List, Callable
+from typing import Iterable, cast, Union, List, Callable, Tuple, Optional
 
 from ezdxf.addons.drawing.backend import Backend
 from ezdxf.addons.drawing.properties import RenderContext, VIEWPORT_COLOR, Properties
@@ -15,12 +16,17 @@ from ezdxf.entities import (
 )
 from ezdxf.entities.dxfentity import DXFTagStorage
 from ezdxf.layouts import Layout
-from ezdxf.math import Vector, Z_AXIS, NULLVEC
+from ezdxf.math import Vector, Z_AXIS, NULLVEC, Matrix44
 from ezdxf.render import MeshBuilder, TraceBuilder, Path
+from ezdxf.render.hatching import hatch_line_segments, HatchLineDensityError
+from ezdxf.render.linetypes import LineTypeRenderer
 
 __all__ = ['Frontend']
 NEG_Z_AXIS = -Z_AXIS
 INFINITE_LINE_LENGTH = 25
+HATCH_CACHE_SIZE = 10000
+# boundary polygons and pattern line segments in WCS
+HatchGeometry = Tuple[List[List[Vector]], Optional[List[Tuple[Vector, Vector]]]]
 
 COMPOSITE_ENTITY_TYPES = {
     # Unsupported types, represented as DXFTagStorage(), will sorted out in Frontend.draw_entities().
@@ -66,6 +72,10 @@ class Frontend:
         # not used yet! Could be used for all curves CIRCLE, ARC, ELLIPSE and SPLINE
         # self.approximation_max_sagitta = 0.01  # for drawing unit = 1m, max sagitta = 1cm
 
+        # Split lines and curves into dashes and draw the text elements of complex linetypes,
+        # backends get only continuous lines, points and text.
+        self.linetype_rendering = True
+
     def skip_entity(self, msg: str):
         print(msg)
 
@@ -126,18 +136,61 @@ class Frontend:
         d, dxftype = entity.dxf, entity.dxftype()
         properties = self._resolve_properties(entity)
         if dxftype == 'LINE':
-            self.out.draw_line(d.start, d.end, properties)
+            self._draw_line(d.start, d.end, properties)
 
         elif dxftype in ('XLINE', 'RAY'):
             start = d.start
             delta = Vector(d.unit_vector.x, d.unit_vector.y, 0) * INFINITE_LINE_LENGTH
             if dxftype == 'XLINE':
-                self.out.draw_line(start - delta / 2, start + delta / 2, properties)
+                self._draw_line(start - delta / 2, start + delta / 2, properties)
             elif dxftype == 'RAY':
-                self.out.draw_line(start, start + delta, properties)
+                self._draw_line(start, start + delta, properties)
         else:
             raise TypeError(dxftype)
 
+    def _linetype_renderer(self, properties: Properties) -> Optional[LineTypeRenderer]:
+        if not self.linetype_rendering:
+            return None
+        renderer = self.ctx.linetype_renderer(properties)
+        if renderer is None or renderer.is_continuous:
+            return None
+        return renderer
+
+    def _draw_line(self, start: Vector, end: Vector, properties: Properties) -> None:
+        renderer = self._linetype_renderer(properties)
+        if renderer is None:
+            self.out.draw_line(start, end, properties)
+        else:
+            self._draw_dashes(renderer, [start, end], properties)
+
+    def _draw_path(self, path: Path, properties: Properties) -> None:
+        renderer = self._linetype_renderer(properties)
+        if renderer is None:
+            self.out.draw_path(path, properties)
+        elif len(path):
+            vertices = path.approximate(segments=self.out.bezier_approximation_count)
+            self._draw_dashes(renderer, vertices, properties)
+
+    def _draw_dashes(self, renderer: LineTypeRenderer, vertices: Iterable[Vector], properties: Properties) -> None:
+        vertices = list(vertices)
+        out = self.out
+        for dash in renderer.line_dashes(vertices):
+            count = len(dash)
+            if count == 1:  # dot
+                out.draw_point(dash[0], properties)
+            elif count == 2:
+                out.draw_line(dash[0], dash[1], properties)
+            else:
+                out.draw_path(Path.from_vertices(dash), properties)
+
+        for text, location, direction in renderer.line_decorations(vertices):
+            insert = location + direction * text.x + direction.orthogonal() * text.y
+            angle = text.rotation
+            if not text.absolute_rotation:
+                angle += direction.angle
+            transform = Matrix44.z_rotate(angle) @ Matrix44.translate(insert.x, insert.y, insert.z)
+            out.draw_text(text.text, transform, properties, text.height)
+
     def _resolve_properties(self, entity: DXFGraphic) -> Properties:
         properties = self.ctx.resolve_all(entity)
         if self.visibility_filter:  # override visibility by callback
@@ -182,12 +235,12 @@ class Frontend:
             path = Path.from_ellipse(cast('Ellipse', entity))
         else:  # API usage error
             raise TypeError(dxftype)
-        self.out.draw_path(path, properties)
+        self._draw_path(path, properties)
 
     def draw_spline_entity(self, entity: DXFGraphic) -> None:
         properties = self._resolve_properties(entity)
         path = Path.from_spline(cast(Spline, entity))
-        self.out.draw_path(path, properties)
+        self._draw_path(path, properties)
 
     def draw_point_entity(self, entity: DXFGraphic) -> None:
         properties = self._resolve_properties(entity)
@@ -203,43 +256,93 @@ class Frontend:
             ocs = entity.ocs()
             points = list(ocs.points_to_wcs(points))
         if dxftype == '3DFACE':
-            self.out.draw_path(Path.from_vertices(points, close=True), properties)
+            self._draw_path(Path.from_vertices(points, close=True), properties)
         else:  # SOLID, TRACE
             self.out.draw_filled_polygon(points, properties)
 
     def draw_hatch_entity(self, entity: DXFGraphic) -> None:
         properties = self._resolve_properties(entity)
-        entity = cast(Hatch, entity)
-        ocs = entity.ocs()
+        polygons, segments = self._hatch_geometry(cast(Hatch, entity))
+        if segments is None:  # solid fill or pattern too dense
+            for vertices in polygons:
+                self.out.draw_filled_polygon(vertices, properties)
+        else:
+            for start, end in segments:
+                if start is end:  # dot
+                    self.out.draw_point(start, properties)
+                else:
+                    self.out.draw_line(start, end, properties)
+
+    def _hatch_geometry(self, hatch: Hatch) -> HatchGeometry:
+        """ Returns the boundary polygons and the pattern line segments of `hatch` in WCS, segments is ``None``
+        for solid filled hatches. The result is cached in the render context, the key is the serialized hatch
+        geometry, which detects all modifications of the boundary paths, also by modifying the paths and edges
+        directly, and works for virtual entities without handle.
+        """
+        dxf = hatch.dxf
+        pattern_lines = [] if hatch.pattern is None else hatch.pattern.as_list()
+        key = pickle.dumps(
+            (dxf.solid_fill, dxf.hatch_style, dxf.elevation, dxf.extrusion, pattern_lines, hatch.paths),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        cache = self.ctx.hatch_cache
+        geometry = cache.get(key)
+        if geometry is None:
+            geometry = self._build_hatch_geometry(hatch, pattern_lines)
+            if len(cache) >= HATCH_CACHE_SIZE:
+                cache.clear()
+            cache[key] = geometry
+        return geometry
+
+    def _build_hatch_geometry(self, hatch: Hatch, pattern_lines: List) -> HatchGeometry:
+        ocs = hatch.ocs()
         # all OCS coordinates have the same z-axis stored as vector (0, 0, z), default (0, 0, 0)
-        elevation = entity.dxf.elevation.z
-        paths = copy.deepcopy(entity.paths)
+        elevation = hatch.dxf.elevation.z
+        paths = copy.deepcopy(hatch.paths)
         paths.polyline_to_edge_path(just_with_bulge=False)
 
         # For hatches, the approximation don't have to be that precise.
         paths.all_to_line_edges(num=64, spline_factor=8)
+        polygons = []
+        wcs_polygons = []
         for p in paths:
             assert p.PATH_TYPE == 'EdgePath'
-            vertices = []
+            polygon = []
             last_vertex = None
             for e in p.edges:
                 assert e.EDGE_TYPE == 'LineEdge'
-                start, end = ocs.points_to_wcs([
-                    Vector(e.start[0], e.start[1], elevation),
-                    Vector(e.end[0], e.end[1], elevation),
-                ])
+                start = Vector(e.start[0], e.start[1], elevation)
+                end = Vector(e.end[0], e.end[1], elevation)
                 if last_vertex is None:
-                    vertices.append(start)
+                    polygon.append(start)
                 elif not last_vertex.isclose(start):
-                    print(f'warning: {str(entity)} edges not contiguous: {last_vertex} -> {start}')
-                    vertices.append(start)
-                vertices.append(end)
+                    print(f'warning: {str(hatch)} edges not contiguous: {last_vertex} -> {start}')
+                    polygon.append(start)
+                polygon.append(end)
                 last_vertex = end
 
-            if vertices:
-                if last_vertex.isclose(vertices[0]):
-                    vertices.append(last_vertex)
-                self.out.draw_filled_polygon(vertices, properties)
+            if polygon:
+                polygons.append(polygon)
+                vertices = list(ocs.points_to_wcs(polygon))
+                if last_vertex.isclose(polygon[0]):
+                    vertices.append(vertices[-1])
+                wcs_polygons.append(vertices)
+
+        if hatch.dxf.solid_fill or not pattern_lines:
+            return wcs_polygons, None
+        try:
+            segments = hatch_line_segments(polygons, pattern_lines, hatch_style=hatch.dxf.hatch_style)
+        except HatchLineDensityError:
+            print(f'warning: {str(hatch)} pattern too dense, drawing solid fill')
+            return wcs_polygons, None
+
+        wcs_segments = []
+        to_wcs = ocs.to_wcs
+        for start, end in segments:
+            wcs_start = to_wcs(Vector(start.x, start.y, elevation))
+            wcs_end = wcs_start if start == end else to_wcs(Vector(end.x, end.y, elevation))
+            wcs_segments.append((wcs_start, wcs_end))
+        return wcs_polygons, wcs_segments
 
     def draw_viewport_entity(self, entity: DXFGraphic) -> None:
         assert entity.dxftype() == 'VIEWPORT'
@@ -271,7 +374,7 @@ class Frontend:
 
     def draw_mesh_builder_entity(self, builder: MeshBuilder, properties: Properties) -> None:
         for face in builder.faces_as_vertices():
-            self.out.draw_path(Path.from_vertices(face, close=True), properties=properties)
+            self._draw_path(Path.from_vertices(face, close=True), properties)
 
     def draw_polyline_entity(self, entity: DXFGraphic):
         dxftype = entity.dxftype()
@@ -309,7 +412,7 @@ class Frontend:
             return
 
         path = Path.from_lwpolyline(entity) if is_lwpolyline else Path.from_polyline(entity)
-        self.out.draw_path(path, properties)
+        self._draw_path(path, properties)
 
     def draw_composite_entity(self, entity: DXFGraphic) -> None:
         def set_opaque(entity):
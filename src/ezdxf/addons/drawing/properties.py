@@ -2,8 +2,9 @@
 # Copyright (c) 2020, Matthew Broadway
 # Copyright (c) 2020, Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING, Dict, Optional, Tuple, Union, List, Iterable, Sequence, Set
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Union, List, Iterable, Sequence, Set, NamedTuple
 from ezdxf.lldxf import const
+from ezdxf.render.linetypes import LineTypeRenderer
 from ezdxf.addons.drawing.type_hints import Color, RGB
 from ezdxf.addons import acadctb
 from ezdxf.sections.table import table_key as layer_key
@@ -15,7 +16,7 @@ if TYPE_CHECKING:
 
 __all__ = [
     'Properties', 'LayerProperties', 'RenderContext', 'layer_key', 'rgb_to_hex', 'hex_to_rgb',
-    'MODEL_SPACE_BG_COLOR', 'PAPER_SPACE_BG_COLOR', 'VIEWPORT_COLOR', 'CONTINUOUS_PATTERN',
+    'MODEL_SPACE_BG_COLOR', 'PAPER_SPACE_BG_COLOR', 'VIEWPORT_COLOR', 'CONTINUOUS_PATTERN', 'LinetypeText',
 ]
 
 MODEL_SPACE_BG_COLOR = '#212830'
@@ -24,6 +25,19 @@ VIEWPORT_COLOR = '#aaaaaa'  # arbitrary choice
 CONTINUOUS_PATTERN = tuple()
 
 
+class LinetypeText(NamedTuple):
+    """ Text element of a complex linetype, placed along the line by the :class:`LineTypeRenderer`. """
+    text: str
+    height: float
+    rotation: float  # in radians
+    x: float  # offset along the line direction
+    y: float  # offset perpendicular to the line direction
+    absolute_rotation: bool
+
+    def scale(self, factor: float) -> 'LinetypeText':
+        return self._replace(height=self.height * factor, x=self.x * factor, y=self.y * factor)
+
+
 def is_dark_color(color: Color) -> bool:
     luma = luminance(hex_to_rgb(color))
     return luma <= 0.2
@@ -41,8 +55,8 @@ class Properties:
         # but have some predefined linetypes, maybe matching most common AutoCAD linetypes is possible
         self.linetype_name: str = 'CONTINUOUS'  # default linetype - store in UPPERCASE
 
-        # Linetypes: Complex DXF linetypes are not supported:
-        # 1. Don't know if there are any backends which can use linetypes including text or shapes
+        # Linetypes: Complex DXF linetypes are only partially supported:
+        # 1. Text elements are rendered by the frontend, see RenderContext.linetype_renderer()
         # 2. No decoder for SHX files available, which are the source for shapes in linetypes
         # 3. SHX files are copyrighted - including in ezdxf not possible
         #
@@ -140,6 +154,10 @@ class RenderContext:
     def __init__(self, doc: Optional['Drawing'] = None, ctb: str = ''):
         self._saved_states: List[Properties] = []
         self.line_pattern = _load_line_pattern(doc.linetypes) if doc else dict()
+        # text elements of complex linetypes, key is the upper case linetype name
+        self.linetype_texts = _load_linetype_texts(doc.linetypes) if doc else dict()
+        # dash engines for (linetype name, pattern, effective linetype scale)
+        self._linetype_renderers: Dict[Tuple[str, Tuple[float, ...], float], LineTypeRenderer] = dict()
         self.current_layout = LayoutProperties()  # default is 'Model'
         self.current_block: Optional[Properties] = None
         self.plot_styles = self._load_plot_style_table(ctb)
@@ -148,6 +166,8 @@ class RenderContext:
         self.layers: Dict[str, LayerProperties] = dict()
         self.units = 0  # store modelspace units as enum, see ezdxf/units.py
         self.linetype_scale: float = 1.0  # overall modelspace linetype scaling
+        # computed HATCH geometry, managed by the Frontend class
+        self.hatch_cache: Dict[bytes, Tuple] = dict()
         if doc:
             for layer in doc.layers:  # type: Layer
                 self.add_layer(layer)
@@ -346,6 +366,25 @@ class RenderContext:
             pattern = self.line_pattern.get(name, CONTINUOUS_PATTERN)
         return name, pattern
 
+    def linetype_renderer(self, properties: Properties) -> Optional[LineTypeRenderer]:
+        """ Returns the dash engine for the resolved linetype `properties`, scaled by the effective linetype
+        scaling, returns ``None`` for continuous lines.
+        """
+        pattern = properties.linetype_pattern
+        if len(pattern) < 2:
+            return None
+        scale = self.linetype_scale * properties.linetype_scale
+        key = (properties.linetype_name, pattern, scale)
+        renderer = self._linetype_renderers.get(key)
+        if renderer is None:
+            texts = self.linetype_texts.get(properties.linetype_name, [])
+            renderer = LineTypeRenderer(
+                [e * scale for e in pattern],
+                [(location * scale, text.scale(scale)) for location, text in texts],
+            )
+            self._linetype_renderers[key] = renderer
+        return renderer
+
     def resolve_lineweight(self, entity: 'DXFGraphic'):
         # Line weight in mm times 100 (e.g. 0.13mm = 13).
         # Smallest line weight is 0 and biggest line weight is 211
@@ -442,12 +481,57 @@ def _merge_dashes(elements: Sequence[float]) -> Iterable[float]:
     yield buffer
 
 
+def _load_linetype_texts(linetypes: 'Table') -> Dict[str, List[Tuple[float, LinetypeText]]]:
+    """ Load the text elements of complex linetypes defined in a DXF document as dictionary,
+    key is the upper case linetype name, value is a list of (location, LinetypeText) tuples,
+    the location is the distance from the start of the simplified line pattern.
+    """
+    texts = dict()
+    for linetype in linetypes:  # type: Linetype
+        pattern = linetype.pattern_tags
+        if pattern.is_complex_type():
+            elements = _compile_line_pattern_texts(pattern)
+            if elements:
+                texts[linetype.dxf.name.upper()] = elements
+    return texts
+
+
+def _compile_line_pattern_texts(pattern: 'LinetypePattern') -> List[Tuple[float, LinetypeText]]:
+    total_length = 0.0
+    location = 0.0
+    elements = []
+    texts = []
+    params = None
+    for code, value in pattern.tags:
+        if code == 40:
+            total_length = value
+        elif code == 49:
+            elements.append(value)
+            location += abs(value)
+            params = None
+        elif code == 74:
+            # a text or shape is placed at the end of the preceding dash or gap
+            params = {74: value, 46: 1.0, 50: 0.0, 44: 0.0, 45: 0.0, 'location': location}
+        elif params is not None:
+            params[code] = value
+            if code == 9 and params[74] & 2:  # text
+                texts.append(params)
+    if len(elements) < 2 or total_length <= 0.0:
+        return []
+    # compile_line_pattern() moves a leading gap to the end of the pattern
+    first = next(_merge_dashes(elements))
+    shift = -first if first < 0 else 0.0
+    pattern_length = max(total_length, sum(abs(e) for e in elements))
+    return [
+        ((p['location'] - shift) % pattern_length, LinetypeText(
+            text=p[9], height=p[46], rotation=p[50], x=p[44], y=p[45], absolute_rotation=bool(p[74] & 1),
+        )) for p in texts
+    ]
+
+
 def _compile_line_pattern_from_tags(pattern: 'LinetypePattern') -> Tuple[float, ...]:
     """ Returns simplified dash-gap-dash... line pattern and dash is 0 for a point. """
-    # complex line types with text and shapes are not supported
-    if pattern.is_complex_type():
-        return CONTINUOUS_PATTERN
-
+    # text and shapes of complex line types are not part of the simplified line pattern
     pattern_length = 0.0
     elements = []
     for tag in pattern.tags:
@@ -469,7 +553,10 @@ def compile_line_pattern(total_length: float, elements: Sequence[float]) -> Tupl
 
     sum_elements = sum(abs(e) for e in elements)
     if total_length > sum_elements:  # append a gap
-        elements.append(sum_elements - total_length)
+        if elements[-1] < 0:  # extend last gap
+            elements[-1] += sum_elements - total_length
+        else:
+            elements.append(sum_elements - total_length)
 
     if elements[0] < 0:  # start with a gap
         e = elements.pop(0)
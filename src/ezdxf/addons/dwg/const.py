@@ -41,5 +41,13 @@ class DwgCorruptedHeaderSection(DwgError):
     pass
 
 
+class DwgCorruptedObjectMap(DwgError):
+    pass
+
+
+class DwgCorruptedObject(DwgError):
+    pass
+
+
 class CRCError(DwgError):
     pass
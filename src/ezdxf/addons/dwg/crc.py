@@ -1,6 +1,9 @@
 # Copyright (c) 2020, Manfred Moitzi
 # License: MIT License
-from typing import Union
+from typing import Optional
+from array import array
+import sys
+import zlib
 
 __all__ = ['crc8', 'crc32']
 
@@ -8,18 +11,44 @@ from .const import Bytes
 
 
 def crc8(data: Bytes, seed: int = 0) -> int:
+    # The DWG "CRC8" is a 16 bit CRC (CRC-16/ARC), process 2 bytes per step by a table for all
+    # 16 bit words, the CRC value is replaced completely by each step.
+    table = CRC8_TABLE
+    size = len(data)
+    if size >= 64:
+        words = array('H', bytes(data[:size & ~1]))
+        if sys.byteorder == 'big':
+            words.byteswap()
+        word_table = _crc8_word_table()
+        for word in words:
+            seed = word_table[seed ^ word]
+        if size & 1:
+            byte = data[-1]
+            seed = (seed >> 8) ^ table[(seed ^ byte) & 0xFF]
+        return seed
+
     for byte in data:
-        index = byte ^ (seed & 0xFF)
-        seed = (seed >> 8) & 0xFF
-        seed ^= CRC8_TABLE[index & 0xFF]
+        seed = (seed >> 8) ^ table[(seed ^ byte) & 0xFF]
     return seed
 
 
 def crc32(data: Bytes, seed: int = 0) -> int:
-    inverted_crc = ~seed
-    for byte in data:
-        inverted_crc = (inverted_crc >> 8) ^ CRC32_TABLE[(inverted_crc ^ byte) & 0xff]
-    return ~inverted_crc
+    # The DWG CRC32 is the standard CRC-32 implemented by zlib.
+    return zlib.crc32(data, seed)
+
+
+_CRC8_WORD_TABLE: Optional[array] = None
+
+
+def _crc8_word_table() -> array:
+    global _CRC8_WORD_TABLE
+    if _CRC8_WORD_TABLE is None:
+        table = CRC8_TABLE
+        _CRC8_WORD_TABLE = array('H', (
+            (table[word & 0xFF] >> 8) ^ table[((word >> 8) ^ table[word & 0xFF]) & 0xFF]
+            for word in range(0x10000)
+        ))
+    return _CRC8_WORD_TABLE
 
 
 # Source: Open Design Specification for .dwg
@@ -1,7 +1,8 @@
 # Copyright (c) 2020, Manfred Moitzi
 # License: MIT License
 # Created: 2020-04-01
-from typing import Dict
+from typing import Dict, Iterable, List
+from concurrent.futures import ProcessPoolExecutor
 
 from ezdxf.drawing import Drawing
 from ezdxf.tools import codepage
@@ -18,6 +19,10 @@ from .const import *
 from .fileheader import FileHeader
 from .header_section import load_header_section
 from .classes_section import load_classes_section
+from .objects_section import (
+    load_objects_section, object_record, object_type, decode_object, decode_object_records, DwgObject, ObjectTypes,
+    OBJECT_TYPES, ENTMODE_MODELSPACE,
+)
 
 __all__ = ['readfile', 'load']
 
@@ -41,6 +46,12 @@ class DwgDocument:
         self.doc: Drawing = self._setup_doc()
         # Store DXF object types by class number:
         self.dxf_object_types: Dict[int, str] = dict()
+        # Store (DXF type, is an entity) tuples by object type number, including class numbers:
+        self.object_types: ObjectTypes = dict(OBJECT_TYPES)
+        # Store file location of objects by handle:
+        self.object_map: Dict[int, int] = dict()
+        # Cache of decoded objects by handle:
+        self._objects: Dict[int, DwgObject] = dict()
 
     def _setup_doc(self) -> Drawing:
         doc = Drawing(dxfversion=self.specs.version)
@@ -79,9 +90,79 @@ class DwgDocument:
         for class_num, dxfclass in cls_section.load_classes():
             self.doc.classes.register(dxfclass)
             self.dxf_object_types[class_num] = dxfclass.dxf.name
+            self.object_types[class_num] = (dxfclass.dxf.name, bool(dxfclass.dxf.is_an_entity))
 
     def load_objects(self) -> None:
-        pass
+        # Load only the object map, objects are decoded on demand by handle.
+        objects_section = load_objects_section(self.specs, self.data, self.crc_check)
+        self.object_map = objects_section.load_object_map()
+        self._objects.clear()
+
+    def get_object(self, handle: int) -> DwgObject:
+        """ Returns object `handle`, decodes the object at the first access. """
+        try:
+            return self._objects[handle]
+        except KeyError:
+            pass
+        obj = decode_object(
+            handle, self.object_record(handle), self.specs.version, self.specs.encoding, self.object_types,
+            self.crc_check,
+        )
+        self._objects[handle] = obj
+        return obj
+
+    def object_record(self, handle: int) -> Bytes:
+        """ Returns the raw object record of object `handle`. """
+        try:
+            location = self.object_map[handle]
+        except KeyError:
+            raise DwgError(f'Object #{handle:X} does not exist.')
+        return object_record(self.data, location)
+
+    def is_entity(self, handle: int) -> bool:
+        """ Returns ``True`` if object `handle` is a graphical entity, reads just the object type number of not yet
+        decoded objects.
+        """
+        try:
+            return self._objects[handle].is_entity
+        except KeyError:
+            pass
+        type_ = object_type(self.object_record(handle))
+        try:
+            return self.object_types[type_][1]
+        except KeyError:
+            raise DwgCorruptedObject(f'Unknown object type {type_} of object #{handle:X}.')
+
+    def get_objects(self, handles: Iterable[int], workers: int = 1) -> List[DwgObject]:
+        """ Returns the objects `handles`, decodes not yet decoded objects by `workers` processes at once, each
+        object record is independent from all other objects.
+        """
+        handles = list(handles)
+        cache = self._objects
+        missing = [handle for handle in dict.fromkeys(handles) if handle not in cache]
+        if workers > 1 and len(missing) > workers:
+            records = [(handle, bytes(self.object_record(handle))) for handle in missing]
+            chunk_size = -(-len(records) // workers)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        decode_object_records, records[start: start + chunk_size], self.specs.version,
+                        self.specs.encoding, self.object_types, self.crc_check,
+                    )
+                    for start in range(0, len(records), chunk_size)
+                ]
+                for future in futures:
+                    for obj in future.result():
+                        cache[obj.handle] = obj
+        return [self.get_object(handle) for handle in handles]
+
+    def layout_entities(self, entmode: int = ENTMODE_MODELSPACE, workers: int = 1) -> List[DwgObject]:
+        """ Returns all entities of modelspace for `entmode` is ``ENTMODE_MODELSPACE`` or of the active paperspace
+        for `entmode` is ``ENTMODE_PAPERSPACE``, decodes just the entity headers by `workers` processes at once.
+        Non-graphical objects are skipped by their object type number and are neither decoded nor cached.
+        """
+        entities = [handle for handle in self.object_map if self.is_entity(handle)]
+        return [obj for obj in self.get_objects(entities, workers) if obj.entmode == entmode]
 
     def store_objects(self) -> None:
         pass
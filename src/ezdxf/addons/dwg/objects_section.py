@@ -0,0 +1,250 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+from typing import Dict, Iterable, List, Tuple, NamedTuple
+import struct
+
+from ezdxf.tools.binarydata import BitStream
+
+from .const import *
+from .crc import crc8
+from .fileheader import FileHeader
+from .header_section import DwgSectionLoader
+
+__all__ = [
+    'load_objects_section', 'DwgObject', 'ObjectTypes', 'OBJECT_TYPES', 'ENTMODE_BLOCK', 'ENTMODE_PAPERSPACE',
+    'ENTMODE_MODELSPACE', 'ENTMODE_NONE', 'object_record', 'object_type', 'decode_object', 'decode_object_records',
+]
+
+# Entity mode, stored in the common entity data:
+ENTMODE_BLOCK = 0  # entity of a block definition, owner handle is stored in the handle stream
+ENTMODE_PAPERSPACE = 1
+ENTMODE_MODELSPACE = 2
+ENTMODE_NONE = -1  # not a graphical entity
+
+# Object type numbers to (DXF type, is an entity) tuples, type numbers >= 500 are class numbers,
+# defined in the CLASSES section.
+ObjectTypes = Dict[int, Tuple[str, bool]]
+
+OBJECT_TYPES: ObjectTypes = {
+    0x01: ('TEXT', True),
+    0x02: ('ATTRIB', True),
+    0x03: ('ATTDEF', True),
+    0x04: ('BLOCK', True),
+    0x05: ('ENDBLK', True),
+    0x06: ('SEQEND', True),
+    0x07: ('INSERT', True),
+    0x08: ('INSERT', True),  # MINSERT
+    0x0A: ('VERTEX', True),  # 2D
+    0x0B: ('VERTEX', True),  # 3D
+    0x0C: ('VERTEX', True),  # MESH
+    0x0D: ('VERTEX', True),  # PFACE
+    0x0E: ('VERTEX', True),  # PFACE FACE
+    0x0F: ('POLYLINE', True),  # 2D
+    0x10: ('POLYLINE', True),  # 3D
+    0x11: ('ARC', True),
+    0x12: ('CIRCLE', True),
+    0x13: ('LINE', True),
+    0x14: ('DIMENSION', True),  # ORDINATE
+    0x15: ('DIMENSION', True),  # LINEAR
+    0x16: ('DIMENSION', True),  # ALIGNED
+    0x17: ('DIMENSION', True),  # ANG 3-Pt
+    0x18: ('DIMENSION', True),  # ANG 2-Ln
+    0x19: ('DIMENSION', True),  # RADIUS
+    0x1A: ('DIMENSION', True),  # DIAMETER
+    0x1B: ('POINT', True),
+    0x1C: ('3DFACE', True),
+    0x1D: ('POLYLINE', True),  # PFACE
+    0x1E: ('POLYLINE', True),  # MESH
+    0x1F: ('SOLID', True),
+    0x20: ('TRACE', True),
+    0x21: ('SHAPE', True),
+    0x22: ('VIEWPORT', True),
+    0x23: ('ELLIPSE', True),
+    0x24: ('SPLINE', True),
+    0x25: ('REGION', True),
+    0x26: ('3DSOLID', True),
+    0x27: ('BODY', True),
+    0x28: ('RAY', True),
+    0x29: ('XLINE', True),
+    0x2A: ('DICTIONARY', False),
+    0x2C: ('MTEXT', True),
+    0x2D: ('LEADER', True),
+    0x2E: ('TOLERANCE', True),
+    0x2F: ('MLINE', True),
+    0x30: ('BLOCK_CONTROL', False),
+    0x31: ('BLOCK_RECORD', False),
+    0x32: ('LAYER_CONTROL', False),
+    0x33: ('LAYER', False),
+    0x34: ('STYLE_CONTROL', False),
+    0x35: ('STYLE', False),
+    0x38: ('LTYPE_CONTROL', False),
+    0x39: ('LTYPE', False),
+    0x3C: ('VIEW_CONTROL', False),
+    0x3D: ('VIEW', False),
+    0x3E: ('UCS_CONTROL', False),
+    0x3F: ('UCS', False),
+    0x40: ('VPORT_CONTROL', False),
+    0x41: ('VPORT', False),
+    0x42: ('APPID_CONTROL', False),
+    0x43: ('APPID', False),
+    0x44: ('DIMSTYLE_CONTROL', False),
+    0x45: ('DIMSTYLE', False),
+    0x46: ('VP_ENT_HDR_CONTROL', False),
+    0x47: ('VP_ENT_HDR', False),
+    0x48: ('GROUP', False),
+    0x49: ('MLINESTYLE', False),
+    0x4A: ('OLE2FRAME', True),
+    0x4C: ('LONG_TRANSACTION', False),
+    0x4D: ('LWPOLYLINE', True),
+    0x4E: ('HATCH', True),
+    0x4F: ('XRECORD', False),
+    0x50: ('ACDBPLACEHOLDER', False),
+    0x51: ('VBA_PROJECT', False),
+    0x52: ('LAYOUT', False),
+}
+
+
+def load_objects_section(specs: FileHeader, data: Bytes, crc_check=False):
+    if specs.version <= ACAD_2000:
+        return DwgObjectsSectionR2000(specs, data, crc_check)
+    else:
+        return DwgObjectsSectionR2004(specs, data, crc_check)
+
+
+class DwgObjectsSectionR2000(DwgSectionLoader):
+    def load_data_section(self, data: Bytes) -> Bytes:
+        if self.specs.version > ACAD_2000:
+            raise DwgVersionError(self.specs.version)
+        seeker, section_size = self.specs.sections[OBJECTS_ID]
+        return data[seeker:seeker + section_size]
+
+    def load_object_map(self) -> Dict[int, int]:
+        """ Returns the object map as dict, key is the object handle as int and value is the file location of the
+        object.
+
+        The object map is divided into sections of max. 2032 bytes, each section starts with the section size as
+        big endian unsigned short, followed by (handle offset, location offset) pairs as modular chars, the offsets
+        are relative to the previous pair, starting with 0 for each section. Each section ends with a big endian
+        CRC. The last section is empty and has a size of 2 bytes.
+
+        """
+        data = self.data
+        object_map = dict()
+        index = 0
+        while index + 2 <= len(data):
+            section_size = struct.unpack_from('>H', data, index)[0]
+            if section_size <= 2:  # last section is empty
+                break
+            end_index = index + section_size
+            if end_index + 2 > len(data):
+                raise DwgCorruptedObjectMap('Object map section exceeds section data.')
+            bs = BitStream(data[index + 2: end_index])
+            end_bit_index = (section_size - 2) << 3
+            handle = 0
+            location = 0
+            while bs.bit_index < end_bit_index:
+                handle += bs.read_unsigned_modular_chars()
+                location += bs.read_signed_modular_chars()
+                object_map[handle] = location
+            if self.crc_check:
+                check = struct.unpack_from('>H', data, end_index)[0]
+                # CRC of section data including the section size
+                crc = crc8(data[index: end_index], seed=0xc0c1)
+                if check != crc:
+                    raise CRCError('CRC error in object map.')
+            index = end_index + 2
+        return object_map
+
+
+class DwgObjectsSectionR2004(DwgObjectsSectionR2000):
+    def load_data_section(self, data: Bytes) -> Bytes:
+        # compressed and encrypted sections of DWG R2004+ are not supported yet
+        raise DwgVersionError(self.specs.version)
+
+
+class DwgObject(NamedTuple):
+    """ Object header decoded from the DWG file, the object specific data is not decoded yet. """
+    handle: int
+    type: int  # object type number
+    dxftype: str
+    entmode: int  # ENTMODE_BLOCK, ENTMODE_PAPERSPACE, ENTMODE_MODELSPACE or ENTMODE_NONE for non-graphical objects
+    data: bytes  # object data as bit stream, without the leading object size and the trailing CRC
+
+    @property
+    def is_entity(self) -> bool:
+        return self.entmode != ENTMODE_NONE
+
+
+def object_record(data: Bytes, location: int) -> Bytes:
+    """ Returns the raw object data at file `location` including the leading object size and the trailing CRC,
+    each object record is independent from all other objects and can be decoded by :func:`decode_object`.
+
+    """
+    bs = BitStream(data[location: location + 4])
+    size = bs.read_modular_shorts()
+    return data[location: location + (bs.bit_index >> 3) + size + 2]
+
+
+def object_type(record: Bytes) -> int:
+    """ Returns the object type number of the object `record`, returned by :func:`object_record`, without decoding
+    the common object data.
+
+    """
+    bs = BitStream(record)
+    bs.read_modular_shorts()  # object size
+    return bs.read_bit_short()
+
+
+def decode_object(handle: int, record: Bytes, dxfversion: str, encoding: str, object_types: ObjectTypes,
+                  crc_check=False) -> DwgObject:
+    """ Decode the common object data of the object `record`, returned by :func:`object_record`. """
+    bs = BitStream(record, dxfversion=dxfversion, encoding=encoding)
+    size = bs.read_modular_shorts()
+    start_index = bs.bit_index >> 3
+    end_index = start_index + size
+    if end_index + 2 > len(record):
+        raise DwgCorruptedObject(f'Object #{handle:X} exceeds file data.')
+    if crc_check:
+        check = struct.unpack_from('<H', record, end_index)[0]
+        # CRC of object size and object data
+        crc = crc8(record[:end_index], seed=0xc0c1)
+        if check != crc:
+            raise CRCError(f'CRC error in object #{handle:X}.')
+
+    data = bytes(record[start_index: end_index])
+    bs = BitStream(data, dxfversion=dxfversion, encoding=encoding)
+    type_ = bs.read_bit_short()
+    try:
+        dxftype, is_entity = object_types[type_]
+    except KeyError:
+        raise DwgCorruptedObject(f'Unknown object type {type_} of object #{handle:X}.')
+
+    entmode = ENTMODE_NONE
+    if is_entity:
+        if dxfversion >= ACAD_2000:
+            bs.skip(32)  # object size in bits RL
+        bs.read_handle()
+        # extended entity data
+        eed_size = bs.read_bit_short()
+        while eed_size > 0:
+            bs.read_handle()  # application handle
+            bs.skip(eed_size << 3)
+            eed_size = bs.read_bit_short()
+        if bs.read_bit():  # graphic present flag
+            bs.skip(bs.read_unsigned_long() << 3)
+        if dxfversion < ACAD_2000:
+            bs.skip(32)  # object size in bits RL
+        entmode = bs.read_bits(2)
+    return DwgObject(handle, type_, dxftype, entmode, data)
+
+
+def decode_object_records(records: Iterable[Tuple[int, bytes]], dxfversion: str, encoding: str,
+                          object_types: ObjectTypes, crc_check=False) -> List[DwgObject]:
+    """ Decode multiple ``(handle, record)`` tuples at once, this function can be executed by worker processes,
+    all arguments and the result are picklable.
+
+    """
+    return [
+        decode_object(handle, record, dxfversion, encoding, object_types, crc_check)
+        for handle, record in records
+    ]
@@ -3,8 +3,9 @@
 # Copyright (c) 2013-2019, Manfred Moitzi
 # License: MIT License
 
-from typing import TYPE_CHECKING, Iterable, Set, cast, Union, List, Dict
+from typing import TYPE_CHECKING, Iterable, Set, cast, Union, List, Dict, Optional, Tuple
 import logging
+from itertools import islice
 from ezdxf.lldxf.const import DXFKeyError, DXFStructureError, DXFTableEntryError, DXFTypeError
 from ezdxf.render.arrows import ARROWS
 
@@ -21,6 +22,7 @@ IMPORT_ENTITIES = {
     'DIMENSION', 'LEADER',  # dimension style override not supported!
     'VIEWPORT',
 }
+IMPORT_BATCH_SIZE = 1000
 
 
 class Importer:
@@ -61,12 +63,15 @@ class Importer:
 
     def _add_used_resources(self, entity: 'DXFEntity') -> None:
         """ Register used resources. """
-        self.used_layers.add(entity.get_dxf_attrib('layer', '0'))
-        self.used_linetypes.add(entity.get_dxf_attrib('linetype', 'BYLAYER'))
-        if entity.is_supported_dxf_attrib('style'):
-            self.used_styles.add(entity.get_dxf_attrib('style', 'Standard'))
-        if entity.is_supported_dxf_attrib('dimstyle'):
-            self.used_dimstyles.add(entity.get_dxf_attrib('dimstyle', 'Standard'))
+        dxf = entity.dxf
+        self.used_layers.add(dxf.get('layer', '0'))
+        self.used_linetypes.add(dxf.get('linetype', 'BYLAYER'))
+        # entities from a DXF iterator have no document, check the attribute definitions directly
+        dxfattribs = entity.DXFATTRIBS
+        if 'style' in dxfattribs:
+            self.used_styles.add(dxf.get('style', 'Standard'))
+        if 'dimstyle' in dxfattribs:
+            self.used_dimstyles.add(dxf.get('dimstyle', 'Standard'))
 
     def _add_dimstyle_resources(self, dimstyle: 'DimStyle') -> None:
         self.used_styles.add(dimstyle.get_dxf_attrib('dimtxsty', 'Standard'))
@@ -173,39 +178,49 @@ class Importer:
             DXFStructureError: `target_layout` is not a layout of target drawing
 
         """
+        target_layout = self._get_target_layout(target_layout)
+        new_entity = self._copy_entity(entity)
+        if new_entity is None:
+            return
+        self.target.entitydb.add(new_entity)
+        target_layout.add_entity(new_entity)
+        self._post_process(new_entity)
 
-        def set_dxf_attribs(e):
-            e.doc = self.target
-            # remove invalid resources
-            e.dxf.discard('plotstyle_handle')
-            e.dxf.discard('material_handle')
-            e.dxf.discard('visualstyle_handle')
-
+    def _get_target_layout(self, target_layout: 'BaseLayout' = None) -> 'BaseLayout':
         if target_layout is None:
-            target_layout = self.target.modelspace()
+            return self.target.modelspace()
         elif target_layout.doc != self.target:
             raise DXFStructureError('Target layout has to be a layout or block from the target drawing.')
+        return target_layout
 
+    def _copy_entity(self, entity: 'DXFEntity') -> Optional['DXFGraphic']:
+        """ Returns a clean copy of `entity` bound to the target drawing or ``None`` if not supported. """
         dxftype = entity.dxftype()
         if dxftype not in IMPORT_ENTITIES:
             logger.debug('Import of {} not supported'.format(str(entity)))
-            return
+            return None
         self._add_used_resources(entity)
 
         try:
             new_entity = cast('DXFGraphic', new_clean_entity(entity))
         except DXFTypeError:
             logger.debug('Copying for DXF type {} not supported.'.format(dxftype))
-            return
+            return None
 
-        set_dxf_attribs(new_entity)
-        self.target.entitydb.add(new_entity)
-        target_layout.add_entity(new_entity)
+        new_entity.doc = self.target
+        # remove invalid resources
+        dxf = new_entity.dxf
+        dxf.discard('plotstyle_handle')
+        dxf.discard('material_handle')
+        dxf.discard('visualstyle_handle')
+        return new_entity
 
+    def _post_process(self, new_entity: 'DXFGraphic') -> None:
         try:  # additional processing
-            getattr(self, '_import_' + dxftype.lower())(new_entity)
+            process = getattr(self, '_import_' + new_entity.dxftype().lower())
         except AttributeError:
-            pass
+            return
+        process(new_entity)
 
     def _import_insert(self, insert: 'Insert'):
         self.imported_inserts.append(insert)
@@ -278,8 +293,18 @@ class Importer:
             DXFStructureError: `target_layout` is not a layout of target drawing
 
         """
-        for entity in entities:
-            self.import_entity(entity, target_layout)
+        target_layout = self._get_target_layout(target_layout)
+        # import in batches: keeps memory usage low for entities from DXF iterators
+        entities = iter(entities)
+        while True:
+            chunk = list(islice(entities, IMPORT_BATCH_SIZE))
+            if not chunk:
+                break
+            batch = [e for e in map(self._copy_entity, chunk) if e is not None]
+            self.target.entitydb.add_entities(batch)
+            target_layout.add_entities(batch)
+            for new_entity in batch:
+                self._post_process(new_entity)
 
     def import_modelspace(self, target_layout: 'BaseLayout' = None) -> None:
         """
@@ -383,6 +408,10 @@ class Importer:
         else the existing target block will be used instead of the source block. Required name resolving for imported
         block references (INSERT), will be done in :meth:`Importer.finalize`.
 
+        All source blocks are resolved in advance, therefore a missing source block raises :class:`ValueError`
+        before the target drawing is modified and each block is imported only once, even if requested multiple times.
+        The table resources used by the block entities are collected and imported once by :meth:`Importer.finalize`.
+
         Args:
             block_names: names of blocks to import
             rename: rename block if exists in target drawing
@@ -391,8 +420,20 @@ class Importer:
             ValueError: source block not found
 
         """
+        source_blocks = dict()  # type: Dict[str, Tuple[str, BlockLayout]]
         for block_name in block_names:
-            self.import_block(block_name, rename=rename)
+            key = block_name.lower()  # block names are case insensitive
+            if key in source_blocks or block_name in self.imported_blocks:
+                continue
+            try:
+                source_blocks[key] = block_name, self.source.blocks[block_name]
+            except DXFKeyError:
+                raise ValueError('Source block "{}" not found.'.format(block_name))
+
+        for block_name, source_block in source_blocks.values():
+            # DIMENSION entities import their geometry blocks while importing the previous blocks
+            if block_name not in self.imported_blocks:
+                self._import_block(block_name, source_block, rename=rename)
 
     def import_block(self, block_name: str, rename=True) -> str:
         """
@@ -413,15 +454,6 @@ class Importer:
             ValueError: source block not found
 
         """
-
-        def get_new_block_name() -> str:
-            num = 0
-            name = block_name
-            while name in target_blocks:
-                name = block_name + str(num)
-                num += 1
-            return name
-
         try:  # already imported block?
             return self.imported_blocks[block_name]
         except KeyError:
@@ -431,6 +463,16 @@ class Importer:
             source_block = self.source.blocks[block_name]
         except DXFKeyError:
             raise ValueError('Source block "{}" not found.'.format(block_name))
+        return self._import_block(block_name, source_block, rename=rename)
+
+    def _import_block(self, block_name: str, source_block: 'BlockLayout', rename: bool) -> str:
+        def get_new_block_name() -> str:
+            num = 0
+            name = block_name
+            while name in target_blocks:
+                name = block_name + str(num)
+                num += 1
+            return name
 
         target_blocks = self.target.blocks
         if (block_name in target_blocks) and (rename is False):
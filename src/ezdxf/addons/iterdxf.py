@@ -1,20 +1,24 @@
 # Copyright (c) 2020, Manfred Moitzi
 # License: MIT License
-from typing import Iterable, cast, BinaryIO, Tuple, Dict, Optional, List, Set, Union
+from typing import TYPE_CHECKING, Iterable, cast, BinaryIO, Tuple, Dict, Optional, List, Set, Union
 from io import StringIO
 from pathlib import Path
 from ezdxf.lldxf.const import DXFStructureError
 from ezdxf.lldxf.extendedtags import ExtendedTags, DXFTag
 from ezdxf.lldxf.tagwriter import TagWriter
 from ezdxf.lldxf.tagger import tag_compiler, ascii_tags_loader
-from ezdxf.filemanagement import dxf_file_info
+from ezdxf.filemanagement import dxf_file_info, read
 from ezdxf.lldxf import fileindex
+from ezdxf.lldxf.selection import SUB_ENTITIES
 
 from ezdxf.entities import DXFGraphic, DXFEntity
 from ezdxf.entities.factory import EntityFactory
 from ezdxf.entities.dxfgfx import entity_linker
 from ezdxf.tools.codepage import toencoding
 
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Drawing
+
 __all__ = ['opendxf', 'single_pass_modelspace', 'modelspace']
 
 SUPPORTED_TYPES = {
@@ -85,6 +89,37 @@ class IterDXF:
         doc.write_data(data)
         return doc
 
+    def resources(self) -> 'Drawing':
+        """
+        Returns a new :class:`~ezdxf.drawing.Drawing` which contains the HEADER, CLASSES, TABLES, BLOCKS and OBJECTS
+        sections of the source DXF file and the paperspace entities of the ENTITIES section, but no modelspace
+        entities. This document can be used as source document of the :class:`~ezdxf.addons.importer.Importer` add-on
+        to import entities from the :meth:`modelspace` iterator into another DXF document, without loading the whole
+        source DXF file into memory.
+
+        .. versionadded:: 0.14
+
+        """
+        start_index = self.sections['ENTITIES']
+        try:
+            end_index = self.structure.get(0, 'ENDSEC', start_index)
+        except ValueError:
+            raise DXFStructureError('ENDSEC of ENTITIES section not found.')
+
+        self.file.seek(0)
+        data = [self.file.read(self.structure.index[start_index + 1].location)]
+        paperspace = False
+        for index in range(start_index + 1, end_index):
+            entry = self.structure.index[index]
+            size = self.structure.index[index + 1].location - entry.location
+            chunk = self.file.read(size)
+            if entry.value not in SUB_ENTITIES:  # sub-entities share the layout of their main entity
+                paperspace = _is_paperspace_entity(chunk.decode(self.encoding))
+            if paperspace:
+                data.append(chunk)
+        data.append(self.file.read())
+        return read(StringIO(b''.join(data).decode(self.encoding)))
+
     def copy_objects_section(self, f: BinaryIO) -> None:
         start_index = self.sections['OBJECTS']
         try:
@@ -369,3 +404,10 @@ def _requested_types(types: Optional[Iterable[str]]) -> Set[str]:
     else:
         requested = SUPPORTED_TYPES
     return requested
+
+
+def _is_paperspace_entity(text: str) -> bool:
+    for code, value in ascii_tags_loader(StringIO(text)):
+        if code == 67:
+            return value.strip() == '1'
+    return False
@@ -6,15 +6,17 @@
 audit(drawing, stream): check a DXF drawing for errors.
 """
 from enum import IntEnum
-from typing import TYPE_CHECKING, Iterable, List, Set, TextIO, Any, Dict
+from typing import TYPE_CHECKING, Iterable, List, Set, TextIO, Any, Dict, Tuple
+from collections import Counter
 
 import sys
 from ezdxf.lldxf.types import is_pointer_code, DXFTag
 from ezdxf.lldxf.validator import is_valid_layer_name, is_adsk_special_layer
 from ezdxf.entities.dxfentity import DXFEntity
+from ezdxf.entities.dxfgfx import DXFGraphic
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import DXFEntity, Drawing, DXFGraphic, BlocksSection
+    from ezdxf.eztypes import DXFEntity, Drawing, BlocksSection, EntityDB
 
 
 class AuditError(IntEnum):
@@ -36,6 +38,10 @@ class AuditError(IntEnum):
 
 REQUIRED_ROOT_DICT_ENTRIES = ('ACAD_GROUP', 'ACAD_PLOTSTYLENAME')
 
+# Table entries referenced by name from other entities. Modifying (e.g. renaming) or deleting such an entry requires
+# a check of all database entities by the incremental audit.
+REFERENCED_TABLE_ENTRIES = {'LTYPE', 'STYLE', 'DIMSTYLE', 'BLOCK_RECORD'}
+
 
 class ErrorEntry:
     def __init__(self, code: int, message: str = '', dxf_entity: 'DXFEntity' = None, data: Any = None):
@@ -129,15 +135,56 @@ class Auditor:
     def fixed_error(self, code: int, message: str = '', dxf_entity: 'DXFEntity' = None, data: Any = None) -> None:
         self.fixes.append(ErrorEntry(code, message, dxf_entity, data))
 
-    def run(self) -> List[ErrorEntry]:
+    def run(self, incremental: bool = False) -> List[ErrorEntry]:
+        """ Run audit process and returns the unfixed errors.
+
+        The first incremental run is a full audit, which also starts recording all added, modified and deleted
+        entities of the document. Following incremental runs check only the recorded entities and their direct
+        dependents. Unfixed errors of unmodified entities, found by a previous run, are not reported again.
+        Modifications of entity handles, internal data structures or entities which are not DXF attributes
+        (e.g. XDATA) are not recorded, run a full audit after such changes.
+
+        Args:
+            incremental: run incremental audit if ``True``
+
+        """
         self.reset()
-        self.doc.entitydb.audit(self)
+        db = self.doc.entitydb
+        tracker = db.tracker
+        if incremental and tracker is not None and not tracker.requires_full_audit():
+            self._run_incremental(tracker)
+        else:
+            db.audit(self)
+            self.check_root_dict()
+            self.check_table_structures()
+            self.check_database_entities()
+            self.doc.groups.audit(self)
+            cycle_detector = self.check_block_reference_cycles()
+            if incremental or tracker is not None:  # start or restart recording of changes
+                db.tracker = ChangeTracker(db, cycle_detector)
+        return self.errors
+
+    def _run_incremental(self, tracker: 'ChangeTracker') -> None:
+        db = self.doc.entitydb
+        entities = [e for e in tracker.changed_entities() if e.is_alive and db.get(e.dxf.handle) is e]
+        deleted = tracker.deleted
         self.check_root_dict()
         self.check_table_structures()
-        self.check_database_entities()
-        self.doc.groups.audit(self)
-        self.check_block_reference_cycles()
-        return self.errors
+        for entity in entities:
+            entity.audit(self)
+        if deleted or entities:
+            # entities in groups could be deleted or moved to another layout
+            self.doc.groups.audit(self)
+
+        cycle_detector = tracker.block_cycle_detector
+        for handle, entity in deleted:
+            if entity.dxftype() == 'INSERT':
+                cycle_detector.remove_insert(handle)
+        for entity in entities:
+            if entity.dxftype() == 'INSERT':
+                cycle_detector.update_insert(entity)
+        self.check_block_reference_cycles(cycle_detector, cycle_detector.reset_modified_blocks())
+        tracker.reset()
 
     def check_root_dict(self) -> None:
         root_dict = self.doc.rootdict
@@ -276,29 +323,119 @@ class Auditor:
                 data=owner_handle,
             )
 
-    def check_block_reference_cycles(self) -> None:
-        cycle_detector = BlockCycleDetector(self.doc)
-        for block in self.doc.blocks:
-            if cycle_detector.has_cycle(block.name):
+    def check_block_reference_cycles(self, cycle_detector: 'BlockCycleDetector' = None,
+                                     block_names: Iterable[str] = None) -> 'BlockCycleDetector':
+        """ Check `block_names` or all blocks for reference cycles, returns the used :class:`BlockCycleDetector`. """
+        blocks = self.doc.blocks
+        if cycle_detector is None:
+            cycle_detector = BlockCycleDetector(self.doc)
+        if block_names is None:
+            block_names = (block.name for block in blocks)
+        for name in block_names:
+            if cycle_detector.has_cycle(name) and name in blocks:
+                block = blocks.get(name)
                 self.add_error(
                     code=AuditError.INVALID_BLOCK_REFERENCE_CYCLE,
                     message=f'Invalid block reference cycle detected in block "{block.name}".',
                     dxf_entity=block.block_record,
                 )
+        return cycle_detector
+
+
+class ChangeTracker:
+    """ Records added, modified and deleted entities of an :class:`~ezdxf.entitydb.EntityDB` since the last
+    audit, required by the incremental audit of :meth:`Auditor.run`. (internal class)
+    """
+
+    def __init__(self, db: 'EntityDB', cycle_detector: 'BlockCycleDetector'):
+        self.block_cycle_detector = cycle_detector
+        self._changed: Dict[int, 'DXFEntity'] = dict()  # added or modified entities, key is id(entity)
+        self.deleted: List[Tuple[str, 'DXFEntity']] = []  # (handle, destroyed entity)
+        for entity in db.values():
+            entity._modified = False
+
+    def add(self, entity: 'DXFEntity') -> None:
+        """ Record added or modified `entity`. """
+        self._changed[id(entity)] = entity
+
+    def delete(self, handle: str, entity: 'DXFEntity') -> None:
+        """ Record deleted `entity`. """
+        self.deleted.append((handle, entity))
+
+    def changed_entities(self) -> Iterable['DXFEntity']:
+        """ Returns all added or modified entities. """
+        return self._changed.values()
+
+    def requires_full_audit(self) -> bool:
+        """ Returns ``True`` if recorded changes affect an unknown count of other entities. """
+        for handle, entity in self.deleted:
+            # owner of other entities or referenced by name
+            if not isinstance(entity, DXFGraphic) or entity.dxftype() in REFERENCED_TABLE_ENTRIES:
+                return True
+        return any(entity.dxftype() in REFERENCED_TABLE_ENTRIES for entity in self._changed.values())
+
+    def reset(self) -> None:
+        """ Reset recorded changes. """
+        for entity in self._changed.values():
+            entity._modified = False
+        self._changed = dict()
+        self.deleted = []
 
 
 class BlockCycleDetector:
     def __init__(self, doc: 'Drawing'):
         self.key = doc.blocks.key
+        self.db = doc.entitydb
+        # stores the inserted block names for each INSERT handle
+        self._inserts: Dict[str, Tuple[str, str]] = dict()
+        # set of block names with added or removed block references since the last reset
+        self._modified_blocks: Set[str] = set()
         self.blocks = self._build_block_ledger(doc.blocks)
 
-    def _build_block_ledger(self, blocks: 'BlocksSection') -> Dict[str, Set[str]]:
+    def _build_block_ledger(self, blocks: 'BlocksSection') -> Dict[str, Counter]:
         ledger = dict()
         for block in blocks:
-            inserts = {self.key(insert.dxf.name) for insert in block.query('INSERT')}
-            ledger[self.key(block.name)] = inserts
+            block_key = self.key(block.name)
+            inserts = Counter()
+            for insert in block.query('INSERT'):
+                name = self.key(insert.dxf.name)
+                inserts[name] += 1
+                self._inserts[insert.dxf.handle] = (block_key, name)
+            ledger[block_key] = inserts
         return ledger
 
+    def update_insert(self, insert: 'DXFGraphic') -> None:
+        """ Update block reference of a new or modified INSERT entity. """
+        handle = insert.dxf.handle
+        self.remove_insert(handle)
+        block_record = self.db.get(insert.dxf.owner)
+        if block_record is None or block_record.dxftype() != 'BLOCK_RECORD':  # unlinked entity
+            return
+        block_key = self.key(block_record.dxf.name)
+        name = self.key(insert.dxf.name)
+        self.blocks.setdefault(block_key, Counter())[name] += 1
+        self._inserts[handle] = (block_key, name)
+        self._modified_blocks.add(block_key)
+
+    def remove_insert(self, handle: str) -> None:
+        """ Remove block reference of a deleted or modified INSERT entity. """
+        try:
+            block_key, name = self._inserts.pop(handle)
+        except KeyError:
+            return
+        inserts = self.blocks.get(block_key)
+        if inserts is not None:
+            inserts[name] -= 1
+            if inserts[name] <= 0:
+                del inserts[name]
+        self._modified_blocks.add(block_key)
+
+    def reset_modified_blocks(self) -> Set[str]:
+        """ Returns the names of all blocks with added or removed block references since the last call. """
+        blocks = self._modified_blocks
+        self._modified_blocks = set()
+        return blocks
+
     def has_cycle(self, block_name: str) -> bool:
         def check(name):
             # block 'name' does not exist: ignore this error, because it is not
@@ -7,7 +7,11 @@ from datetime import datetime
 import io
 import base64
 import logging
+import pickle
+import zlib
+import gc
 from itertools import chain
+from contextlib import contextmanager
 
 from ezdxf.lldxf.const import acad_release, BLK_XREF, BLK_EXTERNAL, DXFValueError, acad_release_to_dxf_version
 from ezdxf.lldxf.const import DXF13, DXF14, DXF2000, DXF2007, DXF12, DXF2013, \
@@ -22,7 +26,9 @@ from ezdxf.entities.factory import EntityFactory
 from ezdxf.layouts.layouts import Layouts
 from ezdxf.tools.codepage import tocodepage, toencoding
 from ezdxf.tools.juliandate import juliandate
+from ezdxf.tools.profiler import active_profiler, phase
 from ezdxf.options import options
+from ezdxf.version import __version__
 
 from ezdxf.tools import guid
 from ezdxf.tracker import Tracker
@@ -46,13 +52,43 @@ from ezdxf.entities.mline import MLineStyleCollection
 logger = logging.getLogger('ezdxf')
 MANAGED_SECTIONS = {'HEADER', 'CLASSES', 'TABLES', 'BLOCKS', 'ENTITIES', 'OBJECTS', 'ACDSDATA'}
 
+# Snapshot format: magic bytes, format version, compression flag, length of ezdxf version, ezdxf version, pickled
+# document
+SNAPSHOT_MAGIC = b'EZDXFSNP'
+SNAPSHOT_FORMAT = 1
+
 if TYPE_CHECKING:
     from ezdxf.eztypes import DXFTag, Table, ViewportTable, VPort
     from ezdxf.eztypes import Dictionary, BlockLayout, Layout
     from ezdxf.eztypes import DXFEntity, Layer, Auditor
+    from ezdxf.lldxf.selection import EntitySelection
 
     LayoutType = Union[Layout, BlockLayout]
 
+@contextmanager
+def _disabled_gc():
+    # A document is a huge graph of objects without garbage, the garbage collection cycles triggered by pickling
+    # and unpickling of all these objects would double the processing time.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _profiled_stage(name: str, tags: Iterable['DXFTag']) -> Iterable['DXFTag']:
+    # The loading stages are streamed, an active profiler requires separated stages to measure each stage.
+    profiler = active_profiler()
+    if profiler is None:
+        return tags
+    with profiler.phase(name):
+        tags = list(tags)
+        profiler.add_items(len(tags))
+    return tags
+
+
 TFilterStack = Sequence[Sequence[Callable[[Iterable['DXFTag']], Iterable['DXFTag']]]]
 
 
@@ -71,6 +107,8 @@ class Drawing:
         self._loaded_dxfversion: Optional[str] = None
         self.encoding: str = 'cp1252'  # read/write
         self.filename: Optional[str] = None
+        # Report of the repair stage, if loaded in legacy mode:
+        self.repair_report: Optional[repair.RepairReport] = None
 
         # named objects dictionary
         self.rootdict: 'Dictionary' = None
@@ -215,7 +253,8 @@ class Drawing:
         return version
 
     @classmethod
-    def read(cls, stream: TextIO, legacy_mode: bool = False, filter_stack: TFilterStack = None) -> 'Drawing':
+    def read(cls, stream: TextIO, legacy_mode: bool = False, filter_stack: TFilterStack = None,
+             selection: 'EntitySelection' = None) -> 'Drawing':
         """ Open an existing drawing. Package users should use the factory function :func:`ezdxf.read`.
 
         Args:
@@ -228,14 +267,17 @@ class Drawing:
                 TFilterStack: Sequence[Sequence[Callable[[Iterable[DXFTag]], Iterable[DXFTag]]]]
                 e.g. [(raw_tag_filter1, raw_tag_filter2), (compiled_tag_filter1, )]
 
+             selection: :class:`~ezdxf.lldxf.selection.EntitySelection` to load only selected entities of the
+                        modelspace and paperspace layouts
+
         """
         from .lldxf.tagger import ascii_tags_loader
         tag_loader = ascii_tags_loader(stream)
-        return cls.load(tag_loader, legacy_mode=legacy_mode, filter_stack=filter_stack)
+        return cls.load(tag_loader, legacy_mode=legacy_mode, filter_stack=filter_stack, selection=selection)
 
     @classmethod
     def load(cls, tag_loader: Iterable['DXFTag'], legacy_mode: bool = False,
-             filter_stack: TFilterStack = None) -> 'Drawing':
+             filter_stack: TFilterStack = None, selection: 'EntitySelection' = None) -> 'Drawing':
         """ Load DXF document from DXF tag loader.
 
         Args:
@@ -248,6 +290,9 @@ class Drawing:
                 TFilterStack: Sequence[Sequence[Callable[[Iterable[DXFTag]], Iterable[DXFTag]]]]
                 e.g. [(raw_tag_filter1, raw_tag_filter2), (compiled_tag_filter1, )]
 
+             selection: :class:`~ezdxf.lldxf.selection.EntitySelection` to load only selected entities of the
+                        modelspace and paperspace layouts
+
         """
         from .lldxf.tagger import tag_compiler
         raw_tag_filters = []
@@ -259,8 +304,7 @@ class Drawing:
 
         # legacy mode overrides filter_stack
         if legacy_mode:
-            raw_tag_filters = [repair.tag_reorder_layer, repair.filter_invalid_yz_point_codes]
-            compiled_tag_filters = []
+            return cls._load_legacy(tag_loader, selection)
 
         # low level tag compiler, creates simple tuple like tags DXFTag(group code, value)
 
@@ -275,8 +319,30 @@ class Drawing:
         for _filter in compiled_tag_filters:
             tag_loader = _filter(tag_loader)
 
+        tag_loader = _profiled_stage('tagging', tag_loader)
+        doc = cls()
+        doc._load(tag_loader, selection=selection)
+        return doc
+
+    @classmethod
+    def _load_legacy(cls, tag_loader: Iterable['DXFTag'], selection: 'EntitySelection' = None) -> 'Drawing':
+        """ Load DXF document in legacy mode by a fused repair and validation stage, all stages are streamed.
+        The applied fixes and the fix counters are stored in :attr:`repair_report`.
+        """
+        from .lldxf.tagger import tag_compiler
+        report = repair.RepairReport()
+        check_tag_structure = options.check_entity_tag_structures
+        tag_loader = _profiled_stage('tagging', tag_loader)
+        report.fixes = repair.ALL_FIXES
+        tags = _profiled_stage('repair', repair.fused_repair_layer(
+            tag_loader, report.fixes, check_tag_structure, report))
+        tags = _profiled_stage('compile', tag_compiler(iter(tags)))
         doc = cls()
-        doc._load(tag_loader)
+        with _disabled_gc():
+            # entity tag structures are already validated by the repair stage
+            doc._load(tags, check_tag_structure=False, selection=selection)
+        doc.repair_report = report
+        logger.debug(f'Legacy mode loading report:\n{report}')
         return doc
 
     @classmethod
@@ -286,6 +352,34 @@ class Drawing:
         doc._load(tagger=compiled_tags)
         return doc
 
+    @classmethod
+    def from_snapshot(cls, data: bytes) -> 'Drawing':
+        """ Restore document from a snapshot created by :meth:`snapshot`. The snapshot has to be created by the same
+        `ezdxf` version. Snapshots are pickled Python objects, never load snapshots from untrusted sources!
+
+        Raises:
+            DXFValueError: invalid snapshot data or snapshot created by another `ezdxf` version
+
+        .. versionadded:: 0.14
+
+        """
+        magic_size = len(SNAPSHOT_MAGIC)
+        if data[:magic_size] != SNAPSHOT_MAGIC or len(data) < magic_size + 3:
+            raise DXFValueError('Invalid snapshot data.')
+        fmt, compressed, size = data[magic_size: magic_size + 3]
+        start = magic_size + 3 + size
+        version = data[magic_size + 3:start].decode('ascii')
+        if fmt != SNAPSHOT_FORMAT or version != __version__:
+            raise DXFValueError(f'Snapshot created by ezdxf v{version} can not be restored by ezdxf v{__version__}.')
+        payload = data[start:]
+        if compressed:
+            payload = zlib.decompress(payload)
+        with _disabled_gc():
+            doc = pickle.loads(payload)
+        if not isinstance(doc, cls):
+            raise DXFValueError('Invalid snapshot data.')
+        return doc
+
     @classmethod
     def from_section_dict(cls, sections: SectionDict) -> 'Drawing':
         """ Create new drawing from a SectionDict. (internal API)"""
@@ -293,12 +387,18 @@ class Drawing:
         doc._load(sections=sections)
         return doc
 
-    def _load(self, tagger: Optional[Iterable['DXFTag']] = None, sections: Optional[SectionDict] = None):
+    def _load(self, tagger: Optional[Iterable['DXFTag']] = None, sections: Optional[SectionDict] = None,
+              check_tag_structure: bool = None, selection: 'EntitySelection' = None):
         if tagger is None and sections is None:
             raise ValueError('DXF tagger or SectionDict required.')
 
         if sections is None:
-            sections = load_dxf_structure(tagger)  # load complete DXF entity structure
+            with phase('load_dxf_structure'):
+                # load complete DXF entity structure, except the entities skipped by the selection
+                sections = load_dxf_structure(tagger, selection=selection)
+                profiler = active_profiler()
+                if profiler is not None:
+                    profiler.add_items(sum(len(section) for section in sections.values()))
         try:  # discard section THUMBNAILIMAGE
             del sections['THUMBNAILIMAGE']
         except KeyError:
@@ -323,10 +423,28 @@ class Drawing:
         # setup handles
         self.entitydb.handles.reset(seed)
         # store all necessary DXF entities in the drawing database
-        fill_database(sections, self.dxffactory)
+        with phase('fill_database'):
+            fill_database(sections, self.dxffactory, check_tag_structure)
         # all handles used in the DXF file are known at this point
         # -----------------------------------------------------------------------------------
         # create sections:
+        with phase('sections'):
+            self._load_sections(sections)
+
+        if self.dxfversion in (DXF13, DXF14):
+            # upgrade to DXF R2000
+            self.dxfversion = DXF2000
+            with phase('arrow_blocks'):
+                self.create_all_arrow_blocks()
+
+        with phase('layouts'):
+            self.rootdict = self.objects.rootdict
+            self.objects.setup_objects_management_tables(self.rootdict)  # create missing tables
+
+            self.layouts = Layouts.load(self)
+            self._finalize_setup()
+
+    def _load_sections(self, sections: SectionDict) -> None:
         self.classes = ClassesSection(self, sections.get('CLASSES', None))
         self.tables = TablesSection(self, sections.get('TABLES', None))
         # create *Model_Space and *Paper_Space BLOCK_RECORDS
@@ -358,17 +476,6 @@ class Drawing:
             # and each table entry has an owner tag, pointing to the TABLE entry
             self.tables.create_table_handles()
 
-        if self.dxfversion in (DXF13, DXF14):
-            # upgrade to DXF R2000
-            self.dxfversion = DXF2000
-            self.create_all_arrow_blocks()
-
-        self.rootdict = self.objects.rootdict
-        self.objects.setup_objects_management_tables(self.rootdict)  # create missing tables
-
-        self.layouts = Layouts.load(self)
-        self._finalize_setup()
-
     def create_all_arrow_blocks(self):
         """
         For upgrading DXF R12/13/14 files to R2000, it is necessary to create all used arrow blocks before saving the
@@ -451,9 +558,10 @@ class Drawing:
         if dxfversion > DXF12:
             self.classes.add_required_classes(dxfversion)
 
-        self._create_appids()
-        self._update_header_vars()
-        self._update_metadata()
+        with phase('prepare_export'):
+            self._create_appids()
+            self._update_header_vars()
+            self._update_metadata()
 
         if fmt.startswith('asc'):
             tagwriter = TagWriter(stream, write_handles=handles, dxfversion=dxfversion)
@@ -480,21 +588,55 @@ class Drawing:
         binary_data = stream.getvalue().encode(self.output_encoding).replace(b'\n', b'\r\n')
         return base64.encodebytes(binary_data)
 
+    def snapshot(self, compress: bool = False) -> bytes:
+        """ Returns a compact binary snapshot of the document, restore the document by :meth:`from_snapshot`.
+        A snapshot is much faster to save and to restore than a DXF file, but it is only valid for the
+        `ezdxf` version which created the snapshot and should not be used as permanent storage.
+
+        :class:`Drawing` objects are also picklable, e.g. to pass them to :mod:`multiprocessing` workers.
+
+        A snapshot is also the fastest way to create an independent in-memory copy of a document,
+        modifications of the copy do not affect the source document and vice versa::
+
+            copy = Drawing.from_snapshot(doc.snapshot())
+            copy.filename = None  # avoid overwriting the source document by accident
+
+        Args:
+            compress: compress snapshot data by :mod:`zlib` if ``True``
+
+        .. versionadded:: 0.14
+
+        """
+        with _disabled_gc():
+            payload = pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+        if compress:
+            payload = zlib.compress(payload, 1)
+        version = __version__.encode('ascii')
+        return SNAPSHOT_MAGIC + bytes((SNAPSHOT_FORMAT, int(compress), len(version))) + version + payload
+
     def export_sections(self, tagwriter: 'TagWriter') -> None:
         """ DXF export sections. (internal API) """
         dxfversion = tagwriter.dxfversion
-        self.header.export_dxf(tagwriter)
+        with phase('export:HEADER'):
+            self.header.export_dxf(tagwriter)
         if dxfversion > DXF12:
-            self.classes.export_dxf(tagwriter)
-        self.tables.export_dxf(tagwriter)
-        self.blocks.export_dxf(tagwriter)
-        self.entities.export_dxf(tagwriter)
+            with phase('export:CLASSES'):
+                self.classes.export_dxf(tagwriter)
+        with phase('export:TABLES'):
+            self.tables.export_dxf(tagwriter)
+        with phase('export:BLOCKS'):
+            self.blocks.export_dxf(tagwriter)
+        with phase('export:ENTITIES'):
+            self.entities.export_dxf(tagwriter)
         if dxfversion > DXF12:
-            self.objects.export_dxf(tagwriter)
+            with phase('export:OBJECTS'):
+                self.objects.export_dxf(tagwriter)
         if self.acdsdata.is_valid:
-            self.acdsdata.export_dxf(tagwriter)
+            with phase('export:ACDSDATA'):
+                self.acdsdata.export_dxf(tagwriter)
         for section in self.stored_sections:
-            section.export_dxf(tagwriter)
+            with phase('export:STORED_SECTIONS'):
+                section.export_dxf(tagwriter)
 
         tagwriter.write_tag2(0, 'EOF')
 
@@ -825,7 +967,7 @@ class Drawing:
             'xref_path': filename
         })
 
-    def audit(self) -> 'Auditor':
+    def audit(self, incremental: bool = False) -> 'Auditor':
         """
         Checks document integrity and fixes all fixable problems, not fixable problems are stored in
         :attr:`Auditor.errors`.
@@ -833,10 +975,20 @@ class Drawing:
         If you are messing around with internal structures, call this method before saving to be sure to export valid
         DXF documents, but be aware this is a long running task.
 
+        The first incremental audit is a full audit and starts recording of all entity changes, following
+        incremental audits check only the modified, added and deleted entities and their direct dependents,
+        see :meth:`Auditor.run`.
+
+        Args:
+            incremental: run incremental audit if ``True``
+
+        .. versionchanged:: 0.14
+            argument `incremental`
+
         """
         from ezdxf.audit.auditor import Auditor
         auditor = Auditor(self)
-        auditor.run()
+        auditor.run(incremental=incremental)
         return auditor
 
     def validate(self, print_report=True) -> bool:
@@ -70,6 +70,7 @@ acdb_attdef_xrecord = DefSubclass('AcDbXrecord', [
 
 class BaseAttrib(Text):
     XRECORD_DEF = acdb_attdef_xrecord
+    EXPORT_CACHE = False  # xrecord and attached MTEXT are not tracked
 
     def __init__(self, doc: 'Drawing' = None):
         """ Default constructor """
@@ -1,7 +1,7 @@
 # Created: 17.02.2019
 # Copyright (c) 2019, Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 import logging
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass
 from ezdxf.lldxf.const import DXF12, SUBCLASS_MARKER, DXF2007, DXFInternalEzdxfError
@@ -163,6 +163,26 @@ class BlockRecord(DXFEntity):
             logger.debug('Unexpected entity {}'.format(entity))
         self.entity_space.add(entity)
 
+    def add_entities(self, entities: Iterable['DXFGraphic']) -> None:
+        """
+        Add multiple existing DXF entities to BLOCK_RECORD.
+
+        Args:
+            entities: iterable of :class:`DXFGraphic`
+
+        .. versionadded:: 0.14
+
+        """
+        entities = list(entities)
+        owner = self.dxf.handle
+        paperspace = int(self.is_any_paperspace)
+        for entity in entities:
+            if hasattr(entity, 'set_owner'):
+                entity.set_owner(owner, paperspace=paperspace)
+            else:
+                logger.debug('Unexpected entity {}'.format(entity))
+        self.entity_space.extend(entities)
+
     def unlink_entity(self, entity: 'DXFGraphic') -> None:
         """
         Unlink `entity` from BLOCK_RECORD.
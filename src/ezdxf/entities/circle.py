@@ -29,6 +29,7 @@ class Circle(DXFGraphic):
     """ DXF CIRCLE entity """
     DXFTYPE = 'CIRCLE'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_circle)
+    EXPORT_CACHE = True
 
     def load_dxf_attribs(self, processor: SubclassProcessor = None) -> 'DXFNamespace':
         dxf = super().load_dxf_attribs(processor)
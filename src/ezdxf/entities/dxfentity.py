@@ -2,17 +2,19 @@
 # License: MIT License
 # Created 2019-02-13
 # DXFEntity - Root Entity
-from typing import TYPE_CHECKING, List, Any, Iterable, Optional, Union, Type, TypeVar, Set
+from typing import TYPE_CHECKING, List, Any, Iterable, Optional, Union, Type, TypeVar, Set, Dict, Hashable, Tuple
 import copy
 from ezdxf import options
-from ezdxf.lldxf.types import handle_code, dxftag, cast_value
+from ezdxf.lldxf.types import handle_code, dxftag, POINT_CODES, TYPE_TABLE, BINARY_DATA
 from ezdxf.lldxf.tags import Tags
 from ezdxf.lldxf.extendedtags import ExtendedTags
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass, XType
 from ezdxf.lldxf.const import DXF2000, STRUCTURE_MARKER, OWNER_CODE, DXF12
 from ezdxf.lldxf.const import ACAD_REACTORS, ACAD_XDICTIONARY
-from ezdxf.lldxf.const import DXFAttributeError, DXFValueError, DXFTypeError, DXFKeyError
+from ezdxf.lldxf.const import DXFAttributeError, DXFValueError, DXFTypeError, DXFKeyError, DXFInternalEzdxfError
 from ezdxf.tools import set_flag_state
+from ezdxf.tools.profiler import active_profiler
+from ezdxf.math import Vector
 from .xdata import XData, EmbeddedObjects
 from .appdata import AppData, Reactors
 from .xdict import ExtensionDict
@@ -57,11 +59,33 @@ class DXFNamespace:
     """
     Uses the Python object itself as attribute storage, only valid Python names can be used as attrib name.
 
+    Instantiating DXFNamespace() creates an instance of the namespace class generated for the DXF attribute
+    definitions of the parent entity, see :func:`namespace_class`. Generated namespace classes store all DXF
+    attributes in __slots__, unset attributes contain the DXF default value and the bit mask _flags marks the really
+    existing attributes. Reading DXF attributes requires no method call, callback attributes are resolved by
+    __getattr__().
+
     The namespace can only contain immutable objects: string, int, float, bool, Vector
     Because of the immutability, copy and deepcopy are the same.
 
     (internal class)
     """
+    __slots__ = ('_entity', '_flags')
+
+    # class members of generated namespace classes:
+    _dxfattribs = None  # type: DXFAttributes
+    _slots = dict()  # type: Dict[str, Tuple[int, Any, Any]]  # name: (flag, cast function, member descriptor)
+    _defaults = tuple()  # type: Tuple[Tuple[Any, Any], ...]  # (descriptor setter, DXF default value)
+
+    def __new__(cls, processor: 'SubclassProcessor' = None, entity: 'DXFEntity' = None):
+        if cls is DXFNamespace:
+            cls = namespace_class(None if entity is None else entity.DXFATTRIBS)
+        namespace = object.__new__(cls)
+        for setter, default in cls._defaults:
+            setter(namespace, default)
+        _set_entity(namespace, None)
+        _set_flags(namespace, 0)
+        return namespace
 
     def __init__(self, processor: 'SubclassProcessor' = None, entity: 'DXFEntity' = None):
         if processor:
@@ -78,18 +102,59 @@ class DXFNamespace:
 
     def copy(self, entity: 'DXFEntity'):
         namespace = self.__class__()
-        for k, v in self.__dict__.items():
-            namespace.__dict__[k] = v
+        for name, (flag, cast, descriptor) in self._slots.items():
+            descriptor.__set__(namespace, descriptor.__get__(self))
+        _set_flags(namespace, self._flags)
         namespace.rewire(entity)
         return namespace
 
     def __deepcopy__(self, memodict: dict = None):
         return self.copy(self._entity)
 
+    def __getstate__(self) -> dict:
+        state = self.all_existing_dxf_attribs()
+        state['_entity'] = self._entity
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        # bypass __setattr__(), __getattr__() would recursively look up the not existing parent entity
+        for key, value in state.items():
+            if key == '_entity':
+                _set_entity(self, value)
+            else:
+                self._store(key, value)
+
+    def __reduce__(self):
+        # generated namespace classes are not accessible by name
+        entity = self._entity
+        return _new_namespace, (None if entity is None else entity.__class__,), self.__getstate__()
+
+    def _store(self, key: str, value: Any) -> None:
+        # store value without casting and notifications, ignores not existing slots
+        slot = self._slots.get(key)
+        if slot is not None:
+            slot[2].__set__(self, value)
+            _set_flags(self, self._flags | slot[0])
+
+    def _reset(self, key: str) -> bool:
+        # reset existing attribute to DXF default value, returns False for not existing attributes
+        slot = self._slots.get(key)
+        if slot is not None and self._flags & slot[0]:
+            slot[2].__set__(self, self.dxf_default_value(key))
+            _set_flags(self, self._flags & ~slot[0])
+            return True
+        return False
+
     def reset_handles(self):
         """ Reset handle and owner to None. """
-        self.__dict__['handle'] = None
-        self.__dict__['owner'] = None
+        self._store('handle', None)
+        self._store('owner', None)
+        self._set_modified()
+
+    def _set_modified(self) -> None:
+        entity = self._entity
+        if entity is not None:
+            entity.set_modified()
 
     def rewire(self, entity: 'DXFEntity', handle: str = None, owner: str = None) -> None:
         """
@@ -102,16 +167,17 @@ class DXFNamespace:
 
         """
         # bypass __setattr__()
-        self.__dict__['_entity'] = entity
+        _set_entity(self, entity)
         if handle is not None:
-            self.__dict__['handle'] = handle
+            self._store('handle', handle)
         if owner is not None:
-            self.__dict__['owner'] = owner
+            self._store('owner', owner)
+        if handle is not None or owner is not None:
+            self._set_modified()
 
     def __getattr__(self, key: str) -> Any:
-        """ called if key does not exist, returns default value or None for unset default values
-        """
-        attrib_def = self.dxfattribs.get(key, None)  # type: DXFAttr
+        """ called if key does not exist, returns value of callback attributes """
+        attrib_def = self._dxfattribs.get(key, None)  # type: DXFAttr
         if attrib_def:
             if attrib_def.xtype == XType.callback:
                 return attrib_def.get_callback_value(self._entity)
@@ -121,14 +187,18 @@ class DXFNamespace:
             raise DXFAttributeError(ERR_INVALID_DXF_ATTRIB.format(key, self.dxftype))
 
     def __setattr__(self, key: str, value: Any) -> None:
-        attrib_def = self.dxfattribs.get(key, None)  # type: DXFAttr
-        if attrib_def:
-            if attrib_def.xtype == XType.callback:
+        slot = self._slots.get(key)
+        if slot is not None:
+            flag, cast, descriptor = slot
+            descriptor.__set__(self, None if value is None else cast(value))
+            _set_flags(self, self._flags | flag)
+        else:
+            attrib_def = self._dxfattribs.get(key, None)  # type: DXFAttr
+            if attrib_def and attrib_def.xtype == XType.callback:
                 attrib_def.set_callback_value(self._entity, value)
             else:
-                self.__dict__[key] = cast_value(attrib_def.code, value)
-        else:
-            raise DXFAttributeError(ERR_INVALID_DXF_ATTRIB.format(key, self.dxftype))
+                raise DXFAttributeError(ERR_INVALID_DXF_ATTRIB.format(key, self.dxftype))
+        self._set_modified()
 
         if key in SETTER_EVENTS:
             handler = getattr(self._entity, SETTER_EVENTS[key], None)
@@ -136,23 +206,20 @@ class DXFNamespace:
                 handler(value)
 
     def __delattr__(self, key: str) -> None:
-        if self.hasattr(key):
-            del self.__dict__[key]
+        if self._reset(key):
+            self._set_modified()
         else:
             raise DXFAttributeError(ERR_DXF_ATTRIB_NOT_EXITS.format(key))
 
     def get(self, key: str, default: Any = None) -> Any:
         """ Returns given `default` value not DXF default value for unset attributes. """
-        # callback values should not exist as attribute in __dict__
-        if self.hasattr(key):
+        slot = self._slots.get(key)
+        if slot is not None:
             # do not return the DXF default value
-            return self.__dict__[key]
-        attrib_def = self.dxfattribs.get(key, None)  # type: DXFAttr
-        if attrib_def:
-            if attrib_def.xtype == XType.callback:
-                return attrib_def.get_callback_value(self._entity)
-            else:
-                return default  # return give default
+            return slot[2].__get__(self) if self._flags & slot[0] else default
+        attrib_def = self._dxfattribs.get(key, None)  # type: DXFAttr
+        if attrib_def:  # callback values do not exist as slots
+            return attrib_def.get_callback_value(self._entity)
         else:
             raise DXFAttributeError(ERR_INVALID_DXF_ATTRIB.format(key, self.dxftype))
 
@@ -168,18 +235,16 @@ class DXFNamespace:
         Contains only DXF attributes, which are accessible by DXFNamespace.
 
         """
-        attribs = dict(self.__dict__)
-        del attribs['_entity']
-        return attribs
+        flags = self._flags
+        return {name: descriptor.__get__(self) for name, (flag, cast, descriptor) in self._slots.items() if
+                flags & flag}
 
     def set(self, key: str, value: Any) -> None:
         self.__setattr__(key, value)
 
     def discard(self, key: str) -> None:
-        try:
-            del self.__dict__[key]
-        except KeyError:
-            pass
+        if self._reset(key):
+            self._set_modified()
 
     def is_supported(self, key: str) -> bool:
         """
@@ -190,7 +255,7 @@ class DXFNamespace:
 
         """
 
-        return self.dxfattribs.get(key, None) is not None
+        return self._dxfattribs.get(key, None) is not None
 
     def hasattr(self, key: str) -> bool:
         """
@@ -199,7 +264,8 @@ class DXFNamespace:
         Does no check if attribute `key` is supported, but implicit supported if exists.
 
         """
-        return key in self.__dict__
+        slot = self._slots.get(key)
+        return slot is not None and bool(self._flags & slot[0])
 
     @property
     def dxftype(self):
@@ -207,14 +273,14 @@ class DXFNamespace:
 
     @property
     def dxfattribs(self):
-        return self._entity.DXFATTRIBS
+        return self._dxfattribs
 
     def dxf_default_value(self, key: str) -> Any:
         """
         Returns the default value as defined in the DXF standard.
 
         """
-        attrib = self.dxfattribs.get(key, None)
+        attrib = self._dxfattribs.get(key, None)
         if attrib:
             return attrib.default
         else:
@@ -228,16 +294,51 @@ class DXFNamespace:
 
         Replaces export_dxf_attribute() and export_dxf_attribs() in the long run.
 
+        All attributes are written by a single :meth:`TagWriter.write_tags2` call, the required attribute
+        definitions are compiled once for each entity type and DXF version, see :func:`export_plan`.
+
         Args:
             tagwriter: tag writer object
             attribs: DXF attribute name as string or an iterable of names
 
         """
-        if isinstance(attribs, str):
-            self._export_dxf_attribute_optional(tagwriter, attribs)
-        else:
-            for name in attribs:
+        names = (attribs,) if isinstance(attribs, str) else tuple(attribs)
+        plan = export_plan(self.dxfattribs, names, tagwriter.dxfversion)
+        if plan is None:
+            for name in names:
                 self._export_dxf_attribute_optional(tagwriter, name)
+            return
+
+        tags = []
+        flags = self._flags
+        not_force_optional = not tagwriter.force_optional
+        for name, code, cast, default, optional, mode, flag in plan:
+            if mode & CALLBACK:
+                value = self.get(name)
+            elif flags & flag:
+                value = getattr(self, name)
+            else:
+                value = None
+            if value is None:
+                if optional:
+                    continue
+                value = default  # force default value e.g. layer
+                if value is None:  # do not export None
+                    continue
+            elif optional and not_force_optional and default is not None and default == value:
+                continue  # do not write explicit optional attribs if equal to default value
+            if mode & VERTEX:
+                if mode & POINT2D:  # just use x, y for 2d points if value is a 3d point (Vector, tuple)
+                    value = value[:2]
+                tags.extend((code + index * 10, float(axis)) for index, axis in enumerate(value))
+            else:
+                value = cast(value)
+                if cast is str:
+                    assert '\n' not in value, "line break '\\n' not allowed"
+                    assert '\r' not in value, "line break '\\r' not allowed"
+                tags.append((code, value))
+        if tags:
+            tagwriter.write_tags2(tags)
 
     def _export_dxf_attribute_optional(self, tagwriter: 'TagWriter', name: str) -> None:
         """
@@ -275,8 +376,178 @@ class DXFNamespace:
             raise DXFAttributeError(ERR_INVALID_DXF_ATTRIB.format(name, self.dxftype))
 
 
+_set_entity = DXFNamespace.__dict__['_entity'].__set__
+_set_flags = DXFNamespace.__dict__['_flags'].__set__
+
+# generated namespace classes, key is id(dxfattribs), the value keeps a reference to the attribute definitions, so
+# the id can not be reused
+_NAMESPACE_CLASSES = dict()  # type: Dict[int, Tuple[DXFAttributes, Type[DXFNamespace]]]
+_NO_DXFATTRIBS = DXFAttributes()
+BASE_NAMESPACE_ATTRIBS = {'handle': DXFAttr(5), 'owner': DXFAttr(330)}
+
+
+def namespace_class(dxfattribs: Optional[DXFAttributes]) -> Type[DXFNamespace]:
+    """
+    Returns the :class:`DXFNamespace` class generated for the DXF attribute definitions `dxfattribs`, all
+    none callback attributes are stored in __slots__. The class is generated once and shared by all entities with
+    the same attribute definitions. (internal API)
+
+    .. versionadded:: 0.14
+
+    """
+    if dxfattribs is None:
+        dxfattribs = _NO_DXFATTRIBS
+    try:
+        return _NAMESPACE_CLASSES[id(dxfattribs)][1]
+    except KeyError:
+        pass
+    # handle and owner always exist, also for entities without base class like CLASS
+    names = tuple(BASE_NAMESPACE_ATTRIBS) + tuple(
+        name for name, attrib in dxfattribs.items() if attrib.xtype != XType.callback and
+        name not in BASE_NAMESPACE_ATTRIBS
+    )
+    for name in names:
+        if name.startswith('_') or hasattr(DXFNamespace, name):
+            raise DXFInternalEzdxfError(f'DXF attribute name "{name}" collides with DXFNamespace members.')
+    cls = type('DXFNamespace', (DXFNamespace,), {'__slots__': names, '_dxfattribs': dxfattribs})
+    slots = dict()
+    defaults = []
+    for index, name in enumerate(names):
+        attrib = dxfattribs.get(name) or BASE_NAMESPACE_ATTRIBS[name]
+        code = attrib.code
+        descriptor = cls.__dict__[name]
+        default = attrib.default
+        if code in POINT_CODES:
+            cast = _shared_default_vector(default) if isinstance(default, Vector) else Vector
+        else:
+            cast = TYPE_TABLE.get(code, str)
+        slots[name] = (1 << index, cast, descriptor)
+        defaults.append((descriptor.__set__, default))
+    cls._slots = slots
+    cls._defaults = tuple(defaults)
+    _NAMESPACE_CLASSES[id(dxfattribs)] = (dxfattribs, cls)
+    return cls
+
+
+def _shared_default_vector(default: Vector):
+    """ Returns a cast function for vertices, which returns the immutable `default` vector for all values equal to
+    `default`, this shares the default vector (e.g. extrusion) between all entities of a loaded DXF document.
+    """
+    xyz = default.xyz
+
+    def cast(value) -> Vector:
+        vector = Vector(value)
+        return default if vector.xyz == xyz else vector
+
+    return cast
+
+
+def _new_namespace(entity_class: Optional[Type['DXFEntity']]) -> DXFNamespace:
+    # unpickle helper for generated namespace classes
+    cls = namespace_class(None if entity_class is None else entity_class.DXFATTRIBS)
+    return cls.__new__(cls)
+
+
 BASE_CLASS_CODES = {0, 5, 102, 330}
 
+# load plan modes
+STORE = 0  # store casted value direct in the slot of the DXF namespace
+SET = 1  # set value by DXFNamespace.set(), required for callback attributes
+SKIP = 2  # callback attribute without setter, ignore value
+
+LoadPlan = Dict[int, Tuple[Tuple[str, Any, int, Any, int], ...]]
+
+# compiled load plans, key is (id(subclass_definition), id(dxfattribs)), the value keeps a reference to both
+# objects, so the ids can not be reused
+_LOAD_PLANS = dict()  # type: Dict[Tuple[int, int], Tuple[DefSubclass, DXFAttributes, LoadPlan]]
+
+
+def load_plan(subclass_definition: DefSubclass, dxfattribs: DXFAttributes) -> LoadPlan:
+    """
+    Returns the compiled load plan of `subclass_definition` for an entity with the DXF attribute definitions
+    `dxfattribs`. The plan maps each group code to a tuple of ``(name, cast, mode, setter, flag)`` slots, `setter`
+    and `flag` are the slot setter and existence flag of the generated namespace class, the n-th occurrence of a
+    group code in a subclass is loaded into the n-th slot (doublets), group codes without a free slot are unprocessed
+    tags. The plan is compiled once and shared by all entities of the same type, do not modify the plan.
+    (internal API)
+
+    .. versionadded:: 0.14
+
+    """
+    key = (id(subclass_definition), id(dxfattribs))
+    try:
+        return _LOAD_PLANS[key][2]
+    except KeyError:
+        pass
+    namespace_slots = namespace_class(dxfattribs)._slots
+    slots = dict()  # type: Dict[int, List[Tuple[str, Any, int, Any, int]]]
+    for name, dxfattr in subclass_definition.attribs.items():
+        attrib = dxfattribs.get(name)
+        if attrib is None:  # DXFNamespace.set() raises DXFAttributeError
+            slot = (name, None, SET, None, 0)
+        elif attrib.xtype == XType.callback:
+            slot = (name, None, SKIP if attrib.setter is None else SET, None, 0)
+        else:
+            flag, cast, descriptor = namespace_slots[name]
+            slot = (name, cast, STORE, descriptor.__set__, flag)
+        slots.setdefault(dxfattr.code, []).append(slot)
+    plan = {code: tuple(code_slots) for code, code_slots in slots.items()}
+    _LOAD_PLANS[key] = (subclass_definition, dxfattribs, plan)
+    return plan
+
+
+# export plan modes
+VERTEX = 1  # export vertex as single axis values
+POINT2D = 2  # export only x- and y-axis
+CALLBACK = 4  # get value by DXFNamespace.get()
+
+ExportPlan = Tuple[Tuple[str, int, Any, Any, bool, int, int], ...]
+
+# compiled export plans, key is (id(dxfattribs), attribute names, dxfversion), the value keeps a reference to the
+# attribute definitions, so the id can not be reused
+_EXPORT_PLANS = dict()  # type: Dict[Tuple[int, Tuple[str, ...], str], Tuple[DXFAttributes, Optional[ExportPlan]]]
+
+
+def export_plan(dxfattribs: DXFAttributes, names: Tuple[str, ...], dxfversion: str) -> Optional[ExportPlan]:
+    """
+    Returns the compiled export plan for the DXF attributes `names` of an entity with the DXF attribute definitions
+    `dxfattribs` as tuple of ``(name, code, cast, default, optional, mode, flag)`` entries. Attributes not supported by
+    `dxfversion` are not included. Returns ``None`` if the attributes require the generic export by
+    :func:`dxftag`, like binary data or invalid attribute names. The plan is compiled once and shared by all entities
+    of the same type. (internal API)
+
+    .. versionadded:: 0.14
+
+    """
+    key = (id(dxfattribs), names, dxfversion)
+    try:
+        return _EXPORT_PLANS[key][1]
+    except KeyError:
+        pass
+    namespace_slots = namespace_class(dxfattribs)._slots
+    plan = []
+    for name in names:
+        attrib = dxfattribs.get(name)
+        if attrib is None:  # generic export raises DXFAttributeError
+            plan = None
+            break
+        if dxfversion < attrib.dxfversion:
+            continue
+        code = attrib.code
+        mode = CALLBACK if attrib.xtype == XType.callback else 0
+        if code in POINT_CODES:
+            mode |= VERTEX
+            if attrib.xtype == XType.point2d:
+                mode |= POINT2D
+        elif code in BINARY_DATA or attrib.xtype == XType.point2d:
+            plan = None
+            break
+        flag = 0 if mode & CALLBACK else namespace_slots[name][0]
+        plan.append((name, code, TYPE_TABLE.get(code, str), attrib.default, attrib.optional, mode, flag))
+    plan = None if plan is None else tuple(plan)
+    _EXPORT_PLANS[key] = (dxfattribs, plan)
+    return plan
+
 
 class SubclassProcessor:
     """  Helper class for loading tags into entities. (internal class) """
@@ -362,38 +633,29 @@ class SubclassProcessor:
 
         """
 
-        def replace_attrib(code) -> bool:
-            """ Returns ``True`` if an attribute was replaced by a doublet. """
-            for index, dxfattr in enumerate(doublets):
-                if dxfattr.code == code:
-                    group_codes[code] = dxfattr
-                    del doublets[index]
-                    return True
-            return False
-
         unprocessed_tags = Tags()
-        # do not cache group codes, content of group code will be deleted while processing
-        group_codes = dict()
-        doublets = []
-        for dxfattr in subclass_definition.attribs.values():
-            if dxfattr.code in group_codes:
-                doublets.append(dxfattr)
-            else:
-                group_codes[dxfattr.code] = dxfattr
+        plan = load_plan(subclass_definition, dxf.dxfattribs)
+        flags = 0
+        occurrences = dict()  # count of processed tags by group code, required for doublets
 
         # iterate without leading subclass marker or for r12 without leading (0, ...) structure tag
         for tag in tags:
             code, value = tag
-            attrib = group_codes.get(code)
-            if attrib is not None:
-                if (attrib.xtype != XType.callback) or (attrib.setter is not None):
-                    dxf.set(attrib.name, value)
-
-                if len(doublets) and replace_attrib(code):
+            slots = plan.get(code)
+            if slots is not None:
+                count = occurrences.get(code, 0)
+                if count < len(slots):
+                    occurrences[code] = count + 1
+                    name, cast, mode, setter, flag = slots[count]
+                    if mode == STORE:
+                        setter(dxf, None if value is None else cast(value))
+                        flags |= flag
+                    elif mode == SET:
+                        dxf.set(name, value)
                     continue
-                del group_codes[code]
-            else:
-                unprocessed_tags.append(tag)
+            unprocessed_tags.append(tag)
+        if flags:
+            _set_flags(dxf, dxf._flags | flags)
         return unprocessed_tags
 
     def append_base_class_to_acdb_entity(self) -> None:
@@ -440,8 +702,18 @@ class DXFEntity:
     DEFAULT_ATTRIBS = None  # type: dict
     MIN_DXF_VERSION_FOR_EXPORT = DXF12
 
+    # Entities which store their complete state in the DXF namespace (or track modifications of additional data
+    # by calling set_modified()) can reuse their serialized DXF tags, if enabled by option "use_export_cache".
+    EXPORT_CACHE = False
+
     def __init__(self, doc: 'Drawing' = None):
         """ Default constructor. (internal API)"""
+        # cached DXF export for unmodified entities, key is TagWriter.export_cache_key()
+        self._export_cache: Optional[Dict[Hashable, Union[str, bytes]]] = None
+        # modification state for the incremental audit, reset by the ChangeTracker of the entity database
+        self._modified = False
+        # modification counter, incremented by each modification, see property revision
+        self._revision = 0
         # public attributes for package users
         self.doc: Drawing = doc
         self.dxf: DXFNamespace = DXFNamespace(entity=self)
@@ -811,6 +1083,18 @@ class DXFEntity:
             return
         if not self.preprocess_export(tagwriter):
             return
+        profiler = active_profiler()
+        if profiler is not None:
+            profiler.entity_exported(self.dxftype())
+        if self.EXPORT_CACHE and options.use_export_cache and self.has_cacheable_export_state():
+            key = tagwriter.export_cache_key()
+            if key is not None:
+                self._export_cached_tags(tagwriter, key)
+                return
+        self.export_tags(tagwriter)
+
+    def export_tags(self, tagwriter: 'TagWriter') -> None:
+        """ Export all DXF tags of this entity without any pre requirement checks. (internal API) """
         # ! first step !
         # write handle, AppData, Reactors, ExtensionDict, owner
         self.export_base_class(tagwriter)
@@ -823,6 +1107,47 @@ class DXFEntity:
         self.export_embedded_objects(tagwriter)
         self.export_xdata(tagwriter)
 
+    def _export_cached_tags(self, tagwriter: 'TagWriter', key: Hashable) -> None:
+        cache = self._export_cache
+        data = None if cache is None else cache.get(key)
+        if data is None:
+            buffer = tagwriter.buffered_writer()
+            self.export_tags(buffer)
+            data = buffer.getvalue()
+            # export_tags() can modify DXF attributes, which discards the cache
+            if self._export_cache is None:
+                self._export_cache = dict()
+            self._export_cache[key] = data
+        tagwriter.write_raw(data)
+
+    def has_cacheable_export_state(self) -> bool:
+        """ Returns ``True`` if all additional data of this entity, which is not tracked by the export cache,
+        is empty. (internal API)
+        """
+        return not (self.appdata or self.reactors or self.extension_dict or self.xdata or self.embedded_objects
+                    or self.proxy_graphic)
+
+    def set_modified(self) -> None:
+        """ Mark entity as modified, discards the cached DXF export and registers the entity for the next
+        incremental audit. Called by all DXF namespace modifications and has to be called by all methods which
+        modify entity data outside of the DXF namespace. (internal API)
+        """
+        self._export_cache = None
+        self._revision += 1
+        if not self._modified:
+            self._modified = True
+            # the DXF document of unbound entities is None
+            tracker = getattr(getattr(self.doc, 'entitydb', None), 'tracker', None)
+            if tracker is not None:
+                tracker.add(self)
+
+    @property
+    def revision(self) -> int:
+        """ Returns the modification counter of this entity, which changes by each call of :meth:`set_modified`,
+        usable as key for caching data derived from the entity state. (internal API)
+        """
+        return self._revision
+
     def export_base_class(self, tagwriter: 'TagWriter') -> None:
         """ Export base class DXF attributes and structures. (internal API) """
         dxftype = self.DXFTYPE
@@ -1080,6 +1405,11 @@ class DXFEntity:
 
 class DXFTagStorage(DXFEntity):
     """ Just store all the tags as they are. (internal class) """
+    # The paperspace flag is the only attribute loaded from the stored tags, required to assign the entity to the
+    # modelspace or paperspace layout.
+    DXFATTRIBS = DXFAttributes(base_class, DefSubclass('AcDbEntity', {
+        'paperspace': DXFAttr(67, default=0, optional=True),
+    }))
 
     def __init__(self, doc: 'Drawing' = None):
         """ Default constructor """
@@ -1119,10 +1449,10 @@ class DXFTagStorage(DXFEntity):
         self.DXFTYPE = self.base_class[0].value
         try:
             acdb_entity = tags.get_subclass('AcDbEntity')
-            self.dxf.__dict__['paperspace'] = acdb_entity.get_first_value(67, 0)
+            self.dxf._store('paperspace', int(acdb_entity.get_first_value(67, 0)))
         except DXFKeyError:
             # just fake it
-            self.dxf.__dict__['paperspace'] = 0
+            self.dxf._store('paperspace', 0)
 
     def export_entity(self, tagwriter: 'TagWriter') -> None:
         """ Write subclass tags as they are
@@ -35,6 +35,7 @@ class Ellipse(DXFGraphic):
     """ DXF ELLIPSE entity """
     DXFTYPE = 'ELLIPSE'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_ellipse)
+    EXPORT_CACHE = True
     MIN_DXF_VERSION_FOR_EXPORT = DXF2000
 
     def load_dxf_attribs(self, processor: SubclassProcessor = None) -> 'DXFNamespace':
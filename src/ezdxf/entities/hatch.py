@@ -502,6 +502,7 @@ class Hatch(DXFGraphic):
         if factor != 1 or angle:
             lines = pattern.scale_pattern(lines, factor=factor, angle=angle)
         self.pattern = Pattern([PatternLine(line[0], line[1], line[2], line[3]) for line in lines])
+        self.set_modified()
 
     def set_pattern_scale(self, scale: float) -> None:
         """
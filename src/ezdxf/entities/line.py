@@ -28,6 +28,7 @@ class Line(DXFGraphic):
     """ The LINE entity represents a 3D line from `start` to `end` """
     DXFTYPE = 'LINE'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_line)
+    EXPORT_CACHE = True
 
     def load_dxf_attribs(self, processor: SubclassProcessor = None) -> 'DXFNamespace':
         """
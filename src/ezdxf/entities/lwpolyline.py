@@ -51,6 +51,7 @@ class LWPolyline(DXFGraphic):
     """ DXF LWPOLYLINE entity """
     DXFTYPE = 'LWPOLYLINE'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_lwpolyline)
+    EXPORT_CACHE = True
     MIN_DXF_VERSION_FOR_EXPORT = DXF2000
 
     def __init__(self, doc: 'Drawing' = None):
@@ -159,10 +160,12 @@ class LWPolyline(DXFGraphic):
 
         """
         self.lwpoints[index] = compile_array(value)
+        self.set_modified()
 
     def __delitem__(self, index: int) -> None:
         """ Delete point at position `index`, supports extended slicing. """
         del self.lwpoints[index]
+        self.set_modified()
 
     def vertices(self) -> Iterable[Tuple[float, float]]:
         """
@@ -203,6 +206,7 @@ class LWPolyline(DXFGraphic):
 
         """
         self.lwpoints.append(point, format=format)
+        self.set_modified()
 
     def insert(self, pos: int, point: Sequence[float], format: str = DEFAULT_FORMAT) -> None:
         """
@@ -218,6 +222,7 @@ class LWPolyline(DXFGraphic):
         """
         data = compile_array(point, format=format)
         self.lwpoints.insert(pos, data)
+        self.set_modified()
 
     def append_points(self, points: Iterable[Sequence[float]], format: str = DEFAULT_FORMAT) -> None:
         """
@@ -232,6 +237,7 @@ class LWPolyline(DXFGraphic):
         """
         for point in points:
             self.lwpoints.append(point, format=format)
+        self.set_modified()
 
     @contextmanager
     def points(self, format: str = DEFAULT_FORMAT) -> List[Sequence[float]]:
@@ -278,6 +284,7 @@ class LWPolyline(DXFGraphic):
     def clear(self) -> None:
         """ Remove all points. """
         self.lwpoints.clear()
+        self.set_modified()
 
     def transform(self, m: 'Matrix44') -> 'LWPolyline':
         """ Transform LWPOLYLINE entity by transformation matrix `m` inplace.
@@ -30,6 +30,7 @@ class Point(DXFGraphic):
     """ DXF POINT entity """
     DXFTYPE = 'POINT'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_point)
+    EXPORT_CACHE = True
 
     def load_dxf_attribs(self, processor: SubclassProcessor = None) -> 'DXFNamespace':
         """ Loading interface. (internal API) """
@@ -32,6 +32,7 @@ class Shape(DXFGraphic):
     """ DXF SHAPE entity """
     DXFTYPE = 'SHAPE'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_shape)
+    EXPORT_CACHE = True
 
     def load_dxf_attribs(self, processor: SubclassProcessor = None) -> 'DXFNamespace':
         dxf = super().load_dxf_attribs(processor)
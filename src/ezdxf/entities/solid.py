@@ -27,6 +27,8 @@ acdb_trace = DefSubclass('AcDbTrace', {
 
 
 class _Base(DXFGraphic):
+    EXPORT_CACHE = True
+
     def __getitem__(self, num):
         return self.dxf.get(VERTEXNAMES[num])
 
@@ -65,6 +65,7 @@ class Text(DXFGraphic):
     """ DXF TEXT entity """
     DXFTYPE = 'TEXT'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_text, acdb_text2)
+    EXPORT_CACHE = True
     # horizontal align values
     LEFT = 0
     CENTER = 1
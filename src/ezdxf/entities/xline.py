@@ -25,6 +25,7 @@ class XLine(DXFGraphic):
     """ DXF XLINE entity """
     DXFTYPE = 'XLINE'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_xline)
+    EXPORT_CACHE = True
     MIN_DXF_VERSION_FOR_EXPORT = DXF2000
     XLINE_SUBCLASS = 'AcDbXline'
 
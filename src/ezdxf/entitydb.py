@@ -2,7 +2,7 @@
 # Created: 2019-02-14
 # Copyright (c) 2019-2020, Manfred Moitzi
 # License: MIT License
-from typing import Optional, Iterable, Tuple, TYPE_CHECKING
+from typing import Optional, Iterable, Tuple, TYPE_CHECKING, List, Dict
 from ezdxf.tools.handle import HandleGenerator
 from ezdxf.lldxf.types import is_valid_handle
 from ezdxf.entities.dxfentity import DXFEntity
@@ -12,6 +12,7 @@ from ezdxf.lldxf.const import DXFInternalEzdxfError
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import TagWriter
+    from ezdxf.audit.auditor import ChangeTracker
 
 DATABASE_EXCLUDE = {'SECTION', 'ENDSEC', 'EOF', 'TABLE', 'ENDTAB', 'CLASS', 'ACDSRECORD', 'ACDSSCHEMA'}
 
@@ -28,6 +29,8 @@ class EntityDB:
         self._database = {}
         self.handles = HandleGenerator()
         self.locked = False  # for debugging
+        # records changes for the incremental audit, see Auditor.run()
+        self.tracker: Optional['ChangeTracker'] = None
 
     def __getitem__(self, handle: str) -> DXFEntity:
         """ Get entity by `handle`. """
@@ -43,9 +46,13 @@ class EntityDB:
         if handle == '0' or not is_valid_handle(handle):
             raise ValueError(f'Invalid handle {handle}.')
         self._database[handle] = entity
+        if self.tracker is not None:
+            self.tracker.add(entity)
 
     def __delitem__(self, handle: str) -> None:
         """ Delete entity by `handle`. Removes entity only from database, does not destroy the entity. """
+        if self.tracker is not None:
+            self.tracker.delete(handle, self._database[handle])
         del self._database[handle]
 
     def __contains__(self, handle: str) -> bool:
@@ -72,6 +79,17 @@ class EntityDB:
             if handle not in self._database:  # you can not trust $HANDSEED value
                 return handle
 
+    def next_handles(self, count: int) -> List[str]:
+        """ Returns the next `count` unique handles, allocated as block. (internal API)
+
+        .. versionadded:: 0.14
+
+        """
+        handles = [handle for handle in self.handles.take(count) if handle not in self._database]
+        while len(handles) < count:  # you can not trust $HANDSEED value
+            handles.append(self.next_handle())
+        return handles
+
     def keys(self) -> Iterable[str]:
         """ Iterable of all handles. """
         return self._database.keys()
@@ -105,12 +123,41 @@ class EntityDB:
         if hasattr(entity, 'add_sub_entities_to_entitydb'):
             entity.add_sub_entities_to_entitydb()
 
+    def add_entities(self, entities: Iterable[DXFEntity]) -> None:
+        """ Add multiple `entities` to database, the new handles for all entities without a handle are allocated
+        as block. Use this method for mass insertion.
+
+        .. versionadded:: 0.14
+
+        """
+        entities = list(entities)
+        unassigned = [
+            entity for entity in entities if entity.dxf.handle is None and entity.dxftype() not in DATABASE_EXCLUDE
+        ]
+        for entity, handle in zip(unassigned, self.next_handles(len(unassigned))):
+            entity.update_handle(handle)
+        for entity in entities:
+            self.add(entity)
+
     def delete_entity(self, entity: DXFEntity) -> None:
         """ Removes `entity` from database and destroys the `entity`. """
         if entity.is_alive:
             del self[entity.dxf.handle]
             entity.destroy()
 
+    def delete_entities(self, entities: Iterable[DXFEntity]) -> None:
+        """ Removes multiple `entities` from database and destroys them. Does not unlink the `entities` from
+        their layouts, use :meth:`~ezdxf.layouts.BaseLayout.delete_entities` to remove graphical entities
+        from layout and database.
+
+        .. versionadded:: 0.14
+
+        """
+        for entity in entities:
+            if entity.is_alive:
+                del self[entity.dxf.handle]
+                entity.destroy()
+
     def duplicate_entity(self, entity: DXFEntity) -> DXFEntity:
         """
         Duplicates `entity` and its sub entities (VERTEX, ATTRIB, SEQEND) and store them with new handles in the
@@ -156,7 +203,7 @@ class EntityDB:
                 add_entities.append(entity)
 
         for handle in remove_handles:
-            del db[handle]
+            del self[handle]
 
         for entity in add_entities:
             handle = entity.dxf.get('handle')
@@ -183,15 +230,39 @@ class EntitySpace:
     The :class:`~ezdxf.layouts.Modelspace`, any :class:`~ezdxf.layouts.Paperspace` layout and
     :class:`~ezdxf.layouts.BlockLayout` objects have an :class:`EntitySpace` container to store their entities.
 
+    Removing an entity is a constant time operation, the removed entity is replaced by a tombstone (``None``)
+    and the container is compacted lazily at the next iteration, index access or export. Removing entities while
+    iterating the :class:`EntitySpace` is safe.
+
     """
 
     def __init__(self, entities=None):
         entities = entities or []
-        self.entities = list(e for e in entities if e.is_alive)
+        self._entities: List[Optional['DXFEntity']] = list(e for e in entities if e.is_alive)
+        # maps id(entity) to position in _entities, an entity is stored only once
+        self._positions: Dict[int, int] = {id(e): index for index, e in enumerate(self._entities)}
+        self._tombstones = 0
+
+    @property
+    def entities(self) -> List['DXFEntity']:
+        """ Compacted list of all stored entities. (internal API) """
+        self._compact()
+        return self._entities
+
+    def _compact(self) -> None:
+        """ Remove tombstones and rebuild the position map, creates a new list to not disturb running iterators. """
+        if self._tombstones:
+            self._entities = [e for e in self._entities if e is not None]
+            self._update_positions()
+
+    def _update_positions(self) -> None:
+        self._positions = {id(e): index for index, e in enumerate(self._entities)}
+        self._tombstones = 0
 
     def __iter__(self) -> Iterable['DXFEntity']:
         """ Iterable of all entities. """
-        return (e for e in self.entities if e.is_alive)
+        self._compact()
+        return (e for e in self._entities if e is not None and e.is_alive)
 
     def __getitem__(self, index) -> 'DXFEntity':
         """ Get entity at index `item`
@@ -205,7 +276,11 @@ class EntitySpace:
 
     def __len__(self) -> int:
         """ Count of entities. """
-        return len(self.entities)
+        return len(self._entities) - self._tombstones
+
+    def __contains__(self, entity: 'DXFEntity') -> bool:
+        """ ``True`` if `entity` is stored and alive. """
+        return id(entity) in self._positions and entity.is_alive
 
     def has_handle(self, handle: str) -> bool:
         """ ``True`` if `handle` is present. """
@@ -214,7 +289,8 @@ class EntitySpace:
 
     def purge(self):
         """ Remove deleted entities. """
-        self.entities = list(self)
+        self._entities = list(self)
+        self._update_positions()
 
     def reorder(self, order: int = 1) -> None:
         """ Reorder entities in place.
@@ -231,11 +307,17 @@ class EntitySpace:
             return  # do nothing
 
         self.entities.sort(key=lambda e: e.priority, reverse=reverse)
+        self._update_positions()
 
     def add(self, entity: 'DXFEntity') -> None:
         """ Add `entity`. """
         assert isinstance(entity, DXFEntity), type(entity)
-        self.entities.append(entity)
+        key = id(entity)
+        if key in self._positions:  # entity is already stored, keep last location
+            self._entities[self._positions[key]] = None
+            self._tombstones += 1
+        self._positions[key] = len(self._entities)
+        self._entities.append(entity)
 
     def extend(self, entities: Iterable['DXFEntity']) -> None:
         """ Add multiple `entities`."""
@@ -275,10 +357,27 @@ class EntitySpace:
                 entity.export_seqend(tagwriter)
 
     def remove(self, entity: 'DXFEntity') -> None:
-        """ Remove `entity`. """
-        self.entities.remove(entity)
+        """ Remove `entity`, raises :class:`ValueError` if `entity` is not stored in this :class:`EntitySpace`. """
+        try:
+            index = self._positions.pop(id(entity))
+        except KeyError:
+            raise ValueError('EntitySpace does not contain entity.')
+        self._entities[index] = None
+        self._tombstones += 1
+
+    def remove_entities(self, entities: Iterable['DXFEntity']) -> None:
+        """ Remove multiple `entities`, raises :class:`ValueError` if any entity is not stored in this
+        :class:`EntitySpace`.
+
+        .. versionadded:: 0.14
+
+        """
+        for entity in entities:
+            self.remove(entity)
 
     def clear(self) -> None:
         """ Remove all entities. """
         # do not delete database objects - entity space just manage handles
-        self.entities = list()
+        self._entities = list()
+        self._positions = dict()
+        self._tombstones = 0
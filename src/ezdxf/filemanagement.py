@@ -3,15 +3,20 @@
 # Copyright (C) 2018-2020, Manfred Moitzi
 # License: MIT License
 # Local imports to avoid cyclic import
-from typing import TextIO, TYPE_CHECKING, Union, Sequence
+from typing import TextIO, TYPE_CHECKING, Union, Sequence, Dict, Tuple, Any, Optional
 import base64
 import io
+import pickle
+from ezdxf.options import options
 from ezdxf.tools.standards import setup_drawing
-from ezdxf.lldxf.const import DXF12, DXF2013
+from ezdxf.lldxf.const import DXF12, DXF2013, acad_release_to_dxf_version
 from ezdxf.drawing import Drawing
+from ezdxf.sections.header import HeaderVar
+from ezdxf.math import Vector
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import DXFInfo
+    from ezdxf.lldxf.selection import EntitySelection
 
 
 def new(dxfversion: str = DXF2013, setup: Union[str, bool, Sequence[str]] = None) -> 'Drawing':
@@ -54,14 +59,88 @@ def new(dxfversion: str = DXF2013, setup: Union[str, bool, Sequence[str]] = None
                ``visualstyles``       setup 25 standard visual styles
                ====================== ======================================================
 
+    .. versionchanged:: 0.14
+
+        copy new documents from prebuilt templates if option :attr:`ezdxf.options.use_document_templates`
+        is ``True``
+
     """
+    if options.use_document_templates:
+        return _new_from_template(dxfversion, setup)
     doc = Drawing.new(dxfversion)
     if setup:
         setup_drawing(doc, topics=setup)
     return doc
 
 
-def read(stream: TextIO, legacy_mode: bool = False, filter_stack=None) -> 'Drawing':
+class DocumentTemplate:
+    """ Compact binary snapshot of a new document, :meth:`new` creates copies with a new creation date and
+    new GUIDs. Immutable objects like header variables and vectors are shared by all copies. (internal class)
+    """
+    SHARED_TYPES = (HeaderVar, Vector)
+
+    def __init__(self, doc: 'Drawing'):
+        self._shared = []
+        stream = io.BytesIO()
+        pickler = pickle.Pickler(stream, protocol=pickle.HIGHEST_PROTOCOL)
+        pickler.persistent_id = self._persistent_id
+        pickler.dump(doc)
+        self._snapshot = stream.getvalue()
+
+    def _persistent_id(self, obj: Any) -> Optional[int]:
+        if type(obj) in self.SHARED_TYPES:
+            self._shared.append(obj)
+            return len(self._shared) - 1
+        return None
+
+    def new(self) -> 'Drawing':
+        unpickler = pickle.Unpickler(io.BytesIO(self._snapshot))
+        unpickler.persistent_load = self._shared.__getitem__
+        doc = unpickler.load()
+        doc._setup_metadata()
+        return doc
+
+
+# Templates of new documents, key is (dxfversion, setup topics)
+_DOCUMENT_TEMPLATES: Dict[Tuple[str, Tuple[str, ...]], DocumentTemplate] = dict()
+
+
+def _template_key(dxfversion: str, setup: Union[str, bool, Sequence[str]]) -> Tuple[str, Tuple[str, ...]]:
+    dxfversion = dxfversion.upper()
+    dxfversion = acad_release_to_dxf_version.get(dxfversion, dxfversion)
+    if not setup:
+        topics = tuple()
+    elif setup in ('all', True):
+        topics = ('all',)
+    else:
+        topics = tuple(t.lower() for t in setup)
+    return dxfversion, topics
+
+
+def _new_from_template(dxfversion: str, setup: Union[str, bool, Sequence[str]]) -> 'Drawing':
+    key = _template_key(dxfversion, setup)
+    template = _DOCUMENT_TEMPLATES.get(key)
+    if template is None:
+        doc = Drawing.new(dxfversion)
+        if setup:
+            setup_drawing(doc, topics=setup)
+        # the first document is returned, all following documents are copies of the template
+        _DOCUMENT_TEMPLATES[key] = DocumentTemplate(doc)
+        return doc
+    return template.new()
+
+
+def clear_document_templates() -> None:
+    """ Clear all prebuilt templates used by :func:`new`, required after changing global options which
+    affect the setup of new documents, like :attr:`ezdxf.options.default_text_style`.
+
+    .. versionadded:: 0.14
+
+    """
+    _DOCUMENT_TEMPLATES.clear()
+
+
+def read(stream: TextIO, legacy_mode: bool = False, filter_stack=None, selection: 'EntitySelection' = None) -> 'Drawing':
     """
     Read DXF drawing from a text-stream. Open stream in text mode (``mode='rt'``) and the correct encoding has to be
     set at the open function, the stream requires at least a :meth:`readline` method. Since DXF version R2007 (AC1021)
@@ -75,6 +154,8 @@ def read(stream: TextIO, legacy_mode: bool = False, filter_stack=None) -> 'Drawi
         stream: input text stream opened with correct encoding, requires only a :meth:`readline` method.
         legacy_mode: adds an extra trouble shooting import layer if ``True``
         filter_stack: interface to put filters between reading layers
+        selection: :class:`~ezdxf.lldxf.selection.EntitySelection` to load only selected entities of the
+            modelspace and paperspace layouts, see :ref:`selective_loading`
 
     Raises:
         DXFStructureError: for invalid DXF structure
@@ -82,10 +163,11 @@ def read(stream: TextIO, legacy_mode: bool = False, filter_stack=None) -> 'Drawi
     """
     from ezdxf.drawing import Drawing
 
-    return Drawing.read(stream, legacy_mode=legacy_mode, filter_stack=filter_stack)
+    return Drawing.read(stream, legacy_mode=legacy_mode, filter_stack=filter_stack, selection=selection)
 
 
-def readfile(filename: str, encoding: str = None, legacy_mode: bool = False, filter_stack=None) -> 'Drawing':
+def readfile(filename: str, encoding: str = None, legacy_mode: bool = False, filter_stack=None,
+             selection: 'EntitySelection' = None) -> 'Drawing':
     """
     Read DXF document specified by `filename` from file-system.
 
@@ -108,6 +190,8 @@ def readfile(filename: str, encoding: str = None, legacy_mode: bool = False, fil
                   Binary DXF files
         legacy_mode: adds an extra trouble shooting import layer if ``True``
         filter_stack: interface to put filters between reading layers
+        selection: :class:`~ezdxf.lldxf.selection.EntitySelection` to load only selected entities of the
+            modelspace and paperspace layouts, see :ref:`selective_loading`
 
     Raises:
         IOError: File `filename` is not a DXF file or does not exist.
@@ -123,7 +207,7 @@ def readfile(filename: str, encoding: str = None, legacy_mode: bool = False, fil
         with open(filename, 'rb') as fp:
             data = fp.read()
             loader = binary_tags_loader(data)
-            return Drawing.load(loader, legacy_mode, filter_stack)
+            return Drawing.load(loader, legacy_mode, filter_stack, selection)
 
     if not is_dxf_file(filename):
         raise IOError("File '{}' is not a DXF file.".format(filename))
@@ -133,7 +217,7 @@ def readfile(filename: str, encoding: str = None, legacy_mode: bool = False, fil
         # override default encodings if absolute necessary
         info.encoding = encoding
     with open(filename, mode='rt', encoding=info.encoding, errors='ignore') as fp:
-        doc = read(fp, legacy_mode=legacy_mode, filter_stack=filter_stack)
+        doc = read(fp, legacy_mode=legacy_mode, filter_stack=filter_stack, selection=selection)
 
     doc.filename = filename
     if encoding is not None and is_supported_encoding(encoding):
@@ -130,6 +130,20 @@ class BaseLayout(CreatorInterface):
 
         self.block_record.add_entity(entity)
 
+    def add_entities(self, entities: Iterable['DXFGraphic']) -> None:
+        """
+        Add multiple existing :class:`DXFGraphic` entities to a layout, same requirements as for
+        :meth:`add_entity`. Use this method for mass insertion.
+
+        .. versionadded:: 0.14
+
+        """
+        entities = list(entities)
+        doc = self.doc
+        if any(entity.doc != doc for entity in entities):
+            raise DXFStructureError('Adding entities from a different DXF drawing is not supported.')
+        self.block_record.add_entities(entities)
+
     def add_foreign_entity(self, entity: 'DXFGraphic', copy=True) -> None:
         """
         Add a foreign DXF entity to a layout, this foreign entity could be from another DXF document or an entity
@@ -230,8 +244,19 @@ class BaseLayout(CreatorInterface):
         layout.
         """
         # noinspection PyTypeChecker
-        for entity in list(self):  # temp list, because delete modifies the base data structure of the iterator
-            self.delete_entity(entity)
+        self.delete_entities(self)
+
+    def delete_entities(self, entities: Iterable['DXFGraphic']) -> None:
+        """
+        Delete multiple `entities` from layout entity space and the entity database, this destroys the
+        `entities`. Runs in linear time, use this method for mass deletion.
+
+        .. versionadded:: 0.14
+
+        """
+        delete_entity = self.block_record.delete_entity
+        for entity in list(entities):  # temp list, because delete modifies the base data structure of the iterator
+            delete_entity(entity)
 
     def get_entity_by_handle(self, handle: str) -> 'DXFGraphic':
         """
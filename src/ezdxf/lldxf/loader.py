@@ -3,6 +3,7 @@
 # Copyright (c) 2018-2019, Manfred Moitzi
 # License: MIT License
 import logging
+import time
 from typing import Callable, Dict, Iterable, List, Union, TYPE_CHECKING
 from collections import OrderedDict
 
@@ -12,10 +13,12 @@ from .extendedtags import ExtendedTags
 from .validator import entity_structure_validator
 
 from ezdxf.options import options
+from ezdxf.tools.profiler import active_profiler
 
 if TYPE_CHECKING:  # import forward declarations
     from ezdxf.entities.factory import EntityFactory
     from ezdxf.entities.dxfentity import DXFEntity
+    from ezdxf.lldxf.selection import EntitySelection
 
 logger = logging.getLogger('ezdxf')
 
@@ -26,7 +29,8 @@ legacy_post_load_tag_processors = {}  # type: Dict[str, TagProcessor]
 SectionDict = Dict[str, List[Union[Tags, ExtendedTags]]]
 
 
-def load_dxf_structure(tagger: Iterable[DXFTag], ignore_missing_eof: bool = False) -> SectionDict:
+def load_dxf_structure(tagger: Iterable[DXFTag], ignore_missing_eof: bool = False,
+                       selection: 'EntitySelection' = None) -> SectionDict:
     """
     Divide input tag stream from tagger into DXF structure entities. Each DXF structure entity starts with a DXF
     structure (0, ...) tag, and ends before the next DXF structure tag.
@@ -54,6 +58,7 @@ def load_dxf_structure(tagger: Iterable[DXFTag], ignore_missing_eof: bool = Fals
     Args:
         tagger: generates DXFTag() entities from input data
         ignore_missing_eof: raises DXFStructureError() if False and EOF tag is not present, set to True only in tests
+        selection: :class:`~ezdxf.lldxf.selection.EntitySelection` to skip unwanted entities while grouping
 
     Returns:
         dict of sections, each section is a list of DXF structure entities as Tags() objects
@@ -72,6 +77,7 @@ def load_dxf_structure(tagger: Iterable[DXFTag], ignore_missing_eof: bool = Fals
 
     sections = OrderedDict()  # type: SectionDict
     section = []  # type: List[Tags]
+    section_name = ''
     eof = False
     # todo: possible improvement - ignore all end of structure tags
     # a (0, SECTION) tag could start a new section even without a preceding (0, ENDSEC) tag
@@ -84,6 +90,7 @@ def load_dxf_structure(tagger: Iterable[DXFTag], ignore_missing_eof: bool = Fals
             if len(section):
                 logger.warning('DXF Structure Warning: found tags outside a SECTION, ignored by ezdxf.')
             section = [entity]
+            section_name = entity[1].value if len(entity) > 1 else ''
         elif tag == (0, 'ENDSEC'):  # not collected
             if outside_section():
                 # todo: just log
@@ -99,21 +106,25 @@ def load_dxf_structure(tagger: Iterable[DXFTag], ignore_missing_eof: bool = Fals
             if eof:
                 logger.warning('DXF Structure Warning: found more than one EOF tags.')
             eof = True
-        else:
+        elif selection is None or selection.accept(section_name, entity):
             section.append(entity)
     if inside_section():
         # todo: just log
         raise DXFStructureError("DXFStructureError: missing ENDSEC tag.")
     if not eof and not ignore_missing_eof:
         raise DXFStructureError('DXFStructureError: missing EOF tag.')
+    if selection is not None:
+        selection.finalize(sections)
     return sections
 
 
 EXCLUDE_STRUCTURE_CHECK = {'SECTION', 'ENDSEC', 'EOF', 'TABLE', 'ENDTAB', 'CLASS', 'ACDSRECORD', 'ACDSSCHEMA'}
 
 
-def load_dxf_entities(dxf_entities: List[Tags], factory: 'EntityFactory') -> Iterable['DXFEntity']:
-    check_tag_structure = options.check_entity_tag_structures
+def load_dxf_entities(dxf_entities: List[Tags], factory: 'EntityFactory',
+                      check_tag_structure: bool = None) -> Iterable['DXFEntity']:
+    if check_tag_structure is None:
+        check_tag_structure = options.check_entity_tag_structures
     for entity in dxf_entities:
         if len(entity) == 0:
             raise DXFStructureError('Invalid empty DXF entity.')
@@ -123,15 +134,23 @@ def load_dxf_entities(dxf_entities: List[Tags], factory: 'EntityFactory') -> Ite
 
         if check_tag_structure and (dxftype not in EXCLUDE_STRUCTURE_CHECK):
             entity = entity_structure_validator(entity)
-        yield factory.load(entity)
+        profiler = active_profiler()
+        if profiler is None:
+            yield factory.load(entity)
+        else:
+            memory = profiler.traced_memory()
+            t0 = time.perf_counter()
+            dxf_entity = factory.load(entity)
+            profiler.entity_loaded(dxftype, time.perf_counter() - t0, profiler.traced_memory() - memory)
+            yield dxf_entity
 
 
-def fill_database(sections: Dict, factory: 'EntityFactory') -> None:
+def fill_database(sections: Dict, factory: 'EntityFactory', check_tag_structure: bool = None) -> None:
     # CLASSES and HEADER have no EntityDB entries.
     for name in ['TABLES', 'CLASSES', 'ENTITIES', 'BLOCKS', 'OBJECTS']:
         if name in sections:
             section = sections[name]
             # entities stored in the database are converted from Tags() to ExtendedTags()
-            for index, entity in enumerate(load_dxf_entities(section, factory)):
+            for index, entity in enumerate(load_dxf_entities(section, factory, check_tag_structure)):
                 # all entities are DXFEntity or inherited
                 section[index] = entity
@@ -1,11 +1,12 @@
 # Created: 05.03.2016
-# Copyright (c) 2016-2019, Manfred Moitzi
+# Copyright (c) 2016-2020, Manfred Moitzi
 # License: MIT License
-from typing import Iterable, Optional, List, TYPE_CHECKING
+from typing import Iterable, Optional, List, FrozenSet, Tuple, TYPE_CHECKING
 from functools import partial
 import logging
 from .tags import DXFTag
 from .types import POINT_CODES
+from .validator import entity_structure_validator
 
 logger = logging.getLogger('ezdxf')
 
@@ -140,3 +141,153 @@ def filter_invalid_xdata_group_codes(tagger: Iterable[DXFTag]) -> Iterable[DXFTa
     for tag in tagger:
         if tag.code < 1000 or tag.code in VALID_XDATA_CODES:
             yield tag
+
+
+# Fixes applied by the fused_repair_layer():
+FIX_LINE_COORDINATE_ORDER = 'fix_line_coordinate_order'
+FIX_INVALID_YZ_POINT_CODES = 'filter_invalid_yz_point_codes'
+# The DXF version and the existence of handles are no evidence for well ordered coordinates, and the
+# checks of both fixes are cheap, therefore all fixes are always applied:
+ALL_FIXES = frozenset([FIX_LINE_COORDINATE_ORDER, FIX_INVALID_YZ_POINT_CODES])
+
+# Entities of these sections are validated by the entity_structure_validator(), except
+# loader.EXCLUDE_STRUCTURE_CHECK entities:
+VALIDATED_SECTIONS = {'TABLES', 'CLASSES', 'ENTITIES', 'BLOCKS', 'OBJECTS'}
+
+
+class RepairReport:
+    """ Report of the fused repair stage: applied fixes and fix counters, the time spent in each loading stage is
+    recorded by the :func:`ezdxf.tools.profiler.profile_phases` profiler.
+    """
+
+    def __init__(self):
+        self.fixes = frozenset()  # type: FrozenSet[str]
+        self.fixed_entities = 0
+        self.removed_tags = 0
+
+    def __str__(self) -> str:
+        lines = [
+            f'Fixes: {", ".join(sorted(self.fixes)) or "none"}',
+            f'Fixed entities: {self.fixed_entities}, removed tags: {self.removed_tags}',
+        ]
+        return '\n'.join(lines)
+
+
+def fused_repair_layer(tagger: Iterable[DXFTag], fixes: FrozenSet[str], validate: bool = True,
+                       report: RepairReport = None) -> Iterable[DXFTag]:
+    """
+    Applies the selected `fixes` and validates the entity tag structures in a single pass, replaces the chained
+    filters :func:`tag_reorder_layer` and :func:`filter_invalid_yz_point_codes` and the entity structure
+    validation of the loader.
+
+    LINE entities are only reordered if the coordinates are really out of order and only entities with APP DATA
+    or XDATA tags are validated, because the structure of all other entities is valid.
+
+    Input Raw tag filter
+
+    Args:
+        tagger: low level tagger
+        fixes: fixes to apply, legacy mode loading applies :data:`ALL_FIXES`
+        validate: validate entity tag structures by :func:`~ezdxf.lldxf.validator.entity_structure_validator`
+        report: :class:`RepairReport` to store fix counters
+
+    Raises:
+        DXFAppDataError: invalid APP DATA structure
+        DXFXDataError: invalid XDATA structure
+
+    """
+    from .loader import EXCLUDE_STRUCTURE_CHECK
+    reorder_lines = FIX_LINE_COORDINATE_ORDER in fixes
+    filter_yz = FIX_INVALID_YZ_POINT_CODES in fixes
+    fix_line = COORDINATE_FIXING_TOOLBOX['LINE']
+    invalid_codes = INVALID_CODES
+    x_codes = X_CODES
+    line_codes = LINE_COORDINATE_CODES
+    fixed_entities = 0
+    removed_tags = 0
+    section = None
+    entity = []  # type: List[DXFTag]
+    removed = 0  # removed tags of current entity
+    raw_line = None  # type: Optional[List[DXFTag]]  # unfiltered LINE entity for reordering
+    line_coordinates = []  # type: List[Tuple[int, int]]  # (index, code) of LINE coordinates
+    check_structure = False  # entity has APP DATA or XDATA tags
+    expected_code = 0
+    point = 0
+
+    def process_entity() -> List[DXFTag]:
+        nonlocal section, fixed_entities, removed_tags
+        dxftype = entity[0].value if entity[0].code == 0 else None
+        tags = entity
+        if raw_line is not None and not _is_ordered(line_coordinates):
+            tags = fix_line(raw_line)
+            if filter_yz:
+                tags = list(filter_invalid_yz_point_codes(tags))
+            removed_tags += len(raw_line) - len(tags)
+            fixed_entities += 1
+        else:
+            removed_tags += removed
+        if dxftype == 'SECTION':
+            section = tags[1].value if len(tags) > 1 and tags[1].code == 2 else None
+        elif check_structure and section in VALIDATED_SECTIONS and dxftype not in EXCLUDE_STRUCTURE_CHECK:
+            for _ in entity_structure_validator(tags):
+                pass
+        return tags
+
+    for tag in tagger:
+        code = tag.code
+        if code == 0:
+            if entity:
+                yield from process_entity()
+            entity = [tag]
+            removed = 0
+            if reorder_lines and tag.value == 'LINE':
+                raw_line = [tag]
+                line_coordinates = []
+            else:
+                raw_line = None
+            check_structure = False
+            point = 0
+            continue
+        if raw_line is not None:
+            if code in line_codes:
+                line_coordinates.append((len(raw_line), code))
+            raw_line.append(tag)
+        if validate and (code >= 1000 or code == 102):
+            check_structure = True
+        if filter_yz:
+            if point and code == expected_code:
+                expected_code += 10
+                if expected_code - point > 20:
+                    point = 0
+            else:
+                point = 0
+                if code in invalid_codes:
+                    removed += 1
+                    continue
+                if code in x_codes:
+                    point = code
+                    expected_code = point + 10
+        entity.append(tag)
+
+    if entity:
+        yield from process_entity()
+    if report is not None:
+        report.fixed_entities += fixed_entities
+        report.removed_tags += removed_tags
+
+
+# Expected order of LINE coordinates
+LINE_COORDINATE_ORDER = (10, 20, 30, 11, 21, 31)
+LINE_COORDINATE_CODES = frozenset(LINE_COORDINATE_ORDER)
+
+
+def _is_ordered(coordinates: List[Tuple[int, int]]) -> bool:
+    """ Returns ``True`` if :func:`fix_coordinate_order` would not change a LINE entity with `coordinates` as list
+    of ``(index, code)`` tuples.
+    """
+    if not coordinates:
+        return True
+    if coordinates[-1][0] - coordinates[0][0] + 1 != len(coordinates):  # not contiguous
+        return False
+    codes = [code for _, code in coordinates]
+    return codes == [code for code in LINE_COORDINATE_ORDER if code in codes]
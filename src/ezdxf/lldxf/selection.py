@@ -0,0 +1,234 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+from typing import Iterable, Optional, List, Set, Dict, TYPE_CHECKING
+from fnmatch import fnmatchcase
+import logging
+
+from .tags import Tags
+
+logger = logging.getLogger('ezdxf')
+
+if TYPE_CHECKING:
+    from ezdxf.lldxf.loader import SectionDict
+
+__all__ = ['EntitySelection']
+
+# Sub-entities are stored after their main entity and share the selection state of the main entity:
+SUB_ENTITIES = {'VERTEX', 'ATTRIB', 'SEQEND'}
+BLOCK_REFERENCES = {'INSERT', 'DIMENSION', 'ARC_DIMENSION', 'LARGE_RADIAL_DIMENSION'}
+LAYOUT_BLOCK_PREFIXES = ('*model_space', '*paper_space')
+
+
+def is_layout_block(name: str) -> bool:
+    return name.lower().startswith(LAYOUT_BLOCK_PREFIXES)
+
+
+def entity_handle(entity: Tags) -> Optional[str]:
+    try:
+        return entity.get_handle()
+    except ValueError:  # DXF R12 without handles
+        return None
+
+
+def owner_handle(entity: Tags) -> Optional[str]:
+    """ Returns the owner handle of an entity, the owner tag (330, handle) is located in front of the first
+    subclass marker and outside of the application defined groups like ``{ACAD_REACTORS``.
+
+    """
+    inside_app_data = False
+    for code, value in entity:
+        if code == 100:
+            break
+        if code == 102:
+            inside_app_data = value.startswith('{')
+        elif code == 330 and not inside_app_data:
+            return value
+    return None
+
+
+class EntitySelection:
+    """
+    Selects the loaded graphical entities of the modelspace and paperspace layouts, for the selective loading of DXF
+    documents by :func:`ezdxf.read` and :func:`ezdxf.readfile`.
+
+    Skipped entities are removed while grouping the DXF tags into DXF structure entities and never reach the entity
+    database. All table entries are loaded, block definitions are loaded if referenced by a loaded INSERT or
+    DIMENSION entity or if required by the document structure (layout blocks, anonymous blocks and arrow blocks),
+    objects owned by skipped entities or removed blocks are also removed.
+
+    Args:
+        types: load only these DXF types e.g. ``['LWPOLYLINE', 'TEXT']``, ``None`` for all types
+        layers: load only entities on these layers, supports wildcards like ``'PARCEL*'``, layer names are case
+            insensitive, ``None`` for all layers
+        paperspace: ``True`` to load only paperspace entities, ``False`` to load only modelspace entities and
+            ``None`` for all layouts
+
+    .. versionadded:: 0.14
+
+    """
+
+    def __init__(self, types: Iterable[str] = None, layers: Iterable[str] = None, paperspace: bool = None):
+        self.types = None if types is None else frozenset(dxftype.upper() for dxftype in types)
+        self.layers = None if layers is None else [layer.lower() for layer in layers]
+        self.paperspace = paperspace
+        self.skipped = 0  # count of skipped entities, including sub-entities
+
+        self._skipped_handles: Set[str] = set()
+        self._block_names: Set[str] = set()  # block names referenced by loaded entities
+        self._nested_block_names: Dict[str, Set[str]] = dict()  # block names referenced by block definitions
+        self._selected = True  # selection state of the last main entity
+        self._current_block: Optional[str] = None  # lower case name of current BLOCK definition
+        self._current_block_is_layout = False
+
+    def is_selected(self, entity: Tags, paperspace: bool) -> bool:
+        """ Returns ``True`` if the main `entity` of a modelspace or paperspace layout should be loaded. """
+        if self.types is not None and entity.dxftype() not in self.types:
+            return False
+        if self.paperspace is not None and paperspace is not self.paperspace:
+            return False
+        if self.layers is not None:
+            layer = str(entity.get_first_value(8, '0')).lower()
+            if not any(fnmatchcase(layer, pattern) for pattern in self.layers):
+                return False
+        return True
+
+    def accept(self, section: str, entity: Tags) -> bool:
+        """ Returns ``True`` if DXF structure `entity` of `section` should be loaded. (internal API) """
+        if section == 'ENTITIES':
+            return self._accept_layout_entity(entity, paperspace=entity.get_first_value(67, 0) == 1)
+        elif section == 'BLOCKS':
+            return self._accept_block_entity(entity)
+        return True
+
+    def _accept_layout_entity(self, entity: Tags, paperspace: bool) -> bool:
+        dxftype = entity.dxftype()
+        if dxftype not in SUB_ENTITIES:
+            self._selected = self.is_selected(entity, paperspace)
+            if self._selected and dxftype in BLOCK_REFERENCES:
+                self._block_names.add(str(entity.get_first_value(2, '')).lower())
+        if not self._selected:
+            self.skipped += 1
+            handle = entity_handle(entity)
+            if handle is not None:
+                self._skipped_handles.add(handle)
+        return self._selected
+
+    def _accept_block_entity(self, entity: Tags) -> bool:
+        dxftype = entity.dxftype()
+        if dxftype == 'BLOCK':
+            self._current_block = str(entity.get_first_value(2, '')).lower()
+            self._current_block_is_layout = is_layout_block(self._current_block)
+            return True
+        elif dxftype == 'ENDBLK':
+            self._current_block = None
+            return True
+        if self._current_block_is_layout:
+            return self._accept_layout_entity(entity, paperspace=self._current_block.startswith('*paper_space'))
+        if self._current_block is not None and dxftype in BLOCK_REFERENCES:
+            self._nested_block_names.setdefault(self._current_block, set()).add(
+                str(entity.get_first_value(2, '')).lower())
+        return True
+
+    def required_blocks(self) -> Set[str]:
+        """ Returns the lower case names of all blocks referenced by loaded entities and special blocks, including
+        nested blocks.
+
+        """
+        from ezdxf.sections.blocks import is_special_block
+        required = set()
+        todo = list(self._block_names)
+        todo.extend(name for name in self._nested_block_names if is_special_block(name))
+        while todo:
+            name = todo.pop()
+            if name not in required:
+                required.add(name)
+                todo.extend(self._nested_block_names.get(name, ()))
+        return required
+
+    def finalize(self, sections: 'SectionDict') -> None:
+        """ Removes unreferenced block definitions, their BLOCK_RECORD table entries and all objects owned by
+        skipped entities, has to be called after grouping all DXF structure entities. (internal API)
+
+        """
+        from ezdxf.sections.blocks import is_special_block
+        required = self.required_blocks()
+
+        def is_required(name: str) -> bool:
+            return name in required or is_layout_block(name) or is_special_block(name)
+
+        removed_blocks = set()
+        blocks = sections.get('BLOCKS')
+        if blocks:
+            kept: List[Tags] = []
+            remove = False
+            for entity in blocks:
+                dxftype = entity.dxftype()
+                if dxftype == 'BLOCK':
+                    name = str(entity.get_first_value(2, '')).lower()
+                    remove = not is_required(name)
+                    if remove:
+                        removed_blocks.add(name)
+                if remove:
+                    handle = entity_handle(entity)
+                    if handle is not None:
+                        self._skipped_handles.add(handle)
+                else:
+                    kept.append(entity)
+                if dxftype == 'ENDBLK':
+                    remove = False
+            blocks[:] = kept
+
+        tables = sections.get('TABLES')
+        if tables and removed_blocks:
+            kept = []
+            for entity in tables:
+                if entity.dxftype() == 'BLOCK_RECORD' and \
+                        str(entity.get_first_value(2, '')).lower() in removed_blocks:
+                    handle = entity_handle(entity)
+                    if handle is not None:
+                        self._skipped_handles.add(handle)
+                else:
+                    kept.append(entity)
+            tables[:] = kept
+
+        objects = sections.get('OBJECTS')
+        if objects and self._skipped_handles:
+            self._remove_orphaned_objects(objects)
+        if removed_blocks:
+            logger.debug(f'Selective loading removed {len(removed_blocks)} unreferenced block definitions.')
+
+    def _remove_orphaned_objects(self, objects: List[Tags]) -> None:
+        skipped = self._skipped_handles
+        count = -1
+        while count != len(skipped):  # owned objects may be located in front of their owner
+            count = len(skipped)
+            kept = []
+            for entity in objects:
+                if owner_handle(entity) in skipped:
+                    handle = entity_handle(entity)
+                    if handle is not None:
+                        skipped.add(handle)
+                else:
+                    kept.append(entity)
+            objects[:] = kept
+
+        # remove references of GROUP and SORTENTSTABLE objects to skipped entities
+        for index, entity in enumerate(objects):
+            dxftype = entity.dxftype()
+            if dxftype == 'GROUP':
+                objects[index] = Tags(tag for tag in entity if not (tag.code == 340 and tag.value in skipped))
+            elif dxftype == 'SORTENTSTABLE':
+                objects[index] = Tags(self._remove_sort_handles(entity))
+
+    def _remove_sort_handles(self, entity: Tags) -> Iterable:
+        # SORTENTSTABLE stores (331, entity handle), (5, sort handle) pairs after the block record handle (330)
+        skip_sort_handle = False
+        for tag in entity:
+            if tag.code == 331 and tag.value in self._skipped_handles:
+                skip_sort_handle = True
+                continue
+            if skip_sort_handle and tag.code == 5:
+                skip_sort_handle = False
+                continue
+            skip_sort_handle = False
+            yield tag
@@ -4,6 +4,7 @@
 # License: MIT License
 from typing import Iterable, TextIO, Iterator
 import struct
+import sys
 from .types import DXFTag, DXFVertex, DXFBinaryTag
 from .types import BYTES, INT16, INT32, INT64, DOUBLE
 from .const import DXFStructureError
@@ -11,6 +12,11 @@ from .types import POINT_CODES, TYPE_TABLE, BINARY_DATA
 from ezdxf.tools.codepage import toencoding
 
 
+# string values of this group codes are repeated by many entities: structure tags, table entry names, layer,
+# linetype, text style, subclass markers, app data markers, owner handles, pointer to table entries and AppIDs
+INTERNED_CODES = {0, 2, 6, 7, 8, 100, 102, 330, 340, 347, 348, 390, 1001}
+
+
 def internal_tag_compiler(s: str) -> Iterable[DXFTag]:
     """
     Yields DXFTag() from trusted (internal) source - relies on
@@ -94,7 +100,7 @@ def ascii_tags_loader(stream: TextIO, skip_comments: bool = True) -> Iterable[DX
 def binary_tags_loader(data: bytes) -> Iterable[DXFTag]:
     """
     Yields :class:`DXFTag` or :class:`DXFBinaryTag` objects from binary DXF `data` (untrusted external source) and
-    does not optimize coordinates.
+    does not optimize coordinates. String values of frequently repeated tags are interned, see :data:`INTERNED_CODES`.
     ``DXFTag.code`` is always an ``int`` and ``DXFTag.value`` is either an unicode string,``float``,
     ``int`` or ``bytes`` for binary chunks.
 
@@ -146,6 +152,7 @@ def binary_tags_loader(data: bytes) -> Iterable[DXFTag]:
     index = 22
     data_length = len(data)
     unpack = struct.unpack_from
+    intern = sys.intern
 
     while index < data_length:
         # decode next group code
@@ -189,16 +196,18 @@ def binary_tags_loader(data: bytes) -> Iterable[DXFTag]:
                 s = data[start_index:end_index]
                 index = end_index + 1
                 value = s.decode(encoding, errors='ignore')
+                if code in INTERNED_CODES:  # share repeated string values
+                    value = intern(value)
             yield DXFTag(code, value)
 
 
 # invalid point codes if not part of a point started with 1010, 1011, 1012, 1013
 INVALID_POINT_CODES = {1020, 1021, 1022, 1023, 1030, 1031, 1032, 1033}
 
-
 def tag_compiler(tagger: Iterator[DXFTag]) -> Iterable[DXFTag]:
     """
-    Compiles DXF tag values imported by ascii_tags_loader() into Python types.
+    Compiles DXF tag values imported by ascii_tags_loader() into Python types. String values of frequently repeated
+    tags like layer or linetype names are interned, see :data:`INTERNED_CODES`.
 
     Raises DXFStructureError() for invalid float values and invalid coordinate values.
 
@@ -221,6 +230,7 @@ def tag_compiler(tagger: Iterator[DXFTag]) -> Iterable[DXFTag]:
         return 'Invalid tag (code={code}, value="{value}") near line: {line}.'.format(line=line, code=tag.code,
                                                                                       value=tag.value)
 
+    intern = sys.intern
     undo_tag = None
     line = 0
     while True:
@@ -264,7 +274,10 @@ def tag_compiler(tagger: Iterator[DXFTag]) -> Iterable[DXFTag]:
                         value = x.value.strip()
                     else:
                         value = x.value
-                    yield DXFTag(code, TYPE_TABLE.get(code, str)(value))
+                    if code in INTERNED_CODES:  # share repeated string values
+                        yield DXFTag(code, intern(str(value)))
+                    else:
+                        yield DXFTag(code, TYPE_TABLE.get(code, str)(value))
                 except ValueError:  # internal exception
                     # slow path
                     if TYPE_TABLE.get(code, str) is int:  # ProE stores int values as floats :((
@@ -1,13 +1,14 @@
 # Created: 13.01.2018
 # Copyright (c) 2018-2020, Manfred Moitzi
 # License: MIT License
-from typing import Any, TextIO, TYPE_CHECKING, Union, List, Iterable, BinaryIO
+from typing import Any, TextIO, TYPE_CHECKING, Union, List, Iterable, BinaryIO, Optional, Hashable, Tuple
 from .types import TAG_STRING_FORMAT, cast_tag_value, DXFVertex
 from .types import BYTES, INT16, INT32, INT64, DOUBLE, BINARY_DATA
 from .tags import DXFTag, Tags
 from .const import LATEST_DXF_VERSION
 from ezdxf.tools import take2
 import struct
+import io
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import ExtendedTags, DXFEntity
@@ -44,6 +45,15 @@ class TagWriter:
     def write_tag2(self, code: int, value: Any) -> None:
         self._stream.write(TAG_STRING_FORMAT % (code, value))
 
+    def write_tags2(self, tags: Iterable[Tuple[int, Any]]) -> None:
+        """ Write basic ``(code, value)`` tuples by a single write() call, the values have to be casted to the
+        type of the group code in advance, vertices have to be split into single axis values.
+
+        .. versionadded:: 0.14
+
+        """
+        self._stream.write(''.join(TAG_STRING_FORMAT % tag for tag in tags))
+
     def write_vertex(self, code: int, vertex: Iterable[float]) -> None:
         for index, value in enumerate(vertex):
             self.write_tag2(code + index * 10, value)
@@ -51,6 +61,26 @@ class TagWriter:
     def write_str(self, s: str) -> None:
         self._stream.write(s)
 
+    def write_raw(self, data: str) -> None:
+        """ Write pre-encoded `data` created by a :meth:`buffered_writer` with the same
+        :meth:`export_cache_key`.
+        """
+        self._stream.write(data)
+
+    def export_cache_key(self) -> Optional[Hashable]:
+        """ Returns a key for all options which affect the output, ``None`` if export caching is not supported. """
+        return 'ASCII', self.dxfversion, self.write_handles, self.force_optional
+
+    def buffered_writer(self) -> 'TagWriter':
+        """ Returns a new tag writer with the same options, which writes into a memory buffer. """
+        writer = TagWriter(io.StringIO(), self.dxfversion, self.write_handles)
+        writer.force_optional = self.force_optional
+        return writer
+
+    def getvalue(self) -> str:
+        """ Returns the content of the memory buffer of a :meth:`buffered_writer`. """
+        return self._stream.getvalue()
+
 
 class BinaryTagWriter(TagWriter):
     """
@@ -102,62 +132,77 @@ class BinaryTagWriter(TagWriter):
         for code, value in take2(data):
             self.write_tag2(int(code), value)
 
+    def write_raw(self, data: bytes) -> None:
+        self._stream.write(data)
+
+    def export_cache_key(self) -> Optional[Hashable]:
+        return 'BINARY', self.dxfversion, self.write_handles, self.force_optional, self._encoding
+
+    def buffered_writer(self) -> 'BinaryTagWriter':
+        writer = BinaryTagWriter(io.BytesIO(), self.dxfversion, self.write_handles, self._encoding)
+        writer.force_optional = self.force_optional
+        return writer
+
     def write_tag2(self, code: int, value: Any) -> None:
+        self._stream.write(self._encode_tag(code, value))
+
+    def write_tags2(self, tags: Iterable[Tuple[int, Any]]) -> None:
+        encode = self._encode_tag
+        self._stream.write(b''.join(encode(code, value) for code, value in tags))
+
+    def _encode_tag(self, code: int, value: Any) -> bytes:
         # Binary DXF files do not support comments!
         assert code != 999
         if code in BINARY_DATA:
-            self._write_binary_chunks(code, value)
-            return
-        stream = self._stream
+            return self._encode_binary_chunks(code, value)
 
-        # write group code
+        # encode group code
         if self._r12:
             # Special group code handling if DXF R12 and older
             if code >= 1000:  # extended data
-                stream.write(b'\xff')
                 # always 2-byte group code for extended data
-                stream.write(code.to_bytes(2, 'little'))
+                group_code = b'\xff' + code.to_bytes(2, 'little')
             else:
-                stream.write(code.to_bytes(1, 'little'))
+                group_code = code.to_bytes(1, 'little')
         else:  # for R2000+ do not need a leading 0xff in front of extended data
-            stream.write(code.to_bytes(2, 'little'))
-        # write tag content
+            group_code = code.to_bytes(2, 'little')
+        # encode tag content
         if code in BYTES:
-            stream.write(int(value).to_bytes(1, 'little'))
+            return group_code + int(value).to_bytes(1, 'little')
         elif code in INT16:
-            stream.write(int(value).to_bytes(2, 'little', signed=True))
+            return group_code + int(value).to_bytes(2, 'little', signed=True)
         elif code in INT32:
-            stream.write(int(value).to_bytes(4, 'little', signed=True))
+            return group_code + int(value).to_bytes(4, 'little', signed=True)
         elif code in INT64:
-            stream.write(int(value).to_bytes(8, 'little', signed=True))
+            return group_code + int(value).to_bytes(8, 'little', signed=True)
         elif code in DOUBLE:
-            stream.write(struct.pack('<d', float(value)))
-        else:  # write zero terminated string
-            stream.write(str(value).encode(self._encoding, errors='dxfreplace'))
-            stream.write(b'\x00')
+            return group_code + struct.pack('<d', float(value))
+        else:  # zero terminated string
+            return group_code + str(value).encode(self._encoding, errors='dxfreplace') + b'\x00'
 
-    def _write_binary_chunks(self, code: int, data: bytes) -> None:
+    def _encode_binary_chunks(self, code: int, data: bytes) -> bytes:
         # Split binary data into small chunks, 127 bytes is the
         # regular size of binary data in ASCII DXF files.
         CHUNK_SIZE = 127
         index = 0
         size = len(data)
-        stream = self._stream
+        chunks = []
 
         while index < size:
             # write group code
             if self._r12 and code >= 1000:  # extended data, just 1004?
-                stream.write(b'\xff')  # extended data marker
+                chunks.append(b'\xff')  # extended data marker
             # binary data does not exist in regular R12 entities,
             # only 2-byte group codes required
-            stream.write(code.to_bytes(2, 'little'))
+            chunks.append(code.to_bytes(2, 'little'))
 
             # write max CHUNK_SIZE bytes of binary data in one tag
             chunk = data[index: index + CHUNK_SIZE]
             # write actual chunk size
-            stream.write(len(chunk).to_bytes(1, 'little'))
-            stream.write(chunk)
+            chunks.append(len(chunk).to_bytes(1, 'little'))
+            chunks.append(chunk)
             index += CHUNK_SIZE
+        return b''.join(chunks)
 
 
 class TagCollector:
@@ -187,6 +232,9 @@ class TagCollector:
     def write_tag2(self, code: int, value: Any) -> None:
         self.tags.append(DXFTag(code, cast_tag_value(int(code), value)))
 
+    def write_tags2(self, tags: Iterable[Tuple[int, Any]]) -> None:
+        self.tags.extend(DXFTag(code, value) for code, value in tags)
+
     def write_vertex(self, code: int, vertex: Iterable[float]) -> None:
         for index, value in enumerate(vertex):
             self.write_tag2(code + index * 10, value)
@@ -194,6 +242,9 @@ class TagCollector:
     def write_str(self, s: str) -> None:
         self.write_tags(Tags.from_text(s))
 
+    def export_cache_key(self) -> Optional[Hashable]:
+        return None  # collecting DXFTag() objects does not support caching
+
     def has_all_tags(self, other: 'TagCollector'):
         return all(tag in self.tags for tag in other.tags)
 
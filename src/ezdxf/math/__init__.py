@@ -3,9 +3,11 @@
 # Copyright (c) 2010-2020, Manfred Moitzi
 # License: MIT License
 from .vector import Vector, Vec2, X_AXIS, Y_AXIS, Z_AXIS, NULLVEC
+from .vectorarray import VectorArray
 from .construct2d import (
     is_close_points, closest_point, convex_hull_2d, intersection_line_line_2d, distance_point_line_2d,
     is_point_on_line_2d, is_point_in_polygon_2d, is_point_left_of_line, point_to_line_relation,
+    points_in_polygon_2d, PolygonIndex2d, intersections_line_line_2d, intersections_segments_2d,
     linspace, enclosing_angles, reflect_angle_x_deg,
     reflect_angle_y_deg, sign,
 )
@@ -16,11 +18,11 @@ from .matrix44 import Matrix44
 from .linalg import (
     Matrix, LUDecomposition, gauss_jordan_inverse, gauss_jordan_solver, gauss_vector_solver, gauss_matrix_solver,
     freeze_matrix, tridiagonal_matrix_solver, tridiagonal_vector_solver, detect_banded_matrix, compact_banded_matrix,
-    BandedMatrixLU, banded_matrix,
+    BandedMatrixLU, banded_matrix, compact_banded_matrix_from_rows, banded_matrix_batch_solver,
 )
 from .parametrize import estimate_tangents, estimate_end_tangent_magnitude
 from .bspline import (
-    fit_points_to_cad_cv, global_bspline_interpolation,
+    fit_points_to_cad_cv, global_bspline_interpolation, global_bspline_interpolation_batch,
     rational_spline_from_arc, rational_spline_from_ellipse,
     uniform_knot_vector, open_uniform_knot_vector, required_knot_values, BSpline, BSplineU, BSplineClosed,
     local_cubic_bspline_interpolation,
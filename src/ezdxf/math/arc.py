@@ -62,6 +62,19 @@ class ConstructionArc:
     @property
     def bounding_box(self) -> 'BoundingBox2d':
         """ bounding box of arc as :class:`BoundingBox2d`. """
+        return self.bbox()
+
+    def bbox(self) -> 'BoundingBox2d':
+        """ Returns the exact bounding box of the arc as :class:`BoundingBox2d`, calculated from start- and
+        end point and the enclosed main axis points, without approximation.
+
+        .. versionadded:: 0.14
+
+        """
+        if math.isclose(self.angle_span, 360.0):
+            center = self.center
+            r = Vec2((self.radius, self.radius))
+            return BoundingBox2d((center - r, center + r))
         bbox = BoundingBox2d((self.start_point, self.end_point))
         bbox.extend(self.main_axis_points())
         return bbox
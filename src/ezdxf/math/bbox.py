@@ -3,6 +3,7 @@
 # License: MIT License
 from typing import TYPE_CHECKING, Iterable, Tuple
 from .vector import Vector, Vec2
+from .vectorarray import VectorArray
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import Vertex
@@ -12,7 +13,7 @@ class BoundingBox:
     """ 3D bounding box.
 
     Args:
-        vertices: iterable of ``(x, y, z)`` tuples or :class:`Vector` objects
+        vertices: iterable of ``(x, y, z)`` tuples or :class:`Vector` objects or a :class:`VectorArray`
 
     """
 
@@ -42,7 +43,13 @@ class BoundingBox:
             vertices: iterable of ``(x, y, z)`` tuples or :class:`Vector` objects
 
         """
-        v = list(vertices)
+        if isinstance(vertices, VectorArray):
+            if not len(vertices):
+                return
+            # merge the extents of the array with the current bounds, without copying the array
+            v = list(vertices.extents())
+        else:
+            v = list(vertices)
         if self.has_data:
             v.extend([self.extmin, self.extmax])
         self.extmin, self.extmax = extends(v)
@@ -59,6 +66,8 @@ class BoundingBox:
 
 
 def extends(vertices: Iterable['Vertex']) -> Tuple[Vector, Vector]:
+    if isinstance(vertices, VectorArray) and len(vertices):
+        return vertices.extents()
     minx, miny, minz = None, None, None
     maxx, maxy, maxz = None, None, None
     for v in vertices:
@@ -117,7 +126,13 @@ class BoundingBox2d:
             vertices: iterable of ``(x, y[, z])`` tuples or :class:`Vector` objects
 
         """
-        v = list(vertices)
+        if isinstance(vertices, VectorArray):
+            if not len(vertices):
+                return
+            # merge the extents of the array with the current bounds, without copying the array
+            v = list(extends2d(vertices))
+        else:
+            v = list(vertices)
         if self.has_data:
             v.extend([self.extmin, self.extmax])
         self.extmin, self.extmax = extends2d(v)
@@ -134,6 +149,9 @@ class BoundingBox2d:
 
 
 def extends2d(vertices: Iterable['Vertex']) -> Tuple[Vec2, Vec2]:
+    if isinstance(vertices, VectorArray) and len(vertices):
+        x, y = vertices.x, vertices.y
+        return Vec2((min(x), min(y))), Vec2((max(x), max(y)))
     minx, miny = None, None
     maxx, maxy = None, None
     for v in vertices:
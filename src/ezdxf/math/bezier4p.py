@@ -7,6 +7,7 @@ import math
 from functools import lru_cache
 from ezdxf.math import Vector, Vec2, tridiagonal_matrix_solver
 from ezdxf.math.ellipse import ConstructionEllipse
+from ezdxf.math.bbox import BoundingBox, BoundingBox2d
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import Vertex
@@ -73,6 +74,7 @@ class Bezier4P:
             self._control_points = vector_class.list(defpoints)
         else:
             raise ValueError("Four control points required.")
+        self._extents = None  # cached result of bbox(), control points are immutable
 
     def to3d(self) -> 'Bezier4P':
         """ Returns the Bèzier-curve with 3d control points. """
@@ -143,6 +145,48 @@ class Bezier4P:
             prev_point = point
         return length
 
+    def bbox(self) -> Union[BoundingBox, BoundingBox2d]:
+        """
+        Returns the exact bounding box of the Bèzier-curve, :class:`BoundingBox2d` for 2D curves and
+        :class:`BoundingBox` for 3D curves. The extreme values are calculated by the roots of the 1st
+        derivative for each coordinate axis, the result is cached.
+
+        .. versionadded:: 0.14
+
+        """
+        bbox_class = BoundingBox if isinstance(self._control_points[0], Vector) else BoundingBox2d
+        if self._extents is None:
+            points = [self._control_points[0], self._control_points[3]]
+            for t in self._extreme_params():
+                points.append(self._get_curve_point(t))
+            bbox = bbox_class(points)
+            self._extents = bbox.extmin, bbox.extmax
+        return bbox_class(self._extents)
+
+    def _extreme_params(self) -> Iterable[float]:
+        """ Yields all params in the range (0, 1) where the 1st derivative of a coordinate axis is 0. """
+        p0, p1, p2, p3 = self._control_points
+        for v0, v1, v2, v3 in zip(p0, p1, p2, p3):
+            # 1st derivative / 3: a*t^2 + b*t + c
+            a = -v0 + 3. * v1 - 3. * v2 + v3
+            b = 2. * (v0 - 2. * v1 + v2)
+            c = v1 - v0
+            if abs(a) < 1e-12:
+                if abs(b) > 1e-12:
+                    roots = (-c / b,)
+                else:
+                    roots = ()
+            else:
+                discriminant = b * b - 4. * a * c
+                if discriminant < 0.:
+                    roots = ()
+                else:
+                    sqrt_d = math.sqrt(discriminant)
+                    roots = ((-b + sqrt_d) / (2. * a), (-b - sqrt_d) / (2. * a))
+            for t in roots:
+                if 0. < t < 1.:
+                    yield t
+
     def reverse(self) -> 'Bezier4P':
         """ Returns a new Bèzier-curve with reversed control point order. """
         return Bezier4P(list(reversed(self.control_points)))
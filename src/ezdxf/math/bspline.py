@@ -17,16 +17,17 @@ https://www.cl.cam.ac.uk/teaching/2000/AGraphHCI/SMEG/node5.html:
 https://books.google.at/books/about/The_NURBS_Book.html?id=7dqY5dyAwWkC&redir_esc=y
 
 """
-from typing import List, Iterable, Sequence, TYPE_CHECKING, Dict, Tuple, Optional, Union
+from typing import List, Iterable, Sequence, TYPE_CHECKING, Dict, Tuple, Optional
 import math
 import bisect
 from .vector import Vector, NULLVEC
 from .parametrize import create_t_vector, estimate_tangents, estimate_end_tangent_magnitude
 from .linalg import (
-    LUDecomposition, Matrix, BandedMatrixLU, compact_banded_matrix, detect_banded_matrix,
+    LUDecomposition, Matrix, BandedMatrixLU, compact_banded_matrix_from_rows, banded_matrix_batch_solver,
     quadratic_equation, binomial_coefficient,
 )
 from .construct2d import linspace
+from .bbox import BoundingBox
 from ezdxf.lldxf.const import DXFValueError
 from ezdxf import PYPY
 
@@ -43,7 +44,7 @@ USE_BANDED_MATRIX_SOLVER_PYPY_LIMIT = 60
 
 __all__ = [
     # High level functions:
-    'fit_points_to_cad_cv', 'global_bspline_interpolation',
+    'fit_points_to_cad_cv', 'global_bspline_interpolation', 'global_bspline_interpolation_batch',
     'local_cubic_bspline_interpolation', 'rational_spline_from_arc', 'rational_spline_from_ellipse',
 
     # B-spline representation without derivatives support:
@@ -180,6 +181,59 @@ def global_bspline_interpolation(
     return bspline
 
 
+def global_bspline_interpolation_batch(
+        curves: Iterable[Iterable['Vertex']],
+        degree: int = 3,
+        method: str = 'chord') -> List['BSpline']:
+    """
+    `B-spline`_ interpolation by `Global Curve Interpolation`_ for many independent curves at once,
+    returns the same results as calling :func:`global_bspline_interpolation` for each curve without
+    tangent constraints.
+
+    The equation systems of all curves with the same fit point count are solved together by
+    :func:`~ezdxf.math.linalg.banded_matrix_batch_solver`, which uses vectorized NumPy operations
+    if NumPy is installed.
+
+    Args:
+        curves: fit points for each curve, as list of :class:`Vector` compatible objects
+        degree: degree of B-splines
+        method: calculation method for parameter vector t, see :func:`global_bspline_interpolation`
+
+    Returns:
+        list of :class:`BSpline` objects in the order of `curves`
+
+    .. versionadded:: 0.14
+
+    """
+    order = degree + 1
+    knot_generation_method = 'natural' if degree % 2 else 'average'
+    groups: Dict[Tuple[int, int, int], List[int]] = dict()
+    data = []
+    for index, fit_points in enumerate(curves):
+        fit_points = Vector.list(fit_points)
+        count = len(fit_points)
+        if order > count:
+            raise DXFValueError(f'More fit points required for degree {degree}')
+        t_vector = list(create_t_vector(fit_points, method))
+        knots = knots_from_parametrization(
+            count - 1, degree, t_vector, knot_generation_method, constrained=False)
+        N = Basis(knots=knots, order=order, count=count)
+        A, m1, m2 = compact_banded_matrix_from_rows(_sparse_basis_rows(N, t_vector))
+        data.append((A, fit_points, knots, t_vector))
+        groups.setdefault((count, m1, m2), []).append(index)
+
+    splines: List[Optional[BSpline]] = [None] * len(data)
+    for (count, m1, m2), indices in groups.items():
+        results = banded_matrix_batch_solver(
+            [data[i][0] for i in indices], m1, m2, [data[i][1] for i in indices])
+        for index, control_points in zip(indices, results):
+            _, _, knots, t_vector = data[index]
+            bspline = BSpline(Vector.list(control_points.rows()), order=order, knots=knots)
+            bspline.t_array = t_vector
+            splines[index] = bspline
+    return splines
+
+
 def local_cubic_bspline_interpolation(
         fit_points: Iterable['Vertex'],
         method: str = '5-points',
@@ -444,26 +498,41 @@ def double_knots(n: int, p: int, t: Sequence[float]) -> List[float]:
     return u
 
 
-def _get_best_solver(matrix: Union[List, Matrix], degree: int):
+SparseRows = List[Tuple[int, List[float]]]
+
+
+def _expand_sparse_rows(rows: SparseRows) -> List[List[float]]:
+    """ Returns sparse rows as full nxn matrix. """
+    n = len(rows)
+    return [[0.0] * first + values + [0.0] * (n - first - len(values)) for first, values in rows]
+
+
+def _get_best_solver(rows: SparseRows):
     """ Returns best suited linear equation solver depending on matrix
     configuration and python interpreter.
+
+    The matrix is given as sparse rows ``(first, values)``, B-spline
+    interpolation matrices are banded and the compact banded matrix is
+    build directly from the sparse rows, without creating the full nxn
+    matrix. (m1 = m2 = degree-1 for B-spline interpolation)
     """
-    A = matrix if isinstance(matrix, Matrix) else Matrix(matrix=matrix)
     if PYPY:
         limit = USE_BANDED_MATRIX_SOLVER_PYPY_LIMIT
     else:
         limit = USE_BANDED_MATRIX_SOLVER_CPYTHON_LIMIT
-    if A.nrows < limit:  # use default equation solver
-        lu = LUDecomposition(A)
+    if len(rows) < limit:  # use default equation solver
+        return LUDecomposition(_expand_sparse_rows(rows))
     else:
-        # Theory: band parameters m1, m2 are at maximum degree-1, for
-        # B-spline interpolation and approximation:
-        # m1 = m2 = degree-1
-        # But the speed gain is not that big and just to be sure:
-        m1, m2 = detect_banded_matrix(A, check_all=False)
-        A = compact_banded_matrix(A, m1, m2)
-        lu = BandedMatrixLU(A, m1, m2)
-    return lu
+        return BandedMatrixLU(*compact_banded_matrix_from_rows(rows))
+
+
+def _sparse_basis_rows(N: 'Basis', t_vector: Iterable[float]) -> SparseRows:
+    p = N.order - 1
+    rows = []
+    for t in t_vector:
+        span = N.find_span(t)
+        rows.append((span - p, N.basis_funcs(span, t)))
+    return rows
 
 
 def unconstrained_global_bspline_interpolation(
@@ -490,7 +559,7 @@ def unconstrained_global_bspline_interpolation(
     # Source: http://pages.mtu.edu/~shene/COURSES/cs3621/NOTES/INT-APP/CURVE-INT-global.html
     knots = knots_from_parametrization(len(fit_points) - 1, degree, t_vector, knot_generation_method, constrained=False)
     N = Basis(knots=knots, order=degree + 1, count=len(fit_points))
-    solver = _get_best_solver([N.basis_vector(t) for t in t_vector], degree)
+    solver = _get_best_solver(_sparse_basis_rows(N, t_vector))
     control_points = solver.solve_matrix(fit_points)
     return Vector.list(control_points.rows()), knots
 
@@ -530,14 +599,13 @@ def global_bspline_interpolation_end_tangents(
     knots = knots_from_parametrization(n + 2, p, t_vector, knot_generation_method, constrained=True)
 
     N = Basis(knots=knots, order=p + 1, count=n + 3)
-    rows = [N.basis_vector(u) for u in t_vector]
-    spacing = [0.0] * (n + 1)
-    rows.insert(1, [-1.0, +1.0] + spacing)
-    rows.insert(-1, spacing + [-1.0, +1.0])
+    rows = _sparse_basis_rows(N, t_vector)
+    rows.insert(1, (0, [-1.0, +1.0]))
+    rows.insert(-1, (n + 1, [-1.0, +1.0]))
     fit_points.insert(1, start_tangent * (knots[p + 1] / p))
     fit_points.insert(-1, end_tangent * ((1.0 - knots[-(p + 2)]) / p))
 
-    solver = _get_best_solver(rows, degree)
+    solver = _get_best_solver(rows)
     control_points = solver.solve_matrix(fit_points)
     return Vector.list(control_points.rows()), knots
 
@@ -568,9 +636,8 @@ def global_bspline_interpolation_first_derivatives(
     def nbasis(t: float):
         span = N.find_span(t)
         front = span - p
-        back = count + p + 1 - span
         for basis in N.basis_funcs_derivatives(span, t, n=1):
-            yield [0.0] * front + basis + [0.0] * back
+            yield front, basis
 
     p = degree
     n = len(fit_points) - 1
@@ -578,14 +645,14 @@ def global_bspline_interpolation_first_derivatives(
     count = len(fit_points) * 2
     N = Basis(knots=knots, order=p + 1, count=count)
     A = [
-        [1.0] + [0.0] * (count - 1),  # Q0
-        [-1.0, +1.0] + [0.0] * (count - 2),  # D0
+        (0, [1.0]),  # Q0
+        (0, [-1.0, +1.0]),  # D0
     ]
     for f in (nbasis(t) for t in t_vector[1:-1]):
         A.extend(f)  # Qi, Di
     # swapped equations!
-    A.append([0.0] * (count - 2) + [-1.0, +1.0])  # Dn
-    A.append([0.0] * (count - 1) + [+1.0])  # Qn
+    A.append((count - 2, [-1.0, +1.0]))  # Dn
+    A.append((count - 1, [+1.0]))  # Qn
 
     # Build right handed matrix B
     B = []
@@ -598,7 +665,7 @@ def global_bspline_interpolation_first_derivatives(
     # modify equation for derivatives D0 and Dn
     B[1] *= knots[p + 1] / p
     B[-2] *= (1.0 - knots[-(p + 2)]) / p
-    solver = _get_best_solver(A, degree)
+    solver = _get_best_solver(A)
     control_points = solver.solve_matrix(B)
     return Vector.list(control_points.rows()), knots
 
@@ -1090,6 +1157,31 @@ class BSpline:
         for t in u:
             self.insert_knot(t)
 
+    def bbox(self, level: int = 0) -> BoundingBox:
+        """ Returns a bounding box of the B-spline as :class:`BoundingBox`, without approximation.
+
+        By the convex hull property of B-splines is the bounding box of the control points a
+        conservative estimation of the curve bounds. Each refinement `level` inserts a knot in the
+        middle of each knot span of a copy of the B-spline, the control points of the refined
+        B-spline converge to the curve and the bounding box becomes tighter. Refinement is not
+        supported for rational B-splines, which always return the control point bounds.
+
+        Args:
+            level: count of knot refinement steps
+
+        .. versionadded:: 0.14
+
+        """
+        if level < 1 or self.is_rational:
+            return BoundingBox(self.control_points)
+        spline = BSpline(self.control_points, self.order, self.knots())
+        for _ in range(int(level)):
+            knots = spline.knots()
+            spline.knot_refinement([
+                (k1 + k2) / 2. for k1, k2 in zip(knots, knots[1:]) if k2 - k1 > 1e-12
+            ])
+        return BoundingBox(spline.control_points)
+
     def transform(self, m: 'Matrix44') -> 'BSpline':
         """ Transform B-spline by transformation matrix `m` inplace.
 
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence, Union, Tup
 
 from functools import partial
 import math
+import bisect
 from .vector import Vector, Vec2
 from decimal import Decimal
 
@@ -393,6 +394,221 @@ def is_point_in_polygon_2d(point: Union[Vec2, Vector], polygon: Iterable[Vec2],
         return -1
 
 
+def points_in_polygon_2d(points: Iterable[Union[Vec2, Vector]], polygon: Iterable[Vec2],
+                         abs_tol=TOLERANCE) -> List[int]:
+    """
+    Test multiple `points` against the same `polygon`, same results as :func:`is_point_in_polygon_2d`
+    for each point, but builds a :class:`PolygonIndex2d` once, which makes each test sub-linear.
+
+    Args:
+        points: iterable of 2D points to test as :class:`Vec2`
+        polygon: iterable of 2D points as :class:`Vec2`
+        abs_tol: tolerance for distance check
+
+    Returns:
+        list of ``+1`` for inside, ``0`` for on boundary line, ``-1`` for outside
+
+    .. versionadded:: 0.14
+
+    """
+    return PolygonIndex2d(polygon, abs_tol).points_relation(points)
+
+
+class PolygonIndex2d:
+    """
+    Precomputed slab decomposition of a simple polygon for fast repeated point in polygon tests.
+
+    The polygon is cut into horizontal slabs at the y-coordinates of all vertices, each slab
+    stores the crossing edges sorted from left to right. A point test searches the slab by
+    binary search and counts the edges right of the point by a second binary search, which is
+    O(log n) for a polygon of n vertices. Points located at the y-coordinate of a vertex
+    are tested by :func:`is_point_in_polygon_2d`.
+
+    Args:
+        polygon: iterable of 2D points as :class:`Vec2`, requires a simple polygon without
+            self intersections
+        abs_tol: tolerance for distance check
+
+    .. versionadded:: 0.14
+
+    """
+
+    def __init__(self, polygon: Iterable[Vec2], abs_tol=TOLERANCE):
+        polygon = Vec2.list(polygon)
+        if not polygon[0].isclose(polygon[-1]):
+            polygon.append(polygon[0])
+        if len(polygon) < 4:  # 3+1 because first point == last point
+            raise ValueError('At least 3 polygon points required.')
+        self.polygon: List[Vec2] = polygon
+        self.abs_tol = abs_tol
+        self._slab_y: List[float] = sorted(set(v.y for v in polygon))
+        # edges as (x1, y1, x2, y2) tuples with y1 < y2, horizontal edges are located at slab borders
+        edges = []
+        for p1, p2 in zip(polygon, polygon[1:]):
+            if p1.y < p2.y:
+                edges.append((p1.x, p1.y, p2.x, p2.y))
+            elif p1.y > p2.y:
+                edges.append((p2.x, p2.y, p1.x, p1.y))
+        slab_y = self._slab_y
+        slabs: List[List[Tuple[float, float, float, float]]] = [[] for _ in range(len(slab_y) - 1)]
+        for edge in edges:
+            first = bisect.bisect_left(slab_y, edge[1])
+            last = bisect.bisect_left(slab_y, edge[3])
+            for index in range(first, last):
+                slabs[index].append(edge)
+        for index, slab in enumerate(slabs):
+            mid = (slab_y[index] + slab_y[index + 1]) * 0.5
+            slab.sort(key=lambda e: _edge_x_at(e, mid))
+        self._slabs = slabs
+
+    def point_relation(self, point: Union[Vec2, Vector]) -> int:
+        """ Returns ``+1`` for inside, ``0`` for on boundary line, ``-1`` for outside. """
+        x = point.x
+        y = point.y
+        slab_y = self._slab_y
+        abs_tol = self.abs_tol
+        if y < slab_y[0] - abs_tol or y > slab_y[-1] + abs_tol:
+            return -1
+        index = bisect.bisect_right(slab_y, y) - 1
+        if math.isclose(y, slab_y[index], abs_tol=abs_tol) or (
+                index + 1 < len(slab_y) and math.isclose(y, slab_y[index + 1], abs_tol=abs_tol)):
+            # points at vertex level: horizontal edges and vertices require special treatment
+            return is_point_in_polygon_2d(point, self.polygon, abs_tol)
+
+        slab = self._slabs[index]
+        # binary search for the first edge right of the point
+        lo = 0
+        hi = len(slab)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if _edge_x_at(slab[mid], y) > x:
+                hi = mid
+            else:
+                lo = mid + 1
+        for neighbor in (lo - 1, lo):
+            if 0 <= neighbor < len(slab):
+                x1, y1, x2, y2 = slab[neighbor]
+                if math.fabs((y2 - y1) * x - (x2 - x1) * y + (x2 * y1 - y2 * x1)) <= abs_tol:
+                    return 0
+        # odd count of edges right of point: inside
+        return 1 if (len(slab) - lo) % 2 else -1
+
+    def points_relation(self, points: Iterable[Union[Vec2, Vector]]) -> List[int]:
+        """ Returns the :meth:`point_relation` for multiple `points` as list. """
+        relation = self.point_relation
+        return [relation(point) for point in points]
+
+
+def _edge_x_at(edge: Tuple[float, float, float, float], y: float) -> float:
+    x1, y1, x2, y2 = edge
+    return x1 + (x2 - x1) * (y - y1) / (y2 - y1)
+
+
+def intersections_line_line_2d(
+        lines1: Iterable[Sequence['Vertex']],
+        lines2: Iterable[Sequence['Vertex']],
+        virtual=True,
+        abs_tol=TOLERANCE) -> List[Optional[Vec2]]:
+    """
+    Compute the intersection of pairs of lines in the xy-plane, returns the same results as
+    :func:`intersection_line_line_2d` for each pair of lines from `lines1` and `lines2`.
+    For many lines to intersect with many lines use :func:`intersections_segments_2d`.
+
+    Args:
+        lines1: iterable of lines as start- and end point as :class:`Vec2`
+        lines2: iterable of lines as start- and end point as :class:`Vec2`
+        virtual: ``True`` returns any intersection point, ``False`` returns only real intersection points.
+        abs_tol: tolerance for intersection test.
+
+    Returns:
+        list of intersection points as :class:`Vec2` or ``None`` if there is no intersection point
+
+    .. versionadded:: 0.14
+
+    """
+    return [
+        intersection_line_line_2d(line1, line2, virtual=virtual, abs_tol=abs_tol)
+        for line1, line2 in zip(lines1, lines2)
+    ]
+
+
+def intersections_segments_2d(
+        segments1: Iterable[Sequence['Vertex']],
+        segments2: Iterable[Sequence['Vertex']],
+        abs_tol=TOLERANCE) -> List[Tuple[int, int, Vec2]]:
+    """
+    Returns all intersections between the line segments of `segments1` and the line segments of
+    `segments2` in the xy-plane. A sweep along the x-axis tests only segments with overlapping
+    x-ranges, which is much faster than testing all combinations for large segment counts.
+
+    Args:
+        segments1: iterable of line segments as start- and end point e.g. [((x1, y1), (x2, y2)), ...]
+        segments2: iterable of line segments as start- and end point e.g. [((x3, y3), (x4, y4)), ...]
+        abs_tol: tolerance for intersection test.
+
+    Returns:
+        list of ``(index1, index2, point)`` tuples, where `index1` is the index of the segment in
+        `segments1`, `index2` is the index of the segment in `segments2` and point is the
+        intersection point as :class:`Vec2`, sorted by `index1` and `index2`
+
+    .. versionadded:: 0.14
+
+    """
+    events = []
+    for group, segments in enumerate((segments1, segments2)):
+        for index, (start, end) in enumerate(segments):
+            x1, y1 = Vec2(start)
+            x2, y2 = Vec2(end)
+            events.append((min(x1, x2), max(x1, x2), min(y1, y2), max(y1, y2), group, index, x1, y1, x2, y2))
+    events.sort(key=lambda e: e[0])
+    active = ([], [])
+    result = []
+    for event in events:
+        xmin, xmax, ymin, ymax, group, index, x1, y1, x2, y2 = event
+        other = 1 - group
+        # remove finished segments
+        limit = xmin - abs_tol
+        active[other][:] = [e for e in active[other] if e[1] >= limit]
+        for e in active[other]:
+            if e[3] < ymin - abs_tol or e[2] > ymax + abs_tol:
+                continue
+            ip = _intersect_lines(x1, y1, x2, y2, e[6], e[7], e[8], e[9], False, abs_tol)
+            if ip is not None:
+                if group == 0:
+                    result.append((index, e[5], Vec2(ip)))
+                else:
+                    result.append((e[5], index, Vec2(ip)))
+        active[group].append(event)
+    result.sort(key=lambda r: (r[0], r[1]))
+    return result
+
+
+def _intersect_lines(x1: float, y1: float, x2: float, y2: float, x3: float, y3: float, x4: float, y4: float,
+                     virtual: bool, abs_tol: float) -> Optional[Tuple[float, float]]:
+    """ Same algorithm as :func:`intersection_line_line_2d` for plain floats. """
+    x1_x2 = x1 - x2
+    y3_y4 = y3 - y4
+    y1_y2 = y1 - y2
+    x3_x4 = x3 - x4
+    d = x1_x2 * y3_y4 - y1_y2 * x3_x4
+    if math.fabs(d) <= abs_tol:
+        return None
+    a = x1 * y2 - y1 * x2
+    b = x3 * y4 - y3 * x4
+    x = (a * x3_x4 - x1_x2 * b) / d
+    y = (a * y3_y4 - y1_y2 * b) / d
+    if not virtual:
+        if not (min(x1, x2) - abs_tol <= x <= max(x1, x2) + abs_tol):
+            return None
+        if not (min(x3, x4) - abs_tol <= x <= max(x3, x4) + abs_tol):
+            return None
+        if not (min(y1, y2) - abs_tol <= y <= max(y1, y2) + abs_tol):
+            return None
+        if not (min(y3, y4) - abs_tol <= y <= max(y3, y4) + abs_tol):
+            return None
+    return x, y
+
+
 def circle_radius_3p(a: Vector, b: Vector, c: Vector) -> float:
     ba = b - a
     ca = c - a
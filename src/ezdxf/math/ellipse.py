@@ -6,6 +6,7 @@ from .vector import Vector, NULLVEC, X_AXIS, Z_AXIS
 from .matrix44 import Matrix44
 from .ucs import OCS
 from .construct2d import enclosing_angles, linspace
+from .bbox import BoundingBox
 
 pi2 = math.pi / 2
 
@@ -118,6 +119,34 @@ class ConstructionEllipse:
             if enclosing_angles(param, start, end):
                 yield vertex(param, self.major_axis, self.minor_axis, self.center, self.ratio)
 
+    def bbox(self) -> BoundingBox:
+        """ Returns the exact bounding box of the elliptic arc as :class:`BoundingBox`, without approximation.
+
+        Each coordinate axis of the ellipse is a function ``c + a * cos(t) + b * sin(t)`` of param `t`, the
+        extreme values are located at ``t = atan2(b, a)`` and ``t + pi``, which are included if they are
+        inside the param range of the elliptic arc.
+
+        .. versionadded:: 0.14
+
+        """
+        major = self.major_axis
+        minor = self.minor_axis.normalize(major.magnitude * self.ratio)
+        center = self.center
+        start = self.start_param
+        end = self.end_param
+        is_full_ellipse = math.isclose(self.param_span, math.tau)
+        params = [] if is_full_ellipse else [start, end]
+        for a, b in zip(major.xyz, minor.xyz):
+            if a == 0. and b == 0.:
+                continue
+            t = math.atan2(b, a)
+            for param in (t, t + math.pi):
+                if is_full_ellipse or enclosing_angles(param, start, end):
+                    params.append(param)
+        if not params:  # degenerated ellipse
+            return BoundingBox([center])
+        return BoundingBox(center + major * math.cos(t) + minor * math.sin(t) for t in params)
+
     def transform(self, m: Matrix44) -> None:
         """ Transform ellipse in place by transformation matrix `m`. """
         new_center = m.transform(self.center)
@@ -6,11 +6,16 @@ from itertools import repeat
 import math
 import reprlib
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 __all__ = [
     'Matrix', 'gauss_vector_solver', 'gauss_matrix_solver', 'gauss_jordan_solver', 'gauss_jordan_inverse',
     'LUDecomposition', 'freeze_matrix', 'tridiagonal_vector_solver', 'tridiagonal_matrix_solver',
     'detect_banded_matrix', 'compact_banded_matrix', 'BandedMatrixLU', 'banded_matrix', 'quadratic_equation',
-    'binomial_coefficient',
+    'binomial_coefficient', 'compact_banded_matrix_from_rows', 'banded_matrix_batch_solver',
 ]
 
 
@@ -902,6 +907,36 @@ def detect_banded_matrix(A: Matrix, check_all=True) -> Tuple[int, int]:
     return detect_m1(), detect_m2()
 
 
+def compact_banded_matrix_from_rows(rows: Iterable[Tuple[int, Sequence[float]]]) -> Tuple[Matrix, int, int]:
+    """
+    Returns the compact banded matrix representation as :class:`Matrix` object and the lower- and upper band
+    count m1 and m2 of a square matrix given by sparse rows, without building the full nxn matrix.
+
+    Each row is a 2-tuple ``(first, values)``, where `first` is the column index of the first value in `values`
+    and all other columns of this row are 0.
+
+    Args:
+        rows: sparse rows as ``(first, values)`` tuples
+
+    .. versionadded:: 0.14
+
+    """
+    rows = list(rows)
+    m1 = 0
+    m2 = 0
+    for index, (first, values) in enumerate(rows):
+        m1 = max(m1, index - first)
+        m2 = max(m2, first + len(values) - 1 - index)
+    width = m1 + m2 + 1
+    compact = []
+    for index, (first, values) in enumerate(rows):
+        row = [0.0] * width
+        start = first - index + m1
+        row[start: start + len(values)] = values
+        compact.append(row)
+    return Matrix(matrix=compact), m1, m2
+
+
 def compact_banded_matrix(A: Matrix, m1: int, m2: int) -> Matrix:
     """
     Returns compact banded matrix representation as :class:`Matrix` object.
@@ -1059,3 +1094,56 @@ class BandedMatrixLU:
             dd *= au[i][0]
 
         return dd
+
+
+def banded_matrix_batch_solver(
+        matrices: Sequence[Matrix], m1: int, m2: int, B: Sequence[Iterable[Iterable[float]]]) -> List[Matrix]:
+    """
+    Solves a batch of independent linear equation systems A . x = B, each given by a compact banded nxn
+    matrix of the same size and band structure and the right-hand side quantities as nxm matrix.
+
+    Uses vectorized NumPy operations over all equation systems if NumPy is installed, else each
+    system is solved by :class:`BandedMatrixLU`. The NumPy implementation does not pivot and requires
+    matrices which are stable without pivoting, like diagonal dominant matrices or the totally positive
+    collocation matrices of B-spline interpolation.
+
+    Args:
+        matrices: compact banded matrices as :class:`Matrix` objects, all with the same shape
+        m1: lower band count, excluding main matrix diagonal
+        m2: upper band count, excluding main matrix diagonal
+        B: right-hand side quantities as matrices [[b11, b12, ..., b1m], ... [bn1, bn2, ..., bnm]]
+
+    Returns:
+        list of :class:`Matrix` objects
+
+    .. versionadded:: 0.14
+
+    """
+    if numpy is None or len(matrices) == 0:
+        return [BandedMatrixLU(A, m1, m2).solve_matrix(b) for A, b in zip(matrices, B)]
+    return [Matrix(matrix=x.tolist()) for x in _numpy_banded_batch_solver(matrices, m1, m2, B)]
+
+
+def _numpy_banded_batch_solver(matrices: Sequence[Matrix], m1: int, m2: int, B: Sequence[Iterable[Iterable[float]]]):
+    # Gaussian elimination without pivoting, each numpy operation is applied to all equation systems at once.
+    a = numpy.array([A.matrix if isinstance(A, Matrix) else A for A in matrices], dtype=float)
+    b = numpy.array([[list(row) for row in rows] for rows in B], dtype=float)
+    batch, n, width = a.shape
+    if width != m1 + m2 + 1:
+        raise ValueError('Invalid compact banded matrix, column count has to be m1+m2+1.')
+    if b.shape[:2] != (batch, n):
+        raise ValueError('Row count of matrices A and B has to match.')
+
+    for k in range(n):
+        pivot = a[:, k, m1]
+        for i in range(k + 1, min(k + m1 + 1, n)):
+            col = m1 - (i - k)  # column k in row i
+            factor = a[:, i, col] / pivot
+            a[:, i, col: col + m2 + 1] -= factor[:, None] * a[:, k, m1:]
+            b[:, i] -= factor[:, None] * b[:, k]
+
+    x = numpy.zeros((batch, n + m2, b.shape[2]))
+    for i in range(n - 1, -1, -1):
+        s = b[:, i] - numpy.einsum('kj,kjd->kd', a[:, i, m1 + 1:], x[:, i + 1: i + 1 + m2])
+        x[:, i] = s / a[:, i, m1][:, None]
+    return x[:, :n]
@@ -214,6 +214,10 @@ class Vector:
             memodict[id(self)] = v
             return v
 
+    def __reduce__(self):
+        """ :mod:`pickle` support, more compact than the default :attr:`__slots__` pickling. """
+        return self.__class__, (self._x, self._y, self._z)
+
     def __getitem__(self, index: int) -> float:
         """
         Support for indexing:
@@ -659,6 +663,9 @@ class Vec2:
             memodict[id(self)] = v
             return v
 
+    def __reduce__(self):
+        return self.__class__, (self.x, self.y)
+
     def __getitem__(self, index: int) -> float:
         return (self.x, self.y)[index]
 
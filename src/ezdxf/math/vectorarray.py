@@ -0,0 +1,257 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+from typing import TYPE_CHECKING, Iterable, List, Tuple, Union, Sequence, overload
+from array import array
+import math
+from .vector import Vector
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Vertex, Matrix44
+
+__all__ = ['VectorArray']
+
+Operand = Union['VectorArray', 'Vertex']
+
+
+class VectorArray:
+    """ Compact container for 3D vectors, stores the x-, y- and z-axis in separated contiguous
+    :class:`array.array` objects of C doubles (struct of arrays). This saves memory and the
+    creation of a :class:`Vector` object for each element and each arithmetic operation.
+
+    Arithmetic operations are applied elementwise and return a new :class:`VectorArray`. The
+    second operand can be another :class:`VectorArray` of the same length or a single vertex,
+    which is applied to all elements.
+
+    Args:
+        vertices: iterable of ``(x, y[, z])`` tuples or :class:`Vector` objects
+
+    .. versionadded:: 0.14
+
+    """
+    __slots__ = ('x', 'y', 'z')
+
+    def __init__(self, vertices: Iterable['Vertex'] = None):
+        self.x = array('d')
+        self.y = array('d')
+        self.z = array('d')
+        if vertices is not None:
+            self.extend(vertices)
+
+    @classmethod
+    def from_arrays(cls, x: Iterable[float], y: Iterable[float], z: Iterable[float] = None) -> 'VectorArray':
+        """ Create a new :class:`VectorArray` from separated x-, y- and z-axis values, z-axis is 0 if
+        `z` is ``None``.
+        """
+        va = cls()
+        va.x = array('d', x)
+        va.y = array('d', y)
+        if z is None:
+            va.z = array('d', bytes(8 * len(va.x)))
+        else:
+            va.z = array('d', z)
+        if not (len(va.x) == len(va.y) == len(va.z)):
+            raise ValueError('Arrays of equal length required.')
+        return va
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __str__(self) -> str:
+        return f'VectorArray({len(self)} vectors)'
+
+    def __repr__(self) -> str:
+        return f'VectorArray({self.to_list()!r})'
+
+    @overload
+    def __getitem__(self, item: int) -> Vector:
+        ...
+
+    @overload
+    def __getitem__(self, item: slice) -> 'VectorArray':
+        ...
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return VectorArray.from_arrays(self.x[item], self.y[item], self.z[item])
+        return Vector(self.x[item], self.y[item], self.z[item])
+
+    def __setitem__(self, index: int, vertex: 'Vertex') -> None:
+        self.x[index], self.y[index], self.z[index] = Vector.decompose(vertex)
+
+    def __iter__(self) -> Iterable[Vector]:
+        """ Yields all elements as :class:`Vector` objects. """
+        return map(Vector, self.x, self.y, self.z)
+
+    def __eq__(self, other: 'VectorArray') -> bool:
+        if not isinstance(other, VectorArray):
+            return NotImplemented
+        return self.x == other.x and self.y == other.y and self.z == other.z
+
+    def __copy__(self) -> 'VectorArray':
+        return VectorArray.from_arrays(self.x, self.y, self.z)
+
+    copy = __copy__
+
+    def append(self, vertex: 'Vertex') -> None:
+        """ Append a single vertex. """
+        x, y, z = Vector.decompose(vertex)
+        self.x.append(x)
+        self.y.append(y)
+        self.z.append(z)
+
+    def extend(self, vertices: Iterable['Vertex']) -> None:
+        """ Extend array by multiple vertices. """
+        if isinstance(vertices, VectorArray):
+            self.x.extend(vertices.x)
+            self.y.extend(vertices.y)
+            self.z.extend(vertices.z)
+            return
+        decompose = Vector.decompose
+        x = self.x.append
+        y = self.y.append
+        z = self.z.append
+        for vertex in vertices:
+            vx, vy, vz = decompose(vertex)
+            x(vx)
+            y(vy)
+            z(vz)
+
+    def to_list(self) -> List[Vector]:
+        """ Returns all elements as list of :class:`Vector` objects. """
+        return list(map(Vector, self.x, self.y, self.z))
+
+    def tuples(self) -> Iterable[Tuple[float, float, float]]:
+        """ Yields all elements as ``(x, y, z)`` tuples. """
+        return zip(self.x, self.y, self.z)
+
+    def _operand(self, other: Operand) -> Tuple[Sequence[float], Sequence[float], Sequence[float], bool]:
+        if isinstance(other, VectorArray):
+            if len(other) != len(self):
+                raise ValueError('VectorArray of equal length required.')
+            return other.x, other.y, other.z, True
+        x, y, z = Vector.decompose(other)
+        return x, y, z, False
+
+    def __add__(self, other: Operand) -> 'VectorArray':
+        ox, oy, oz, is_array = self._operand(other)
+        if is_array:
+            return VectorArray.from_arrays(
+                [a + b for a, b in zip(self.x, ox)],
+                [a + b for a, b in zip(self.y, oy)],
+                [a + b for a, b in zip(self.z, oz)],
+            )
+        return VectorArray.from_arrays(
+            [a + ox for a in self.x],
+            [a + oy for a in self.y],
+            [a + oz for a in self.z],
+        )
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Operand) -> 'VectorArray':
+        ox, oy, oz, is_array = self._operand(other)
+        if is_array:
+            return VectorArray.from_arrays(
+                [a - b for a, b in zip(self.x, ox)],
+                [a - b for a, b in zip(self.y, oy)],
+                [a - b for a, b in zip(self.z, oz)],
+            )
+        return VectorArray.from_arrays(
+            [a - ox for a in self.x],
+            [a - oy for a in self.y],
+            [a - oz for a in self.z],
+        )
+
+    def __rsub__(self, other: 'Vertex') -> 'VectorArray':
+        return -self + other
+
+    def __neg__(self) -> 'VectorArray':
+        return VectorArray.from_arrays(
+            [-a for a in self.x],
+            [-a for a in self.y],
+            [-a for a in self.z],
+        )
+
+    def __mul__(self, other: float) -> 'VectorArray':
+        s = float(other)
+        return VectorArray.from_arrays(
+            [a * s for a in self.x],
+            [a * s for a in self.y],
+            [a * s for a in self.z],
+        )
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: float) -> 'VectorArray':
+        return self.__mul__(1.0 / float(other))
+
+    def dot(self, other: Operand) -> array:
+        """ Returns the elementwise dot product as :class:`array.array` of floats. """
+        ox, oy, oz, is_array = self._operand(other)
+        if is_array:
+            return array('d', [
+                x1 * x2 + y1 * y2 + z1 * z2 for x1, y1, z1, x2, y2, z2 in zip(self.x, self.y, self.z, ox, oy, oz)
+            ])
+        return array('d', [x * ox + y * oy + z * oz for x, y, z in zip(self.x, self.y, self.z)])
+
+    def cross(self, other: Operand) -> 'VectorArray':
+        """ Returns the elementwise cross product as :class:`VectorArray`. """
+        ox, oy, oz, is_array = self._operand(other)
+        if not is_array:
+            count = len(self)
+            ox, oy, oz = [ox] * count, [oy] * count, [oz] * count
+        return VectorArray.from_arrays(
+            [y1 * z2 - z1 * y2 for y1, z1, y2, z2 in zip(self.y, self.z, oy, oz)],
+            [z1 * x2 - x1 * z2 for x1, z1, x2, z2 in zip(self.x, self.z, ox, oz)],
+            [x1 * y2 - y1 * x2 for x1, y1, x2, y2 in zip(self.x, self.y, ox, oy)],
+        )
+
+    def magnitudes(self) -> array:
+        """ Returns the length of all elements as :class:`array.array` of floats. """
+        sqrt = math.sqrt
+        return array('d', [sqrt(x * x + y * y + z * z) for x, y, z in zip(self.x, self.y, self.z)])
+
+    def normalize(self, length: float = 1.) -> 'VectorArray':
+        """ Returns a new :class:`VectorArray` with all elements normalized to `length`, raises
+        :class:`ZeroDivisionError` for null vectors.
+        """
+        factors = [length / m for m in self.magnitudes()]
+        return VectorArray.from_arrays(
+            [a * f for a, f in zip(self.x, factors)],
+            [a * f for a, f in zip(self.y, factors)],
+            [a * f for a, f in zip(self.z, factors)],
+        )
+
+    def distances(self, other: Operand) -> array:
+        """ Returns the elementwise distances to `other` as :class:`array.array` of floats. """
+        ox, oy, oz, is_array = self._operand(other)
+        sqrt = math.sqrt
+        if is_array:
+            return array('d', [
+                sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2 + (z1 - z2) ** 2)
+                for x1, y1, z1, x2, y2, z2 in zip(self.x, self.y, self.z, ox, oy, oz)
+            ])
+        return array('d', [
+            sqrt((x - ox) ** 2 + (y - oy) ** 2 + (z - oz) ** 2) for x, y, z in zip(self.x, self.y, self.z)
+        ])
+
+    def sum(self) -> Vector:
+        """ Returns the sum of all elements as :class:`Vector`. """
+        return Vector(math.fsum(self.x), math.fsum(self.y), math.fsum(self.z))
+
+    def extents(self) -> Tuple[Vector, Vector]:
+        """ Returns the min and max values of all axis as :class:`Vector` 2-tuple ``(min, max)``, raises
+        :class:`ValueError` for an empty array.
+        """
+        x, y, z = self.x, self.y, self.z
+        return Vector(min(x), min(y), min(z)), Vector(max(x), max(y), max(z))
+
+    def transform(self, m: 'Matrix44') -> 'VectorArray':
+        """ Returns a new :class:`VectorArray` transformed by :class:`~ezdxf.math.Matrix44` `m`. """
+        m0, m1, m2, m3, m4, m5, m6, m7, m8, m9, m10, m11, m12, m13, m14, m15 = m.matrix
+        xyz = list(zip(self.x, self.y, self.z))
+        return VectorArray.from_arrays(
+            [x * m0 + y * m4 + z * m8 + m12 for x, y, z in xyz],
+            [x * m1 + y * m5 + z * m9 + m13 for x, y, z in xyz],
+            [x * m2 + y * m6 + z * m10 + m14 for x, y, z in xyz],
+        )
@@ -26,6 +26,14 @@ class Options:
         # Set 'store_proxy_graphics' to True for exporting proxy graphics
         self.store_proxy_graphics = False
 
+        # Enable this option to cache the serialized DXF tags of unmodified entities at saving, speeds up repeated
+        # saving of mostly unchanged documents, but requires additional memory for the cached data
+        self.use_export_cache = False
+
+        # Enable this option to create new documents by ezdxf.new() as copies of prebuilt templates, each template
+        # is built only once for each DXF version and setup, speeds up the creation of many new documents
+        self.use_document_templates = False
+
         # Enable this option to always create same meta data for testing scenarios, e.g. to use a diff like tool to
         # compare DXF documents.
         self.write_fixed_meta_data_for_testing = False
@@ -7,7 +7,6 @@ import re
 import operator
 
 from collections import abc
-from ezdxf.queryparser import EntityQueryParser
 from ezdxf.groupby import groupby
 
 if TYPE_CHECKING:  # import forward references
@@ -129,6 +128,39 @@ class EntityQuery(abc.Sequence):
         handles_of_entities_to_remove = frozenset(entity.dxf.handle for entity in self.query(query))
         self.entities = [entity for entity in self.entities if entity.dxf.handle not in handles_of_entities_to_remove]
 
+    def delete_entities(self) -> None:
+        """
+        Delete all entities of the :class:`EntityQuery` container from their layouts and the entity database,
+        this destroys the entities and clears the container. Entities without an owner layout are deleted
+        from the entity database only.
+
+        .. versionadded:: 0.14
+
+        """
+        layouts = dict()
+        unlinked = []
+        for entity in self.entities:
+            if not entity.is_alive:
+                continue
+            layout = entity.get_layout() if hasattr(entity, 'get_layout') else None
+            if layout is None:
+                unlinked.append(entity)
+            else:
+                key = layout.layout_key
+                if key in layouts:
+                    layouts[key][1].append(entity)
+                else:
+                    layouts[key] = (layout, [entity])
+
+        for layout, entities in layouts.values():
+            layout.delete_entities(entities)
+        for entity in unlinked:
+            if entity.doc:
+                entity.doc.entitydb.delete_entity(entity)
+            else:
+                entity.destroy()
+        self.entities = []
+
     def query(self, query: str = '*') -> 'EntityQuery':
         """
         Returns a new :class:`EntityQuery` container with all entities matching this additional query.
@@ -153,6 +185,8 @@ class EntityQuery(abc.Sequence):
 
 
 def entity_matcher(query: str) -> Callable[['DXFEntity'], bool]:
+    # import pyparsing at first usage
+    from ezdxf.queryparser import EntityQueryParser
     query_args = EntityQueryParser.parseString(query, parseAll=True)
     entity_matcher_ = build_entity_name_matcher(query_args.EntityQuery)
     attrib_matcher = build_entity_attributes_matcher(query_args.AttribQuery, query_args.AttribQueryOptions)
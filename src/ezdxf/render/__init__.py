@@ -4,6 +4,6 @@
 from .arrows import ARROWS
 from .r12spline import R12Spline
 from .curves import Bezier, EulerSpiral, Spline, random_2d_path, random_3d_path
-from .mesh import MeshBuilder, MeshVertexMerger, MeshTransformer, MeshAverageVertexMerger
+from .mesh import MeshBuilder, MeshVertexMerger, MeshTransformer, MeshAverageVertexMerger, MeshTopology
 from .trace import TraceBuilder
 from .path import Path, Command
@@ -0,0 +1,161 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+from typing import TYPE_CHECKING, Iterable, Sequence, List, Tuple, Dict
+import math
+from ezdxf.math import Vec2, is_point_in_polygon_2d
+from ezdxf.lldxf.const import HATCH_STYLE_NORMAL, HATCH_STYLE_OUTERMOST, HATCH_STYLE_IGNORE
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Vertex
+
+__all__ = ['hatch_line_segments', 'HatchLineDensityError']
+
+# (angle in degrees, base point, offset, dash length items) as stored in Hatch.pattern.lines
+PatternLineDef = Tuple[float, 'Vertex', 'Vertex', Sequence[float]]
+Segment = Tuple[Vec2, Vec2]
+
+ABS_TOL = 1e-12
+
+
+class HatchLineDensityError(ValueError):
+    pass
+
+
+def hatch_line_segments(polygons: Iterable[Iterable['Vertex']], lines: Iterable[PatternLineDef],
+                        max_segments: int = 100000, hatch_style: int = HATCH_STYLE_NORMAL) -> List[Segment]:
+    """
+    Returns the line segments of the pattern `lines` clipped by the boundary `polygons`, all coordinates
+    as 2D vertices in the same coordinate system, for a HATCH entity this is the :ref:`OCS`.
+
+    Each pattern line definition defines a family of parallel lines, which are intersected at once with all
+    polygon edges by a scanline algorithm: each edge is visited only once and yields just the intersections with
+    the pattern lines it really crosses, the intersections of a pattern line are sorted and paired by the even-odd
+    rule. Dots of the dash pattern are returned as segments with equal start- and end point.
+
+    The `hatch_style` selects the boundary polygons by their nesting depth, which is determined geometrically,
+    because the boundary path flags of many DXF files are not reliable: ``0`` (normal) uses all polygons,
+    ``1`` (outer) uses the outermost polygons and their direct islands and ``2`` (ignore) uses only the
+    outermost polygons.
+
+    Args:
+        polygons: boundary paths as closed polygons, the last vertex is not required to be equal to the first vertex
+        lines: pattern line definitions as ``(angle, base_point, offset, dash_length_items)`` tuples,
+               see :class:`~ezdxf.entities.PatternLine`
+        max_segments: limit of generated segments
+        hatch_style: ``0`` = normal; ``1`` = outer; ``2`` = ignore, see :attr:`Hatch.dxf.hatch_style`
+
+    Raises:
+        HatchLineDensityError: pattern lines are too dense, more than `max_segments` segments required
+
+    .. versionadded:: 0.14
+
+    """
+    polygons = [[Vec2(v) for v in polygon] for polygon in polygons]
+    polygons = [polygon for polygon in polygons if len(polygon) > 2]
+    segments: List[Segment] = []
+    if not polygons:
+        return segments
+    if hatch_style in (HATCH_STYLE_OUTERMOST, HATCH_STYLE_IGNORE) and len(polygons) > 1:
+        max_depth = 1 if hatch_style == HATCH_STYLE_OUTERMOST else 0
+        polygons = [polygon for polygon, depth in zip(polygons, _nesting_depths(polygons)) if depth <= max_depth]
+    for angle, base_point, offset, dash_length_items in lines:
+        _hatch_pattern_line(segments, polygons, angle, Vec2(base_point), Vec2(offset), dash_length_items,
+                            max_segments)
+    return segments
+
+
+def _nesting_depths(polygons: List[List[Vec2]]) -> List[int]:
+    """ Returns the count of enclosing polygons for each polygon, expects non-intersecting polygons. """
+    depths = []
+    for index, polygon in enumerate(polygons):
+        depth = 0
+        for other_index, other in enumerate(polygons):
+            if other_index == index:
+                continue
+            for vertex in polygon:  # vertices on the boundary of the other polygon are not significant
+                location = is_point_in_polygon_2d(vertex, other)
+                if location != 0:
+                    if location > 0:
+                        depth += 1
+                    break
+        depths.append(depth)
+    return depths
+
+
+def _hatch_pattern_line(segments: List[Segment], polygons: List[List[Vec2]], angle: float, base_point: Vec2,
+                        offset: Vec2, dash_length_items: Sequence[float], max_segments: int) -> None:
+    # Work in a (u, v) coordinate system, where the pattern lines are parallel to the u-axis.
+    direction = Vec2.from_deg_angle(angle)
+    normal = direction.orthogonal()
+    spacing = offset.dot(normal)
+    shift = offset.dot(direction)
+    if abs(spacing) < ABS_TOL:  # all pattern lines are coincident
+        return
+    if spacing < 0:  # line index k with offset is line index -k with -offset
+        spacing = -spacing
+        shift = -shift
+    u0 = base_point.dot(direction)
+    v0 = base_point.dot(normal)
+
+    projected = [[(v.dot(direction), v.dot(normal)) for v in polygon] for polygon in polygons]
+    vmin = min(v for polygon in projected for _, v in polygon)
+    vmax = max(v for polygon in projected for _, v in polygon)
+    if (vmax - vmin) / spacing + len(segments) > max_segments:
+        raise HatchLineDensityError('Hatch pattern lines too dense.')
+
+    # Bucket all intersections by pattern line index k, a pattern line v = v0 + k * spacing
+    # intersects an edge, if v is in the half-open interval [min(v1, v2), max(v1, v2)).
+    intersections: Dict[int, List[float]] = dict()
+    ceil = math.ceil
+    for polygon in projected:
+        u1, v1 = polygon[-1]
+        for u2, v2 in polygon:
+            if v1 != v2:
+                if v1 < v2:
+                    low, high = v1, v2
+                else:
+                    low, high = v2, v1
+                slope = (u2 - u1) / (v2 - v1)
+                for k in range(ceil((low - v0) / spacing), ceil((high - v0) / spacing)):
+                    v = v0 + k * spacing
+                    intersections.setdefault(k, []).append(u1 + (v - v1) * slope)
+            u1, v1 = u2, v2
+
+    period = sum(abs(item) for item in dash_length_items)
+    continuous = period < ABS_TOL
+    for k, us in intersections.items():
+        us.sort()
+        v = v0 + k * spacing
+        offset_v = normal * v
+        for index in range(0, len(us) - 1, 2):
+            start = us[index]
+            end = us[index + 1]
+            if end - start < ABS_TOL:
+                continue
+            if continuous:
+                segments.append((direction * start + offset_v, direction * end + offset_v))
+            else:
+                if (end - start) / period * len(dash_length_items) + len(segments) > max_segments:
+                    raise HatchLineDensityError('Hatch pattern dashes too dense.')
+                for dash_start, dash_end in _dashes(start, end, u0 + k * shift, period, dash_length_items):
+                    segments.append((direction * dash_start + offset_v, direction * dash_end + offset_v))
+        if len(segments) > max_segments:
+            raise HatchLineDensityError('Hatch pattern lines too dense.')
+
+
+def _dashes(start: float, end: float, origin: float, period: float,
+            dash_length_items: Sequence[float]) -> Iterable[Tuple[float, float]]:
+    """ Yields the dashes of the dash pattern, starting at `origin`, inside the range [`start`, `end`). """
+    location = origin + math.floor((start - origin) / period) * period
+    while location < end:
+        for item in dash_length_items:
+            length = abs(item)
+            if item > 0:  # dash
+                dash_start = max(location, start)
+                dash_end = min(location + length, end)
+                if dash_start < dash_end:
+                    yield dash_start, dash_end
+            elif item == 0:  # dot
+                if start <= location < end:
+                    yield location, location
+            location += length
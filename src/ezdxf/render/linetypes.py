@@ -0,0 +1,164 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+from typing import TYPE_CHECKING, Iterable, Sequence, List, Tuple, Any
+from itertools import accumulate
+from ezdxf.math import Vector, X_AXIS
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Vertex
+
+__all__ = ['LineTypeRenderer']
+
+ABS_TOL = 1e-12
+
+
+class LineTypeRenderer:
+    """
+    Dash engine for linetypes, splits polylines into dashes by walking along the cumulative arc length of the
+    polyline.
+
+    The `dashes` argument is a simplified dash-gap-dash... line pattern, all elements as positive values, a dash
+    length of ``0`` is a dot, this is the same format as :attr:`ezdxf.addons.drawing.properties.Properties.linetype_pattern`.
+    The pattern has to be scaled by the effective linetype scaling in advance.
+
+    The optional `decorations` are ``(location, item)`` tuples for additional items like text or shapes of complex
+    linetypes, the location is the distance from the start of the pattern, the `item` can be any object.
+
+    Args:
+        dashes: scaled dash-gap-dash... line pattern
+        decorations: ``(location, item)`` tuples
+        max_dashes: render polylines which require more dashes as continuous lines
+
+    .. versionadded:: 0.14
+
+    """
+
+    def __init__(self, dashes: Sequence[float], decorations: Iterable[Tuple[float, Any]] = None,
+                 max_dashes: int = 10000):
+        self.dashes = tuple(dashes)
+        self.pattern_length = sum(self.dashes)
+        self.decorations = sorted(decorations or [], key=lambda d: d[0])
+        self.max_dashes = max_dashes
+
+    @property
+    def is_continuous(self) -> bool:
+        """ ``True`` if pattern renders continuous lines. """
+        return len(self.dashes) < 2 or self.pattern_length < ABS_TOL
+
+    def _pattern_count(self, length: float) -> float:
+        return length / self.pattern_length * len(self.dashes)
+
+    def line_dashes(self, vertices: Iterable['Vertex']) -> List[List[Vector]]:
+        """
+        Returns the dashes of the polyline `vertices` as list of dashes, each dash is a list of vertices, a dot is
+        a list of one vertex. Returns the polyline as single dash for continuous linetypes or if more than
+        :attr:`max_dashes` dashes are required.
+
+        """
+        vertices = _vector_list(vertices)
+        if len(vertices) < 2:
+            return [vertices] if vertices else []
+        distances = _cumulative_distances(vertices)
+        total = distances[-1]
+        if self.is_continuous or total < ABS_TOL or self._pattern_count(total) > self.max_dashes:
+            return [vertices]
+
+        result = []
+        walker = _PolylineWalker(vertices, distances)
+        location = 0.0
+        dashes = self.dashes
+        while location < total:
+            for index, length in enumerate(dashes):
+                if index % 2 == 0:  # dash or dot
+                    if length < ABS_TOL:
+                        result.append([walker.point_at(location)])
+                    else:
+                        result.append(walker.polyline(location, min(location + length, total)))
+                location += length
+                if location >= total:
+                    break
+        return result
+
+    def line_decorations(self, vertices: Iterable['Vertex']) -> List[Tuple[Any, Vector, Vector]]:
+        """
+        Returns the placements of all decorations along the polyline `vertices` as ``(item, location, direction)``
+        tuples, the `direction` is the normalized direction of the polyline segment at `location`.
+
+        """
+        if not self.decorations or self.pattern_length < ABS_TOL:
+            return []
+        vertices = _vector_list(vertices)
+        if len(vertices) < 2:
+            return []
+        distances = _cumulative_distances(vertices)
+        total = distances[-1]
+        if total < ABS_TOL or self._pattern_count(total) > self.max_dashes:
+            return []
+
+        result = []
+        walker = _PolylineWalker(vertices, distances)
+        start = 0.0
+        while start < total:
+            for offset, item in self.decorations:
+                location = start + offset
+                if location > total:
+                    break
+                result.append((item, walker.point_at(location), walker.direction()))
+            start += self.pattern_length
+        return result
+
+
+def _vector_list(vertices: Iterable['Vertex']) -> List[Vector]:
+    return [v if isinstance(v, Vector) else Vector(v) for v in vertices]
+
+
+def _cumulative_distances(vertices: List[Vector]) -> List[float]:
+    distances = [0.0]
+    distances.extend(accumulate(v1.distance(v2) for v1, v2 in zip(vertices, vertices[1:])))
+    return distances
+
+
+class _PolylineWalker:
+    """ Walks along a polyline, requested locations have to be in ascending order. """
+
+    def __init__(self, vertices: List[Vector], distances: List[float]):
+        self.vertices = vertices
+        self.distances = distances
+        self.index = 0  # index of current segment start vertex
+        self.last_index = len(vertices) - 2
+
+    def _seek(self, location: float) -> None:
+        distances = self.distances
+        index = self.index
+        while index < self.last_index and distances[index + 1] < location:
+            index += 1
+        self.index = index
+
+    def point_at(self, location: float) -> Vector:
+        self._seek(location)
+        index = self.index
+        start = self.distances[index]
+        length = self.distances[index + 1] - start
+        v1 = self.vertices[index]
+        if length < ABS_TOL:
+            return v1
+        v2 = self.vertices[index + 1]
+        t = (location - start) / length
+        x1, y1, z1 = v1.xyz
+        return Vector(x1 + (v2.x - x1) * t, y1 + (v2.y - y1) * t, z1 + (v2.z - z1) * t)
+
+    def direction(self) -> Vector:
+        index = self.index
+        direction = self.vertices[index + 1] - self.vertices[index]
+        return X_AXIS if direction.is_null else direction.normalize()
+
+    def polyline(self, start: float, end: float) -> List[Vector]:
+        vertices = [self.point_at(start)]
+        distances = self.distances
+        index = self.index + 1
+        while index <= self.last_index and distances[index] < end:
+            if distances[index] > start:
+                vertices.append(self.vertices[index])
+            index += 1
+        vertices.append(self.point_at(end))
+        return vertices
@@ -1,8 +1,10 @@
 # Purpose: simple mesh builders
 # Copyright (c) 2018-2020 Manfred Moitzi
 # License: MIT License
-from typing import List, Sequence, Tuple, Iterable, TYPE_CHECKING, Union, Dict
+from typing import List, Sequence, Tuple, Iterable, TYPE_CHECKING, Union, Dict, Set, Optional
 import warnings
+import heapq
+import math
 from ezdxf.lldxf.const import DXFValueError
 from ezdxf.math import Matrix44, Vector, NULLVEC
 from ezdxf.math.construct3d import is_planar_face, subdivide_face, normal_vector_3p, subdivide_ngons
@@ -130,6 +132,46 @@ class MeshBuilder:
         """ Returns ``True`` if any face is none planar. """
         return not all(is_planar_face(face) for face in self.faces_as_vertices())
 
+    def face_normals(self) -> List[Vector]:
+        """
+        Returns the normalized normal vectors of all faces as list in the order of :attr:`faces`, calculated by
+        Newell's method, which also works for ngons and slightly none planar faces. Returns :attr:`NULLVEC` for
+        degenerated faces.
+
+        Each vertex is converted only once into a coordinate tuple, the normals are calculated by plain float
+        arithmetic without creating intermediate :class:`~ezdxf.math.Vector` objects for each face edge.
+
+        .. versionadded:: 0.14
+
+        """
+        coords = [Vector(v).xyz for v in self.vertices]
+        normals = []
+        for face in self.faces:
+            nx = ny = nz = 0.0
+            x1, y1, z1 = coords[face[-1]]
+            for index in face:
+                x2, y2, z2 = coords[index]
+                nx += (y1 - y2) * (z1 + z2)
+                ny += (z1 - z2) * (x1 + x2)
+                nz += (x1 - x2) * (y1 + y2)
+                x1, y1, z1 = x2, y2, z2
+            length = math.sqrt(nx * nx + ny * ny + nz * nz)
+            if length > 1e-12:
+                normals.append(Vector(nx / length, ny / length, nz / length))
+            else:
+                normals.append(NULLVEC)
+        return normals
+
+    def topology(self) -> 'MeshTopology':
+        """
+        Returns the edge and face adjacency index of this mesh as :class:`MeshTopology` object. The index is a
+        snapshot, build a new index after modifying :attr:`faces`.
+
+        .. versionadded:: 0.14
+
+        """
+        return MeshTopology.from_mesh(self)
+
     def render(self, layout: 'BaseLayout', dxfattribs: dict = None, matrix: 'Matrix44' = None, ucs: 'UCS' = None):
         """
         Render mesh as :class:`~ezdxf.entities.Mesh` entity into `layout`.
@@ -309,6 +351,29 @@ class MeshTransformer(MeshBuilder):
             level -= 1
         return MeshTransformer.from_builder(mesh)
 
+    def decimate(self, target_faces: int = None, max_error: float = None) -> 'MeshTransformer':
+        """ Returns a new :class:`MeshTransformer` object with reduced face count, the opposite of
+        :meth:`subdivide`. Uses edge collapsing driven by quadric error metrics (Garland & Heckbert), all faces of
+        the new mesh are triangles. Collapses which would flip faces or create none manifold edges are rejected and
+        the shape of open boundaries is preserved. Edges are not supported and are not copied to the new mesh.
+
+        The decimation stops if the face count reaches `target_faces` or if the error of the next collapse would
+        exceed `max_error`, at least one of both arguments is required. The error of a collapse is the sum of the
+        squared distances of the new vertex to the planes of all faces merged into this vertex.
+
+        The mesh requires shared vertices to find collapsible edges, see :class:`MeshVertexMerger`.
+
+        Args:
+            target_faces: target count of triangle faces
+            max_error: max. quadric error of a single edge collapse
+
+        .. versionadded:: 0.14
+
+        """
+        if target_faces is None and max_error is None:
+            raise ValueError("Requires target_faces or max_error.")
+        return _decimate(self, target_faces, max_error)
+
     def transform(self, matrix: 'Matrix44'):
         """
         Transform mesh inplace by applying the transformation `matrix`.
@@ -438,6 +503,299 @@ def _subdivide(mesh, quads=True, edges=False) -> 'MeshVertexMerger':
     return new_mesh
 
 
+class MeshTopology:
+    """
+    Edge and face adjacency index of a mesh, the index is build once and does not track changes of the
+    source mesh.
+
+    An edge is represented by a 2-tuple of vertex indices in ascending order ``(v1, v2)``, faces are represented by
+    their index in the :attr:`~MeshBuilder.faces` list of the source mesh.
+
+    Args:
+        faces: sequence of faces, each face is a sequence of vertex indices
+        vertex_count: count of vertices of the source mesh
+
+    .. versionadded:: 0.14
+
+    """
+
+    def __init__(self, faces: Iterable[Sequence[int]], vertex_count: int):
+        self.faces: List[Sequence[int]] = list(faces)
+        self._vertex_faces: List[List[int]] = [[] for _ in range(vertex_count)]
+        self._edge_faces: Dict[Tuple[int, int], List[int]] = dict()
+        vertex_faces = self._vertex_faces
+        edge_faces = self._edge_faces
+        for face_index, face in enumerate(self.faces):
+            for index in face:
+                vertex_faces[index].append(face_index)
+            for edge in face_edges(face):
+                try:
+                    edge_faces[edge].append(face_index)
+                except KeyError:
+                    edge_faces[edge] = [face_index]
+
+    @classmethod
+    def from_mesh(cls, mesh) -> 'MeshTopology':
+        """ Create index for a `mesh` providing the attributes :attr:`vertices` and :attr:`faces`. """
+        return cls(mesh.faces, len(mesh.vertices))
+
+    def edges(self) -> Iterable[Tuple[int, int]]:
+        """ Returns all unique edges of all faces. """
+        return self._edge_faces.keys()
+
+    def edge_faces(self, v1: int, v2: int) -> List[int]:
+        """ Returns the indices of all faces sharing the edge between the vertices `v1` and `v2`. """
+        if v1 > v2:
+            v1, v2 = v2, v1
+        return self._edge_faces.get((v1, v2), [])
+
+    def vertex_faces(self, index: int) -> List[int]:
+        """ Returns the indices of all faces which use the vertex `index`. """
+        return self._vertex_faces[index]
+
+    def vertex_neighbors(self, index: int) -> Set[int]:
+        """ Returns the indices of all vertices connected by a face edge to the vertex `index`. """
+        neighbors = set()
+        faces = self.faces
+        for face_index in self._vertex_faces[index]:
+            face = faces[face_index]
+            count = len(face)
+            for i, vertex in enumerate(face):
+                if vertex == index:
+                    neighbors.add(face[i - 1])
+                    neighbors.add(face[(i + 1) % count])
+        neighbors.discard(index)
+        return neighbors
+
+    def face_neighbors(self, index: int) -> Set[int]:
+        """ Returns the indices of all faces sharing an edge with the face `index`. """
+        neighbors = set()
+        for edge in face_edges(self.faces[index]):
+            neighbors.update(self._edge_faces[edge])
+        neighbors.discard(index)
+        return neighbors
+
+    def boundary_edges(self) -> List[Tuple[int, int]]:
+        """ Returns all edges used by only one face. """
+        return [edge for edge, faces in self._edge_faces.items() if len(faces) == 1]
+
+    def none_manifold_edges(self) -> List[Tuple[int, int]]:
+        """ Returns all edges shared by more than two faces. """
+        return [edge for edge, faces in self._edge_faces.items() if len(faces) > 2]
+
+    def is_closed(self) -> bool:
+        """ Returns ``True`` if each edge is shared by exact two faces, which is a closed manifold surface. """
+        return all(len(faces) == 2 for faces in self._edge_faces.values())
+
+
+def face_edges(face: Sequence[int]) -> Iterable[Tuple[int, int]]:
+    """ Yields all edges of `face` as 2-tuple of vertex indices in ascending order. (internal API) """
+    prev = face[-1]
+    for index in face:
+        if prev < index:
+            yield prev, index
+        elif prev > index:
+            yield index, prev
+        prev = index
+
+
+# weighting of the perpendicular planes which preserve the shape of open boundaries
+BOUNDARY_WEIGHT = 1000.0
+
+
+def _plane_quadric(nx: float, ny: float, nz: float, d: float, weight: float = 1.0) -> List[float]:
+    """ Returns the error quadric of plane ``nx*x + ny*y + nz*z + d = 0`` as upper triangle of the symmetric 4x4
+    matrix: [aa, ab, ac, ad, bb, bc, bd, cc, cd, dd].
+    """
+    return [
+        nx * nx * weight, nx * ny * weight, nx * nz * weight, nx * d * weight,
+        ny * ny * weight, ny * nz * weight, ny * d * weight,
+        nz * nz * weight, nz * d * weight,
+        d * d * weight,
+    ]
+
+
+def _add_quadric(q1: List[float], q2: List[float]) -> None:
+    """ Add quadric `q2` inplace to quadric `q1`. """
+    for index in range(10):
+        q1[index] += q2[index]
+
+
+def _quadric_error(q: List[float], v: Tuple[float, float, float]) -> float:
+    x, y, z = v
+    return (q[0] * x * x + 2. * q[1] * x * y + 2. * q[2] * x * z + 2. * q[3] * x +
+            q[4] * y * y + 2. * q[5] * y * z + 2. * q[6] * y +
+            q[7] * z * z + 2. * q[8] * z + q[9])
+
+
+def _optimal_vertex(q: List[float]) -> Optional[Tuple[float, float, float]]:
+    """ Returns the location with the minimal error for quadric `q` or ``None`` if the quadric matrix is singular.
+    """
+    a, b, c, d, e, f, g, h, i, j = q
+    # Cramer's rule for: [[a, b, c], [b, e, f], [c, f, h]] * v = [-d, -g, -i]
+    det = a * (e * h - f * f) - b * (b * h - f * c) + c * (b * f - e * c)
+    if abs(det) < 1e-12:
+        return None
+    d, g, i = -d, -g, -i
+    x = d * (e * h - f * f) - b * (g * h - f * i) + c * (g * f - e * i)
+    y = a * (g * h - f * i) - d * (b * h - f * c) + c * (b * i - g * c)
+    z = a * (e * i - g * f) - b * (b * i - g * c) + d * (b * f - e * c)
+    return x / det, y / det, z / det
+
+
+def _collapse_cost(q1: List[float], q2: List[float], v1: Tuple[float, float, float],
+                   v2: Tuple[float, float, float]) -> Tuple[float, Tuple[float, float, float]]:
+    q = [a + b for a, b in zip(q1, q2)]
+    candidates = [v1, v2, ((v1[0] + v2[0]) * .5, (v1[1] + v2[1]) * .5, (v1[2] + v2[2]) * .5)]
+    optimal = _optimal_vertex(q)
+    if optimal is not None:
+        candidates.insert(0, optimal)
+    return min((_quadric_error(q, v), v) for v in candidates)
+
+
+def _triangles(face: Sequence[int]) -> Iterable[Tuple[int, int, int]]:
+    """ Yields the triangles of a fan triangulation of `face`, skips degenerated triangles. """
+    first = face[0]
+    for index in range(1, len(face) - 1):
+        triangle = (first, face[index], face[index + 1])
+        if len(set(triangle)) == 3:
+            yield triangle
+
+
+def _triangle_normal(a: Tuple[float, float, float], b: Tuple[float, float, float],
+                     c: Tuple[float, float, float]) -> Tuple[float, float, float]:
+    """ Returns the normalized normal vector of triangle `a`, `b`, `c` as tuple, returns ``(0, 0, 0)`` for
+    degenerated triangles.
+    """
+    ux, uy, uz = b[0] - a[0], b[1] - a[1], b[2] - a[2]
+    vx, vy, vz = c[0] - a[0], c[1] - a[1], c[2] - a[2]
+    nx = uy * vz - uz * vy
+    ny = uz * vx - ux * vz
+    nz = ux * vy - uy * vx
+    length = math.sqrt(nx * nx + ny * ny + nz * nz)
+    if length < 1e-12:
+        return 0., 0., 0.
+    return nx / length, ny / length, nz / length
+
+
+def _decimate(mesh: MeshBuilder, target_faces: Optional[int], max_error: Optional[float]) -> 'MeshTransformer':
+    # the heavy lifting is done by plain float tuples, Vector() objects are too expensive
+    vertices = [Vector(v).xyz for v in mesh.vertices]
+    faces: List[List[int]] = [list(t) for face in mesh.faces for t in _triangles(face)]
+    quadrics = [[0.0] * 10 for _ in range(len(vertices))]
+    topology = MeshTopology(faces, len(vertices))
+    vertex_faces: List[Set[int]] = [set(topology.vertex_faces(index)) for index in range(len(vertices))]
+
+    normals = []
+    for a, b, c in faces:
+        n = _triangle_normal(vertices[a], vertices[b], vertices[c])
+        normals.append(n)
+        q = _plane_quadric(n[0], n[1], n[2], -(n[0] * vertices[a][0] + n[1] * vertices[a][1] + n[2] * vertices[a][2]))
+        for index in (a, b, c):
+            _add_quadric(quadrics[index], q)
+
+    for v1, v2 in topology.boundary_edges():
+        face_normal = Vector(normals[topology.edge_faces(v1, v2)[0]])
+        start = Vector(vertices[v1])
+        n = (Vector(vertices[v2]) - start).cross(face_normal)
+        if n.is_null:
+            continue
+        n = n.normalize()
+        q = _plane_quadric(n.x, n.y, n.z, -n.dot(start), BOUNDARY_WEIGHT)
+        _add_quadric(quadrics[v1], q)
+        _add_quadric(quadrics[v2], q)
+
+    # vertex version is incremented for each change of the vertex, -1 marks removed vertices
+    version = [0] * len(vertices)
+    heap = []
+    counter = 0
+
+    def push(v1: int, v2: int) -> None:
+        nonlocal counter
+        cost, location = _collapse_cost(quadrics[v1], quadrics[v2], vertices[v1], vertices[v2])
+        counter += 1
+        heapq.heappush(heap, (cost, counter, v1, v2, version[v1], version[v2], location))
+
+    def neighbors(index: int) -> Set[int]:
+        result = set()
+        for face_index in vertex_faces[index]:
+            result.update(faces[face_index])
+        result.discard(index)
+        return result
+
+    def is_valid_collapse(v1: int, v2: int, location: Tuple[float, float, float]) -> bool:
+        shared_faces = vertex_faces[v1] & vertex_faces[v2]
+        # link condition: common neighbors have to be opposite vertices of the shared faces
+        opposite = set()
+        for face_index in shared_faces:
+            opposite.update(faces[face_index])
+        if not (neighbors(v1) & neighbors(v2)) <= opposite:
+            return False
+        # reject face flipping
+        for face_index in (vertex_faces[v1] | vertex_faces[v2]) - shared_faces:
+            old = normals[face_index]
+            new = _triangle_normal(*(location if i == v1 or i == v2 else vertices[i] for i in faces[face_index]))
+            if new == (0., 0., 0.) or old[0] * new[0] + old[1] * new[1] + old[2] * new[2] < 0.:
+                return False
+        return True
+
+    for v1, v2 in topology.edges():
+        push(v1, v2)
+
+    face_count = len(faces)
+    target_faces = 0 if target_faces is None else int(target_faces)
+    while heap and face_count > target_faces:
+        cost, _, v1, v2, version1, version2, location = heapq.heappop(heap)
+        if max_error is not None and cost > max_error:
+            break
+        if version[v1] != version1 or version[v2] != version2:
+            continue  # outdated entry
+        if not is_valid_collapse(v1, v2, location):
+            continue
+
+        # collapse vertex v2 into vertex v1
+        for face_index in vertex_faces[v2]:
+            face = faces[face_index]
+            if v1 in face:  # degenerated face
+                for index in face:
+                    if index != v2:
+                        vertex_faces[index].discard(face_index)
+                face_count -= 1
+            else:
+                face[face.index(v2)] = v1
+                vertex_faces[v1].add(face_index)
+        vertex_faces[v2] = set()
+        vertices[v1] = location
+        _add_quadric(quadrics[v1], quadrics[v2])
+        version[v1] += 1
+        version[v2] = -1
+        for face_index in vertex_faces[v1]:
+            a, b, c = faces[face_index]
+            normals[face_index] = _triangle_normal(vertices[a], vertices[b], vertices[c])
+        for index in neighbors(v1):
+            push(v1, index)
+
+    # build compact mesh from remaining faces
+    new_mesh = MeshTransformer()
+    new_indices: Dict[int, int] = dict()
+    new_vertices = new_mesh.vertices
+    used_faces = set()
+    for face_set in vertex_faces:
+        used_faces.update(face_set)
+    for face_index in sorted(used_faces):
+        new_face = []
+        for index in faces[face_index]:
+            try:
+                new_face.append(new_indices[index])
+            except KeyError:
+                new_index = len(new_vertices)
+                new_vertices.append(Vector(vertices[index]))
+                new_indices[index] = new_index
+                new_face.append(new_index)
+        new_mesh.faces.append(tuple(new_face))
+    return new_mesh
+
+
 class MeshVertexMerger(MeshBuilder):
     """
     Subclass of :class:`MeshBuilder`
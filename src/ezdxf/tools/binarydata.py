@@ -96,6 +96,10 @@ class ByteStream:
         raise EndOfBufferError('Unexpected end of buffer, did not detect terminating zero bytes.')
 
 
+# BIT_MASKS[count] masks the lowest `count` bits of a byte
+BIT_MASKS = tuple((1 << count) - 1 for count in range(9))
+
+
 class BitStream:
     """ Process little endian binary data organized as bit stream. """
 
@@ -125,50 +129,63 @@ class BitStream:
     def read_bit(self) -> int:
         """ Read one bit from buffer. """
         index = self.bit_index
-        self.bit_index += 1
         try:
-            return 1 if self.buffer[index >> 3] & (0x80 >> (index & 7)) else 0
+            byte = self.buffer[index >> 3]
         except IndexError:
             raise EndOfBufferError('Unexpected end of buffer.')
+        self.bit_index = index + 1
+        return (byte >> (7 - (index & 7))) & 1
 
     def read_bits(self, count) -> int:
         """ Read `count` bits from buffer. """
         index = self.bit_index
-        buffer = self.buffer
         next_bit_index = index + count  # index of next bit after reading `count` bits
+        shift = 8 - (index & 7) - count
+        if shift >= 0:  # all bits in one byte
+            try:
+                byte = self.buffer[index >> 3]
+            except IndexError:
+                if count:
+                    raise EndOfBufferError('Unexpected end of buffer.')
+                return 0
+            self.bit_index = next_bit_index
+            return (byte >> shift) & BIT_MASKS[count]
 
-        if (next_bit_index - 1) >> 3 > len(buffer):  # not enough data to read all bits
+        end_byte_index = (next_bit_index + 7) >> 3
+        if end_byte_index > len(self.buffer):  # not enough data to read all bits
             raise EndOfBufferError('Unexpected end of buffer.')
         self.bit_index = next_bit_index
+        value = int.from_bytes(self.buffer[index >> 3: end_byte_index], 'big')
+        return (value >> (-next_bit_index & 7)) & ((1 << count) - 1)
 
-        test_bit = 0x80 >> (index & 7)
-        test_byte_index = index >> 3
-        value = 0
-        test_byte = buffer[test_byte_index]
-        while count > 0:
-            value <<= 1
-            if test_byte & test_bit:
-                value |= 1
-            count -= 1
-            test_bit >>= 1
-            if not test_bit and count:
-                test_bit = 0x80
-                test_byte_index += 1
-                test_byte = buffer[test_byte_index]
-        return value
+    def _read_bytes(self, count: int) -> Bytes:
+        """ Read `count` bytes from buffer, returns a slice of the buffer for aligned data. """
+        index = self.bit_index
+        if index & 7:
+            return self.read_bits(count << 3).to_bytes(count, 'big')
+        start_index = index >> 3
+        end_index = start_index + count
+        if end_index > len(self.buffer):
+            raise EndOfBufferError('Unexpected end of buffer.')
+        self.bit_index = end_index << 3
+        return self.buffer[start_index: end_index]
 
     def read_unsigned_byte(self) -> int:
         """ Read an unsigned byte (8 bit) from buffer. """
-        return self.read_bits(8)
+        index = self.bit_index
+        if index & 7:
+            return self.read_bits(8)
+        try:
+            byte = self.buffer[index >> 3]
+        except IndexError:
+            raise EndOfBufferError('Unexpected end of buffer.')
+        self.bit_index = index + 8
+        return byte
 
     def read_signed_byte(self) -> int:
         """ Read a signed byte (8 bit) from buffer. """
-        value = self.read_bits(8)
-        if value & 0x80:
-            # 2er complement
-            return -((~value & 0xff) + 1)
-        else:
-            return value
+        value = self.read_unsigned_byte()
+        return value - 0x100 if value & 0x80 else value
 
     def read_aligned_bytes(self, count: int) -> Sequence[int]:
         buffer = self.buffer
@@ -182,50 +199,22 @@ class BitStream:
 
     def read_unsigned_short(self) -> int:
         """ Read an unsigned short (16 bit) from buffer. """
-        if self.bit_index & 7:
-            s1 = self.read_bits(8)
-            s2 = self.read_bits(8)
-        else:  # aligned data
-            s1, s2 = self.read_aligned_bytes(2)
-        return (s2 << 8) + s1
+        return int.from_bytes(self._read_bytes(2), 'little')
 
     def read_signed_short(self) -> int:
         """ Read a signed short (16 bit) from buffer. """
-        value = self.read_unsigned_short()
-        if value & 0x8000:
-            # 2er complement
-            return -((~value & 0xffff) + 1)
-        else:
-            return value
+        return int.from_bytes(self._read_bytes(2), 'little', signed=True)
 
     def read_unsigned_long(self) -> int:
         """ Read an unsigned long (32 bit) from buffer. """
-        if self.bit_index & 7:
-            read_bits = self.read_bits
-            l1 = read_bits(8)
-            l2 = read_bits(8)
-            l3 = read_bits(8)
-            l4 = read_bits(8)
-        else:  # aligned data
-            l1, l2, l3, l4 = self.read_aligned_bytes(4)
-        return (l4 << 24) + (l3 << 16) + (l2 << 8) + l1
+        return int.from_bytes(self._read_bytes(4), 'little')
 
     def read_signed_long(self) -> int:
         """ Read a signed long (32 bit) from buffer. """
-        value = self.read_unsigned_long()
-        if value & 0x80000000:
-            # 2er complement
-            return -((~value & 0xffffffff) + 1)
-        else:
-            return value
+        return int.from_bytes(self._read_bytes(4), 'little', signed=True)
 
     def read_float(self) -> float:
-        if self.bit_index & 7:
-            read_bits = self.read_bits
-            data = bytes(read_bits(8) for _ in range(8))
-        else:  # aligned data
-            data = bytes(self.read_aligned_bytes(8))
-        return struct.unpack('<d', data)[0]
+        return struct.unpack('<d', self._read_bytes(8))[0]
 
     def read_3_bits(self) -> int:
         bit = self.read_bit()
@@ -241,39 +230,39 @@ class BitStream:
         else:
             return 0  # 0
 
-    def read_bit_short(self, count=1) -> Union[int, Sequence[int]]:
-        def _read():
-            bits = self.read_bits(2)
-            if bits == 0:
-                return self.read_signed_short()
-            elif bits == 1:
-                return self.read_unsigned_byte()
-            elif bits == 2:
-                return 0
-            else:
-                return 256
+    def _read_bit_short(self) -> int:
+        bits = self.read_bits(2)
+        if bits == 0:
+            return self.read_signed_short()
+        elif bits == 1:
+            return self.read_unsigned_byte()
+        elif bits == 2:
+            return 0
+        else:
+            return 256
 
+    def read_bit_short(self, count=1) -> Union[int, Sequence[int]]:
         if count == 1:
-            return _read()
+            return self._read_bit_short()
         else:
-            return tuple(_read() for _ in range(count))
+            return tuple(self._read_bit_short() for _ in range(count))
 
-    def read_bit_long(self, count: int = 1) -> Union[int, Sequence[int]]:
-        def _read():
-            bits = self.read_bits(2)
-            if bits == 0:
-                return self.read_signed_long()
-            elif bits == 1:
-                return self.read_unsigned_byte()
-            elif bits == 2:
-                return 0
-            else:  # not used!
-                return 256  # ???
+    def _read_bit_long(self) -> int:
+        bits = self.read_bits(2)
+        if bits == 0:
+            return self.read_signed_long()
+        elif bits == 1:
+            return self.read_unsigned_byte()
+        elif bits == 2:
+            return 0
+        else:  # not used!
+            return 256  # ???
 
+    def read_bit_long(self, count: int = 1) -> Union[int, Sequence[int]]:
         if count == 1:
-            return _read()
+            return self._read_bit_long()
         else:
-            return tuple(_read() for _ in range(count))
+            return tuple(self._read_bit_long() for _ in range(count))
 
     # LibreDWG: https://github.com/LibreDWG/libredwg/blob/master/src/bits.c
     # Read 1 bitlonglong (compacted uint64_t) for REQUIREDVERSIONS, preview_size.
@@ -295,51 +284,42 @@ class BitStream:
         if count == 1:
             return self.read_float()
         else:
-            return tuple(self.read_float() for _ in range(count))
+            return struct.unpack(f'<{count}d', self._read_bytes(count << 3))
 
-    def read_bit_double(self, count: int = 1) -> Union[float, Sequence[float]]:
-        def _read():
-            bits = self.read_bits(2)
-            if bits == 0:
-                return self.read_float()
-            elif bits == 1:
-                return 1.0
-            elif bits == 2:
-                return 0.0
-            else:  # not used!
-                return 0.0
+    def _read_bit_double(self) -> float:
+        bits = self.read_bits(2)
+        if bits == 0:
+            return self.read_float()
+        elif bits == 1:
+            return 1.0
+        else:  # 3 is not used!
+            return 0.0
 
+    def read_bit_double(self, count: int = 1) -> Union[float, Sequence[float]]:
         if count == 1:
-            return _read()
+            return self._read_bit_double()
         else:
-            return tuple(_read() for _ in range(count))
+            return tuple(self._read_bit_double() for _ in range(count))
+
+    def _read_bit_double_default(self, default: bytes) -> float:
+        bits = self.read_bits(2)
+        if bits == 0:
+            data = default
+        elif bits == 1:
+            data = bytes(self._read_bytes(4)) + default[4:]
+        elif bits == 2:
+            data = self._read_bytes(6)
+            data = bytes(data[2:6]) + bytes(data[:2]) + default[6:]
+        else:
+            return self.read_float()
+        return struct.unpack('<d', data)[0]
 
     def read_bit_double_default(self, count: int = 1, default=0.0) -> Union[float, Sequence[float]]:
         data = struct.pack('<d', default)
-
-        def _read():
-            bits = self.read_bits(2)
-            if bits == 0:
-                return default
-            elif bits == 1:
-                _data = bytes(self.read_unsigned_byte() for _ in range(4)) + data[4:]
-                return struct.unpack('<d', _data)
-            elif bits == 2:
-                _data = bytearray(data)
-                _data[4] = self.read_unsigned_byte()
-                _data[5] = self.read_unsigned_byte()
-                _data[0] = self.read_unsigned_byte()
-                _data[1] = self.read_unsigned_byte()
-                _data[2] = self.read_unsigned_byte()
-                _data[3] = self.read_unsigned_byte()
-                return struct.unpack('<d', _data)
-            else:
-                return self.read_float()
-
         if count == 1:
-            return _read()
+            return self._read_bit_double_default(data)
         else:
-            return tuple(_read() for _ in range(count))
+            return tuple(self._read_bit_double_default(data) for _ in range(count))
 
     def read_signed_modular_chars(self) -> int:
         """
@@ -410,15 +390,13 @@ class BitStream:
 
     def read_text(self) -> str:
         length = self.read_bit_short()
-        data = bytes(self.read_unsigned_byte() for _ in range(length))
-        return data.decode(encoding=self.encoding)
+        return bytes(self._read_bytes(length)).decode(encoding=self.encoding)
 
     def read_text_unicode(self) -> str:
         # Unicode text is read from the "string stream" within the object data,
         # see the main Object description section for details.
         length = self.read_bit_short()
-        data = bytes(self.read_unsigned_byte() for _ in range(length * 2))
-        return data.decode(encoding='utf16')
+        return bytes(self._read_bytes(length * 2)).decode(encoding='utf16')
 
     def read_text_variable(self) -> str:
         if self.dxfversion < 'AC1018':  # R2004
@@ -481,10 +459,7 @@ class BitStream:
         if code == 8:
             return reference - 1
 
-        data = bytearray(b'\x00\x00\x00\x00\x00\x00\x00\x00')
-        for index in range(length):
-            data[index] = self.read_unsigned_byte()
-        offset = struct.unpack('<Q', data)[0]
+        offset = int.from_bytes(self._read_bytes(length), 'little')
 
         if code < 6:
             return offset
@@ -0,0 +1,88 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+from typing import TYPE_CHECKING, Iterable, Dict, NamedTuple, Any
+from array import array
+import sys
+import types
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import DXFEntity
+
+__all__ = ['MemoryUsage', 'entity_memory_usage']
+
+# objects of this types are not part of the entity data
+SKIP_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+# objects of this types do not reference other objects
+LEAF_TYPES = (str, bytes, int, float, complex, bool, type(None), array)
+
+
+class MemoryUsage(NamedTuple):
+    """ Memory usage of all entities of a DXF type. """
+    count: int  # count of entities
+    size: int  # size in bytes
+
+    @property
+    def size_per_entity(self) -> float:
+        """ Average size of an entity in bytes. """
+        return self.size / self.count if self.count else 0.
+
+
+def entity_memory_usage(entities: Iterable['DXFEntity']) -> Dict[str, MemoryUsage]:
+    """
+    Returns the memory usage of `entities` grouped by DXF type as :class:`MemoryUsage` tuples.
+
+    The size of an entity is the size of all objects reachable from the entity, except the DXF document, other
+    DXF entities, classes and functions. Objects shared by multiple entities like interned strings or shared
+    default values are counted only once, for the first entity referencing the object. The result is an
+    approximation, the overhead of the Python memory allocator is not included.
+
+    Args:
+        entities: iterable of DXF entities, e.g. all entities of the entity database ``doc.entitydb.values()``
+
+    .. versionadded:: 0.14
+
+    """
+    from ezdxf.entities.dxfentity import DXFEntity
+    from ezdxf.drawing import Drawing
+    skip_types = SKIP_TYPES + (DXFEntity, Drawing)
+    getsizeof = sys.getsizeof
+    seen = set()
+    usage = dict()  # type: Dict[str, MemoryUsage]
+    for entity in entities:
+        seen.add(id(entity))
+        size = getsizeof(entity)
+        stack = list(_referents(entity))
+        while stack:
+            obj = stack.pop()
+            if id(obj) in seen or isinstance(obj, skip_types):
+                continue
+            seen.add(id(obj))
+            size += getsizeof(obj)
+            if not isinstance(obj, LEAF_TYPES):
+                stack.extend(_referents(obj))
+        dxftype = entity.dxftype()
+        count, total = usage.get(dxftype, (0, 0))
+        usage[dxftype] = MemoryUsage(count + 1, total + size)
+    return usage
+
+
+def _referents(obj: Any) -> Iterable[Any]:
+    if isinstance(obj, dict):
+        yield from obj.keys()
+        yield from obj.values()
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        yield from obj
+    else:
+        try:
+            yield vars(obj)
+        except TypeError:  # object without __dict__
+            pass
+        for cls in type(obj).__mro__:
+            slots = cls.__dict__.get('__slots__', ())
+            for name in ((slots,) if isinstance(slots, str) else slots):
+                if name in ('__dict__', '__weakref__'):
+                    continue
+                try:
+                    yield cls.__dict__[name].__get__(obj)
+                except (AttributeError, KeyError):  # unset slot or name mangling
+                    pass
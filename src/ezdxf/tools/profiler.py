@@ -0,0 +1,172 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+from typing import Dict, List, Optional, Any
+from contextlib import contextmanager
+import threading
+import time
+import tracemalloc
+
+__all__ = ['PhaseRecord', 'PhaseProfiler', 'profile_phases', 'active_profiler', 'phase']
+
+
+class PhaseRecord:
+    """ Accumulated measurements of a loading or saving phase or of a DXF type. """
+    __slots__ = ('calls', 'time', 'memory', 'items')
+
+    def __init__(self):
+        self.calls = 0  # count of entered phases or loaded entities
+        self.time = 0.  # wall time in seconds
+        self.memory = 0  # net allocated memory in bytes, 0 if memory tracing is disabled
+        self.items = 0  # processed items: tags for phase 'tagging', entities for all other phases
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {'calls': self.calls, 'time': self.time, 'memory': self.memory, 'items': self.items}
+
+
+class PhaseProfiler:
+    """
+    Report object of :func:`profile_phases`, records the wall time, processed items and allocated memory for each
+    loading and saving phase and for each loaded DXF type.
+
+    Loading phases: ``'tagging'``, ``'load_dxf_structure'``, ``'fill_database'``, ``'sections'``,
+    ``'arrow_blocks'`` and ``'layouts'``, loading in legacy mode adds the phases ``'repair'`` and ``'compile'``
+    after ``'tagging'``.
+
+    Saving phases: ``'prepare_export'`` and ``'export:<SECTION>'`` for each exported section like
+    ``'export:ENTITIES'``.
+
+    Attributes:
+        phases: :class:`PhaseRecord` for each phase name
+        loaded_types: :class:`PhaseRecord` for each loaded DXF type
+        exported_types: count of exported entities for each DXF type
+
+    .. versionadded:: 0.14
+
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.phases: Dict[str, PhaseRecord] = dict()
+        self.loaded_types: Dict[str, PhaseRecord] = dict()
+        self.exported_types: Dict[str, int] = dict()
+        self._stack: List[PhaseRecord] = []
+
+    def traced_memory(self) -> int:
+        """ Returns the currently traced memory in bytes or 0 if memory tracing is disabled. """
+        return tracemalloc.get_traced_memory()[0] if self.trace_memory else 0
+
+    @contextmanager
+    def phase(self, name: str):
+        """ Context manager to measure phase `name`, measurements of repeated phases are accumulated. """
+        record = self.phases.get(name)
+        if record is None:
+            record = self.phases[name] = PhaseRecord()
+        self._stack.append(record)
+        memory = self.traced_memory()
+        t0 = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.time += time.perf_counter() - t0
+            record.memory += self.traced_memory() - memory
+            record.calls += 1
+            self._stack.pop()
+
+    def add_items(self, count: int) -> None:
+        """ Add `count` processed items to the current phase. """
+        if self._stack:
+            self._stack[-1].items += count
+
+    def entity_loaded(self, dxftype: str, seconds: float, memory: int) -> None:
+        record = self.loaded_types.get(dxftype)
+        if record is None:
+            record = self.loaded_types[dxftype] = PhaseRecord()
+        record.calls += 1
+        record.items += 1
+        record.time += seconds
+        record.memory += memory
+        self.add_items(1)
+
+    def entity_exported(self, dxftype: str) -> None:
+        self.exported_types[dxftype] = self.exported_types.get(dxftype, 0) + 1
+        self.add_items(1)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """ Returns the report as JSON serializable dict. """
+        return {
+            'phases': {name: record.as_dict() for name, record in self.phases.items()},
+            'loaded_types': {name: record.as_dict() for name, record in self.loaded_types.items()},
+            'exported_types': dict(self.exported_types),
+        }
+
+    def __str__(self) -> str:
+        lines = []
+        for name, record in self.phases.items():
+            lines.append(f'Phase {name}: {record.time:.3f} seconds, {record.items} items, {record.memory} bytes')
+        for name, record in sorted(self.loaded_types.items()):
+            lines.append(f'Loaded {record.items} {name}: {record.time:.3f} seconds, {record.memory} bytes')
+        for name, count in sorted(self.exported_types.items()):
+            lines.append(f'Exported {count} {name}')
+        return '\n'.join(lines)
+
+
+# the active profiler is stored per thread, a profiler records only the documents loaded and saved by its own thread
+_state = threading.local()
+
+
+@contextmanager
+def profile_phases(trace_memory: bool = False):
+    """
+    Context manager to profile the loading and saving phases of DXF documents, yields a :class:`PhaseProfiler`
+    report object::
+
+        with profile_phases() as report:
+            doc = ezdxf.readfile('my.dxf')
+            doc.saveas('out.dxf')
+        print(report.as_dict())
+
+    The profiler is only active in the thread which entered the context manager, loading and saving documents
+    in other threads is not recorded. Tracing the allocated memory by :mod:`tracemalloc` slows down loading and
+    saving a lot and the memory is traced process wide, the recorded memory includes the allocations of other
+    threads.
+
+    Args:
+        trace_memory: trace allocated memory if ``True``
+
+    .. versionadded:: 0.14
+
+    """
+    previous = getattr(_state, 'profiler', None)
+    profiler = PhaseProfiler(trace_memory)
+    start_tracing = trace_memory and not tracemalloc.is_tracing()
+    if start_tracing:
+        tracemalloc.start()
+    _state.profiler = profiler
+    try:
+        yield profiler
+    finally:
+        _state.profiler = previous
+        if start_tracing:
+            tracemalloc.stop()
+
+
+def active_profiler() -> Optional[PhaseProfiler]:
+    """ Returns the active :class:`PhaseProfiler` of the current thread or ``None``. """
+    return getattr(_state, 'profiler', None)
+
+
+class _NullPhase:
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *args):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+def phase(name: str):
+    """ Context manager to measure phase `name` by the active profiler, does nothing if profiling is disabled. """
+    profiler = getattr(_state, 'profiler', None)
+    return _NULL_PHASE if profiler is None else profiler.phase(name)
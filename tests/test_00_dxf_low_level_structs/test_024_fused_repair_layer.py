@@ -0,0 +1,158 @@
+# Copyright (c) 2020 Manfred Moitzi
+# License: MIT License
+import pytest
+from io import StringIO
+
+import ezdxf
+from ezdxf.lldxf.const import DXFAppDataError
+from ezdxf.lldxf.tagger import ascii_tags_loader
+from ezdxf.tools.profiler import profile_phases
+from ezdxf.lldxf.repair import (
+    tag_reorder_layer, filter_invalid_yz_point_codes, fused_repair_layer, RepairReport,
+    FIX_LINE_COORDINATE_ORDER, FIX_INVALID_YZ_POINT_CODES, ALL_FIXES,
+)
+
+
+def tags(s: str):
+    return list(ascii_tags_loader(StringIO(s)))
+
+
+def test_fused_layer_matches_chained_filters():
+    expected = list(filter_invalid_yz_point_codes(tag_reorder_layer(tags(MESSY_R12))))
+    report = RepairReport()
+    result = list(fused_repair_layer(tags(MESSY_R12), ALL_FIXES, report=report))
+    assert result == expected
+    assert report.fixed_entities == 1
+    assert report.removed_tags == 2
+
+
+def test_fused_layer_applies_only_selected_fixes():
+    result = list(fused_repair_layer(tags(MESSY_R12), frozenset([FIX_INVALID_YZ_POINT_CODES])))
+    assert result == list(filter_invalid_yz_point_codes(tags(MESSY_R12)))
+    result = list(fused_repair_layer(tags(MESSY_R12), frozenset()))
+    assert result == tags(MESSY_R12)
+
+
+def test_fused_layer_validates_entity_structure():
+    data = tags(INVALID_APP_DATA)
+    with pytest.raises(DXFAppDataError):
+        list(fused_repair_layer(data, ALL_FIXES))
+    assert len(list(fused_repair_layer(data, ALL_FIXES, validate=False))) == len(data)
+
+
+def test_load_legacy_mode_fixes_r2000_line():
+    doc = ezdxf.read(StringIO(R2000_HEADER + MESSY_ENTITIES), legacy_mode=True)
+    line = doc.modelspace()[0]
+    assert line.dxf.start == (1, 2, 3)
+    assert line.dxf.end == (4, 5, 6)
+    assert doc.repair_report.fixed_entities == 1
+
+
+def test_load_legacy_mode_report():
+    doc = ezdxf.read(StringIO(MESSY_R12), legacy_mode=True)
+    line = doc.modelspace()[0]
+    assert line.dxf.start == (1, 2, 3)
+    assert line.dxf.end == (4, 5, 6)
+    report = doc.repair_report
+    assert report.fixes == ALL_FIXES
+    assert report.fixed_entities == 1
+    assert 'Fixed entities: 1' in str(report)
+
+
+def test_profile_legacy_mode_stages():
+    with profile_phases() as profiler:
+        ezdxf.read(StringIO(MESSY_R12), legacy_mode=True)
+    assert list(profiler.phases)[:4] == ['tagging', 'repair', 'compile', 'load_dxf_structure']
+
+
+def test_load_without_legacy_mode_has_no_report():
+    doc = ezdxf.read(StringIO(R2000_HEADER + '  0\nEOF\n'))
+    assert doc.repair_report is None
+
+
+MESSY_R12 = """  0
+SECTION
+  2
+HEADER
+  9
+$ACADVER
+  1
+AC1009
+  0
+ENDSEC
+  0
+SECTION
+  2
+ENTITIES
+  0
+LINE
+  8
+0
+ 10
+1
+ 11
+4
+ 20
+2
+ 21
+5
+ 30
+3
+ 31
+6
+  0
+POINT
+  8
+0
+ 10
+1
+ 20
+2
+ 30
+3
+ 20
+7
+ 21
+8
+  0
+ENDSEC
+  0
+EOF
+"""
+
+MESSY_ENTITIES = MESSY_R12[MESSY_R12.index('  0\nSECTION\n  2\nENTITIES'):]
+
+INVALID_APP_DATA = """  0
+SECTION
+  2
+ENTITIES
+  0
+POINT
+102
+{ACAD_REACTORS
+  8
+0
+  0
+ENDSEC
+  0
+EOF
+"""
+
+R2000_HEADER = """  0
+SECTION
+  2
+HEADER
+  9
+$ACADVER
+  1
+AC1015
+  9
+$HANDSEED
+  5
+FFFF
+  0
+ENDSEC
+"""
+
+if __name__ == '__main__':
+    pytest.main([__file__])
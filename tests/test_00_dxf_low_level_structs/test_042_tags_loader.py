@@ -4,6 +4,7 @@ import pytest
 from io import StringIO
 
 from ezdxf.lldxf.tagger import internal_tag_compiler, ascii_tags_loader, tag_compiler, DXFStructureError
+from ezdxf.lldxf.tagger import binary_tags_loader
 from ezdxf.lldxf.types import strtag, DXFTag, DXFVertex
 from ezdxf.math.vector import Vector
 
@@ -146,6 +147,27 @@ def test_polyline_with_xdata():
     assert len(tags) == 49
 
 
+def test_tag_compiler_interns_repeated_names():
+    text = '  0\nLINE\n  8\nLAYER\n  1\nTEXT\n  0\nLINE\n  8\nLAYER\n  1\nTEXT\n'
+    tags = list(tag_compiler(ascii_tags_loader(StringIO(text))))
+    assert tags[0].value is tags[3].value, 'structure tags should be interned'
+    assert tags[1].value is tags[4].value, 'layer names should be interned'
+    assert tags[2].value == tags[5].value
+    assert tags[2].value is not tags[5].value, 'text content should not be interned'
+
+
+def test_binary_tags_loader_interns_repeated_names():
+    # DXF R12 binary data: 1-byte group codes and zero terminated strings, values are created by slicing
+    tags = b''.join(bytes([code]) + value.encode() + b'\x00' for code, value in [
+        (0, 'LINE'), (8, 'LAYER'), (1, 'TEXT'), (0, 'LINE'), (8, 'LAYER'), (1, 'TEXT'),
+    ])
+    tags = list(binary_tags_loader(b'AutoCAD Binary DXF\r\n\x1a\x00' + tags))
+    assert tags[0].value is tags[3].value, 'structure tags should be interned'
+    assert tags[1].value is tags[4].value, 'layer names should be interned'
+    assert tags[2].value == tags[5].value
+    assert tags[2].value is not tags[5].value, 'text content should not be interned'
+
+
 TAGS1 = """999
 comment
   0
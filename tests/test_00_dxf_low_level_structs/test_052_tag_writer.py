@@ -1,8 +1,8 @@
 # Copyright (c) 2010-2019 Manfred Moitzi
 # License: MIT License
 import pytest
-from io import StringIO
-from ezdxf.lldxf.tagwriter import TagWriter, TagCollector
+from io import StringIO, BytesIO
+from ezdxf.lldxf.tagwriter import TagWriter, BinaryTagWriter, TagCollector
 from ezdxf.lldxf.types import DXFTag, DXFVertex
 
 
@@ -33,6 +33,24 @@ def test_write_point_tag():
     assert result == ' 10\n7.0\n 20\n8.0\n 30\n9.0\n'
 
 
+def test_write_tags2():
+    s, t = setup_stream()
+    t.write_tags2([(0, 'LINE'), (10, 7.), (20, 8.), (62, 1)])
+    assert s.getvalue() == '  0\nLINE\n 10\n7.0\n 20\n8.0\n 62\n1\n'
+
+
+@pytest.mark.parametrize('dxfversion', ['AC1009', 'AC1015'])
+def test_binary_write_tags2_is_equal_to_write_tag2(dxfversion):
+    tags = [(0, 'LINE'), (10, 7.), (62, 1), (70, 1), (1000, 'XDATA'), (1004, b'\x01\x02')]
+    stream1 = BytesIO()
+    BinaryTagWriter(stream1, dxfversion).write_tags2(tags)
+    stream2 = BytesIO()
+    writer = BinaryTagWriter(stream2, dxfversion)
+    for code, value in tags:
+        writer.write_tag2(code, value)
+    assert stream1.getvalue() == stream2.getvalue()
+
+
 def test_write_str():
     s, t = setup_stream()
     t.write_str(' 10\n7.0\n 20\n8.0\n 30\n9.0\n')
@@ -67,6 +85,10 @@ class TestTagCollector:
         assert t.tags[1] == (20, 8.)
         assert t.tags[2] == (30, 9.)
 
+    def test_write_tags2(self, t):
+        t.write_tags2([(10, 7.), (20, 8.)])
+        assert t.tags == [(10, 7.), (20, 8.)]
+
     def test_write_str(self, t):
         t.write_str(' 10\n7.0\n 20\n8.0\n 30\n9.0\n')
         assert t.tags[0] == (10, 7.)
@@ -16,6 +16,12 @@ class DXFEntity:
     DXFTYPE = 'DXFENTITY'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_line)
 
+    def __init__(self):
+        self._revision = 0
+
+    def set_modified(self):
+        self._revision += 1
+
 
 @pytest.fixture
 def entity():
@@ -204,6 +210,129 @@ def test_load_doublettes():
     assert ns.test3 == '3'
 
 
+def test_load_plan_is_compiled_once():
+    from ezdxf.entities.dxfentity import load_plan
+    attribs = DXFEntity.DXFATTRIBS
+    plan = load_plan(acdb_line, attribs)
+    assert load_plan(acdb_line, attribs) is plan
+    name, cast, mode, setter, flag = plan[10][0]
+    assert name == 'start'
+    assert cast is Vector
+
+
+def test_load_unprocessed_tags_and_types():
+    from ezdxf.lldxf.tags import Tags, DXFTag
+    data = Tags([
+        DXFTag(10, (1, 2, 3)),
+        DXFTag(39, '1.5'),
+        DXFTag(10, (4, 5, 6)),  # no doublet defined
+        DXFTag(999, 'comment'),
+    ])
+    entity = DXFEntity()
+    ns = DXFNamespace(entity=entity)
+    unprocessed = SubclassProcessor.load_tags_into_namespace(ns, data, acdb_line)
+    assert ns.start == (1, 2, 3)
+    assert isinstance(ns.start, Vector)
+    assert ns.thickness == 1.5
+    assert list(unprocessed) == [(10, (4, 5, 6)), (999, 'comment')]
+
+
+def test_load_callback_attributes():
+    from ezdxf.lldxf.attributes import DefSubclass, DXFAttr, XType
+    from ezdxf.lldxf.tags import Tags, DXFTag
+    subclass = DefSubclass('AcDbTest', {
+        'setter': DXFAttr(1, xtype=XType.callback, getter='get_value', setter='set_value'),
+        'getter': DXFAttr(2, xtype=XType.callback, getter='get_value'),
+    })
+
+    class TestEntity(DXFEntity):
+        DXFATTRIBS = DXFAttributes(subclass)
+        value = None
+
+        def set_value(self, value):
+            self.value = value
+
+    entity = TestEntity()
+    ns = DXFNamespace(entity=entity)
+    unprocessed = SubclassProcessor.load_tags_into_namespace(ns, Tags([DXFTag(1, 'a'), DXFTag(2, 'b')]), subclass)
+    assert entity.value == 'a'
+    assert ns.hasattr('getter') is False
+    assert len(unprocessed) == 0
+
+
+def test_export_plan_is_compiled_once_per_dxf_version():
+    from ezdxf.entities.dxfentity import export_plan
+    attribs = DXFEntity.DXFATTRIBS
+    names = ('layer', 'true_color')
+    plan = export_plan(attribs, names, 'AC1018')
+    assert export_plan(attribs, names, 'AC1018') is plan
+    assert [entry[0] for entry in plan] == ['layer', 'true_color']
+    # true_color requires DXF R2004
+    assert [entry[0] for entry in export_plan(attribs, names, 'AC1015')] == ['layer']
+
+
+def test_export_plan_requires_valid_attributes():
+    from ezdxf.entities.dxfentity import export_plan
+    assert export_plan(DXFEntity.DXFATTRIBS, ('mozman',), 'AC1018') is None
+
+
+def test_dxf_export_vertex_and_defaults(entity, processor):
+    attribs = DXFNamespace(processor, entity)
+    attribs.start = (1, 2, 3)
+    attribs.color = 256  # optional attribute equal to default value
+    tagwriter = TagCollector(optional=False)
+    attribs.export_dxf_attribs(tagwriter, ['layer', 'color', 'start', 'thickness'])
+    assert tagwriter.tags == [(8, '0'), (10, 1.), (20, 2.), (30, 3.)]
+
+
+def test_namespace_class_is_generated_once_per_entity_type(entity):
+    from ezdxf.entities.dxfentity import namespace_class
+    attribs = DXFNamespace(entity=entity)
+    cls = namespace_class(DXFEntity.DXFATTRIBS)
+    assert type(attribs) is cls
+    assert type(DXFNamespace(entity=DXFEntity())) is cls
+    assert isinstance(attribs, DXFNamespace)
+    assert not hasattr(attribs, '__dict__'), 'expected slotted namespace'
+
+
+def test_discard_restores_default_value(entity, processor):
+    attribs = DXFNamespace(processor, entity)
+    attribs.layer = 'mozman'
+    assert attribs.hasattr('layer') is True
+    attribs.discard('layer')
+    assert attribs.hasattr('layer') is False
+    assert attribs.layer == '0'
+    assert attribs.get('layer') is None
+
+
+def test_all_existing_dxf_attribs(entity, processor):
+    attribs = DXFNamespace(processor, entity)
+    attribs.color = 1
+    assert attribs.all_existing_dxf_attribs() == {'handle': 'FFFF', 'owner': 'ABBA', 'color': 1}
+
+
+def test_pickle_entity_with_namespace():
+    import pickle
+    from ezdxf.entities import Line
+    line = Line.new(handle='ABBA', dxfattribs={'start': (1, 2, 3), 'layer': 'L'})
+    line2 = pickle.loads(pickle.dumps(line))
+    assert line2.dxf._entity is line2
+    assert line2.dxf.handle == 'ABBA'
+    assert line2.dxf.start == (1, 2, 3)
+    assert line2.dxf.layer == 'L'
+    assert line2.dxf.hasattr('color') is False
+
+
+def test_default_vectors_are_shared(entity):
+    attribs = DXFNamespace(entity=entity)
+    default = attribs.extrusion
+    attribs.extrusion = (0, 0, 1)
+    assert attribs.extrusion is default
+    assert attribs.hasattr('extrusion') is True
+    attribs.extrusion = (0, 1, 0)
+    assert attribs.extrusion is not default
+
+
 TEST_1 = """0
 DXFENTITY
 5
@@ -1,5 +1,7 @@
 import pytest
+from io import StringIO
 
+import ezdxf
 from ezdxf.lldxf.tagwriter import TagCollector, basic_tags_from_text
 from ezdxf.entities.dxfentity import DXFTagStorage
 
@@ -25,6 +27,40 @@ def test_dxf_export(entity):
     assert result == control_tags
 
 
+def test_paperspace_flag(entity):
+    assert entity.dxf.paperspace == 0
+
+
+def test_load_unknown_entity_without_owner():
+    doc = ezdxf.new('R2000')
+    doc.modelspace().add_line((0, 0), (1, 0))
+    stream = StringIO()
+    doc.write(stream)
+    data = stream.getvalue()
+    index = data.index('ENTITIES\n') + len('ENTITIES\n')
+    data = data[:index] + UNKNOWN_WITHOUT_OWNER + data[index:]
+
+    doc = ezdxf.read(StringIO(data))
+    entity = doc.entitydb['FFFF']
+    assert entity.dxftype() == 'MY_CUSTOM_ENTITY'
+    assert entity.dxf.paperspace == 1
+    stream = StringIO()
+    doc.write(stream)
+    assert 'MY_CUSTOM_ENTITY' in stream.getvalue()
+
+
+UNKNOWN_WITHOUT_OWNER = """  0
+MY_CUSTOM_ENTITY
+  5
+FFFF
+100
+AcDbEntity
+ 67
+1
+  8
+0
+"""
+
 THE_KNOWN_UNKNOWN = r"""0
 MTEXT
 5
@@ -66,6 +66,18 @@ def test_delete_all_entities(doc):
     assert paperspace_count + 5 == len(paperspace)
 
 
+def test_delete_entities():
+    doc = ezdxf.new('R12')
+    layout = doc.modelspace()
+    lines = [layout.add_line((0, 0), (10, 0)) for _ in range(5)]
+    handle = lines[2].dxf.handle
+    layout.delete_entities(lines[1:4])
+    assert len(layout) == 2
+    assert list(layout) == [lines[0], lines[4]]
+    assert lines[2].is_alive is False
+    assert handle not in doc.entitydb
+
+
 def test_paper_space(paperspace):
     line = paperspace.add_line((0, 0), (1, 1))
     assert line.dxf.paperspace == 1
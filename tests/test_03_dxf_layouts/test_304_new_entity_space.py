@@ -80,4 +80,28 @@ def test_reorder_priority(space):
     assert list(e.priority for e in space) == sorted(NUMBERS, reverse=True), 'highest priority first'
 
 
+def test_remove_unknown_entity_raises_value_error(space):
+    with pytest.raises(ValueError):
+        space.remove(Entity(1))
 
+
+def test_remove_keeps_order(space):
+    space.remove(space[0])
+    space.remove(space[3])
+    assert len(space) == 5
+    assert list(e.priority for e in space) == [4, 5, 6, -4, 7]
+    assert space[-1].priority == 7
+
+
+def test_remove_while_iterating(space):
+    for e in space:
+        if e.priority < 6:
+            space.remove(e)
+    assert list(e.priority for e in space) == [6, 76, 7]
+
+
+def test_remove_entities(space):
+    space.remove_entities([e for e in space if e.priority > 5])
+    assert list(e.priority for e in space) == [1, 4, 5, -4]
+    space.reorder(order=2)
+    assert list(e.priority for e in space) == [-4, 1, 4, 5]
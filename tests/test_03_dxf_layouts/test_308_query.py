@@ -178,6 +178,21 @@ def test_match_one_string():
     assert "ONE" == result[0]
 
 
+def test_delete_entities():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    blk = doc.blocks.new('TEST')
+    for layout in (msp, blk):
+        layout.add_line((0, 0), (1, 0), dxfattribs={'layer': 'delete'})
+        layout.add_line((0, 0), (1, 0), dxfattribs={'layer': 'keep'})
+    query = EntityQuery(list(msp) + list(blk), '*[layer=="delete"]')
+    assert len(query) == 2
+    query.delete_entities()
+    assert len(query) == 0
+    assert [e.dxf.layer for e in msp] == ['keep']
+    assert [e.dxf.layer for e in blk] == ['keep']
+
+
 def test_match_full_string():
     names = "ONEONE TWO THREE"
     result = list(name_query(names.split(), 'ONE'))
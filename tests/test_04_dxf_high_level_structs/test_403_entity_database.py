@@ -133,3 +133,35 @@ def test_restore_integrity_remove_invalid_handle():
     e.dxf.handle = 'XFFF'
     db.audit(auditor)
     assert len(db) == 0
+
+
+def test_delete_entities():
+    db = EntityDB()
+    entities = [DXFEntity.from_text(f"0\nTEST\n5\n{handle}\n") for handle in ('FFFA', 'FFFB', 'FFFC')]
+    for entity in entities:
+        db.add(entity)
+    entities[1].destroy()
+    db.delete_entities(entities)
+    assert len(db) == 1, 'dead entities are not deleted'
+    assert 'FFFB' in db
+    assert entities[0].is_alive is False
+
+
+def test_next_handles_skips_used_handles():
+    db = EntityDB()
+    db.handles.reset('100')
+    db['101'] = DXFEntity.from_text("0\nTEST\n5\n101\n")
+    handles = db.next_handles(3)
+    assert len(handles) == 3
+    assert '101' not in handles
+    assert len(set(handles)) == 3
+
+
+def test_add_entities():
+    db = EntityDB()
+    entities = [DXFEntity() for _ in range(3)]
+    entities.append(DXFEntity.from_text("0\nTEST\n5\nFFFF\n"))
+    db.add_entities(entities)
+    assert len(db) == 4
+    assert all(db[e.dxf.handle] is e for e in entities)
+    assert entities[3].dxf.handle == 'FFFF'
@@ -1,7 +1,9 @@
 # Copyright (C) 2011-2019, Manfred Moitzi
 # License: MIT License
 import pytest
+import io
 import ezdxf
+from ezdxf.drawing import Drawing
 
 new = ezdxf.new
 
@@ -54,3 +56,53 @@ def test_invalid_dxf_version():
         new('AC1013')
     with pytest.raises(ezdxf.const.DXFVersionError):
         new('AC1014')
+
+
+@pytest.fixture
+def use_templates():
+    ezdxf.options.use_document_templates = True
+    ezdxf.clear_document_templates()
+    yield
+    ezdxf.options.use_document_templates = False
+    ezdxf.clear_document_templates()
+
+
+def export(doc) -> str:
+    stream = io.StringIO()
+    doc.write(stream)
+    return stream.getvalue()
+
+
+@pytest.mark.parametrize('dxfversion', ['R12', 'R2000', 'R2018'])
+@pytest.mark.parametrize('setup', [False, True, ['linetypes', 'styles']])
+def test_new_from_template_matches_new_document(dxfversion, setup, use_templates):
+    ezdxf.options.write_fixed_meta_data_for_testing = True
+    try:
+        expected = export(Drawing.new(dxfversion)) if not setup else None
+        new(dxfversion, setup=setup)  # builds template
+        doc = new(dxfversion, setup=setup)
+        assert doc.dxfversion == ezdxf.const.acad_release_to_dxf_version[dxfversion]
+        if expected is not None:
+            assert export(doc) == expected
+        # copies are independent of each other
+        doc.modelspace().add_line((0, 0), (1, 0))
+        doc.layers.new('TEMPLATE')
+        assert len(new(dxfversion, setup=setup).modelspace()) == 0
+        assert 'TEMPLATE' not in new(dxfversion, setup=setup).layers
+    finally:
+        ezdxf.options.write_fixed_meta_data_for_testing = False
+
+
+def test_new_from_template_has_new_guids(use_templates):
+    doc1 = new()
+    doc2 = new()
+    assert doc1.header['$FINGERPRINTGUID'] != doc2.header['$FINGERPRINTGUID']
+    assert doc1.header['$VERSIONGUID'] != doc2.header['$VERSIONGUID']
+
+
+def test_new_from_template_is_bound_to_new_document(use_templates):
+    new()
+    doc = new()
+    assert doc.modelspace().doc is doc
+    assert doc.layers.get('0').doc is doc
+    assert all(entity.doc is doc for entity in doc.entitydb.values())
@@ -241,3 +241,22 @@ ENDSEC
   0
 EOF
 """
+
+
+def test_snapshot_as_document_copy():
+    doc = Drawing.new('R2000')
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 0), dxfattribs={'layer': 'LINES'})
+    fork = Drawing.from_snapshot(doc.snapshot())
+    assert fork.modelspace().doc is fork
+
+    fork_line = fork.modelspace()[0]
+    assert fork_line is not msp[0]
+    assert fork_line.dxf.handle == msp[0].dxf.handle
+    fork_line.dxf.layer = 'FORK'
+    fork.layers.new('FORK')
+    fork.modelspace().add_circle((0, 0), radius=1)
+
+    assert msp[0].dxf.layer == 'LINES'
+    assert 'FORK' not in doc.layers
+    assert len(msp) == 1
@@ -125,3 +125,73 @@ def test_broken_block_cycle_detector(dxf):
     detector.blocks = data
     assert detector.has_cycle('a') is False
     assert detector.has_cycle('b') is False
+
+
+@pytest.fixture
+def tracked_doc():
+    doc = ezdxf.new('R2000')
+    doc.blocks.new('a').add_line((0, 0), (1, 0))
+    doc.modelspace().add_line((0, 0), (1, 0))
+    doc.audit(incremental=True)  # starts change tracking
+    return doc
+
+
+def test_incremental_audit_starts_change_tracking(tracked_doc):
+    tracker = tracked_doc.entitydb.tracker
+    assert tracker is not None
+    assert len(list(tracker.changed_entities())) == 0
+
+
+def test_incremental_audit_checks_only_modified_entities(tracked_doc):
+    msp = tracked_doc.modelspace()
+    line = msp[0]
+    new_line = msp.add_line((0, 0), (1, 0))
+    audited = []
+    line.audit = lambda auditor: audited.append(line)
+    new_line.audit = lambda auditor: audited.append(new_line)
+    tracked_doc.audit(incremental=True)
+    assert audited == [new_line]
+
+    line.dxf.color = 1
+    tracked_doc.audit(incremental=True)
+    assert audited == [new_line, line]
+
+
+def test_incremental_audit_detects_undefined_linetype(tracked_doc):
+    line = tracked_doc.modelspace()[0]
+    line.dxf.linetype = 'UNDEFINED'
+    auditor = tracked_doc.audit(incremental=True)
+    assert len(auditor.fixes) == 1
+    assert auditor.fixes[0].code == AuditError.UNDEFINED_LINETYPE
+    assert line.dxf.linetype == 'BYLAYER'
+
+
+def test_incremental_audit_detects_new_block_cycle(tracked_doc):
+    block = tracked_doc.blocks.get('a')
+    insert = block.add_blockref('a', (0, 0))
+    auditor = tracked_doc.audit(incremental=True)
+    assert len(auditor.errors) == 1
+    assert auditor.errors[0].code == AuditError.INVALID_BLOCK_REFERENCE_CYCLE
+
+    block.delete_entity(insert)
+    auditor = tracked_doc.audit(incremental=True)
+    assert len(auditor.errors) == 0
+
+
+def test_incremental_audit_after_deleting_table_entry(tracked_doc):
+    tracked_doc.linetypes.new('TEST')
+    line = tracked_doc.modelspace()[0]
+    line.dxf.linetype = 'TEST'
+    auditor = tracked_doc.audit(incremental=True)
+    assert len(auditor.fixes) == 0
+
+    tracked_doc.linetypes.remove('TEST')
+    auditor = tracked_doc.audit(incremental=True)  # full audit required
+    assert auditor.fixes[0].code == AuditError.UNDEFINED_LINETYPE
+    assert line.dxf.linetype == 'BYLAYER'
+
+
+def test_full_audit_resets_change_tracking(tracked_doc):
+    tracked_doc.modelspace().add_line((0, 0), (1, 0))
+    tracked_doc.audit()
+    assert len(list(tracked_doc.entitydb.tracker.changed_entities())) == 0
@@ -0,0 +1,121 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import io
+import ezdxf
+from ezdxf import options
+from ezdxf.math import Matrix44
+from ezdxf.lldxf.tagwriter import TagWriter, BinaryTagWriter, TagCollector
+
+
+@pytest.fixture
+def use_export_cache():
+    options.use_export_cache = True
+    yield
+    options.use_export_cache = False
+
+
+@pytest.fixture
+def doc():
+    doc = ezdxf.new('R2010')
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 0))
+    msp.add_text('TEXT')
+    msp.add_lwpolyline([(0, 0), (1, 0), (1, 1)])
+    msp.add_mtext('MTEXT')  # does not support the export cache
+    return doc
+
+
+def export(entity, cls=TagWriter) -> str:
+    stream = io.StringIO() if cls is TagWriter else io.BytesIO()
+    entity.export_dxf(cls(stream))
+    return stream.getvalue()
+
+
+def test_export_cache_is_disabled_by_default(doc):
+    line = doc.modelspace()[0]
+    export(line)
+    assert line._export_cache is None
+
+
+def test_cached_export(doc, use_export_cache):
+    line = doc.modelspace()[0]
+    data = export(line)
+    assert line._export_cache is not None
+    assert export(line) == data
+
+
+def test_cache_key_depends_on_writer_options(doc, use_export_cache):
+    line = doc.modelspace()[0]
+    export(line)
+    export(line, BinaryTagWriter)
+    assert len(line._export_cache) == 2
+
+
+def test_tag_collector_does_not_use_cache(doc, use_export_cache):
+    line = doc.modelspace()[0]
+    TagCollector.dxftags(line)
+    assert line._export_cache is None
+
+
+def test_not_supported_entity_is_not_cached(doc, use_export_cache):
+    mtext = doc.modelspace()[3]
+    export(mtext)
+    assert mtext._export_cache is None
+
+
+@pytest.mark.parametrize('modify', [
+    lambda e: setattr(e.dxf, 'layer', 'MODIFIED'),
+    lambda e: e.dxf.set('color', 3),
+    lambda e: e.dxf.discard('end'),
+    lambda e: e.transform(Matrix44.translate(1, 2, 3)),
+])
+def test_modifying_dxf_attributes_discards_cache(doc, use_export_cache, modify):
+    line = doc.modelspace()[0]
+    data = export(line)
+    modify(line)
+    assert line._export_cache is None
+    assert export(line) != data
+
+
+@pytest.mark.parametrize('modify', [
+    lambda e: e.append((2, 2)),
+    lambda e: e.__setitem__(0, (3, 3)),
+    lambda e: e.__delitem__(0),
+    lambda e: e.set_points([(0, 0), (3, 3)]),
+    lambda e: e.clear(),
+])
+def test_modifying_packed_data_discards_cache(doc, use_export_cache, modify):
+    lwpolyline = doc.modelspace()[2]
+    data = export(lwpolyline)
+    revision = lwpolyline.revision
+    modify(lwpolyline)
+    assert lwpolyline._export_cache is None
+    assert lwpolyline.revision != revision, 'expected modified entity'
+    assert export(lwpolyline) != data
+
+
+def test_xdata_bypasses_cache(doc, use_export_cache):
+    text = doc.modelspace()[1]
+    export(text)
+    doc.appids.new('EZDXF')
+    text.set_xdata('EZDXF', [(1000, 'XDATA')])
+    assert 'XDATA' in export(text)
+
+
+def test_saved_document_matches_uncached_export(doc, use_export_cache):
+    options.write_fixed_meta_data_for_testing = True
+    try:
+        stream = io.StringIO()
+        doc.write(stream)
+        cached = stream.getvalue()
+        options.use_export_cache = False
+        stream = io.StringIO()
+        doc.write(stream)
+        assert stream.getvalue() == cached
+    finally:
+        options.write_fixed_meta_data_for_testing = False
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,76 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import io
+import pickle
+import ezdxf
+from ezdxf.drawing import Drawing
+from ezdxf.lldxf.const import DXFValueError
+
+
+@pytest.fixture(scope='module')
+def doc():
+    doc = ezdxf.new('R2010', setup=True)
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 0), dxfattribs={'layer': 'LINES'})
+    msp.add_lwpolyline([(0, 0), (1, 0), (1, 1)])
+    msp.add_spline([(0, 0), (1, 2), (3, 1), (4, 4)])
+    msp.add_mesh().vertices = [(0, 0, 0), (1, 0, 0), (1, 1, 0)]
+    block = doc.blocks.new('BLOCK')
+    block.add_circle((0, 0), radius=1)
+    msp.add_blockref('BLOCK', (5, 5)).add_attrib('TAG', 'TEXT')
+    doc.layouts.new('Layout2').add_text('TEXT')
+    return doc
+
+
+def export(doc) -> str:
+    ezdxf.options.write_fixed_meta_data_for_testing = True
+    try:
+        stream = io.StringIO()
+        doc.write(stream)
+        return stream.getvalue()
+    finally:
+        ezdxf.options.write_fixed_meta_data_for_testing = False
+
+
+@pytest.mark.parametrize('compress', [False, True])
+def test_restored_snapshot_matches_source_document(doc, compress):
+    data = doc.snapshot(compress=compress)
+    assert isinstance(data, bytes)
+    restored = Drawing.from_snapshot(data)
+    assert restored is not doc
+    assert export(restored) == export(doc)
+
+
+def test_restored_document_is_independent(doc):
+    restored = Drawing.from_snapshot(doc.snapshot())
+    msp = restored.modelspace()
+    assert msp.doc is restored
+    assert all(e.doc is restored for e in restored.entitydb.values())
+    msp.add_point((0, 0))
+    assert len(msp) == len(doc.modelspace()) + 1
+
+
+def test_compressed_snapshot_is_smaller(doc):
+    assert len(doc.snapshot(compress=True)) < len(doc.snapshot())
+
+
+def test_pickle_document(doc):
+    restored = pickle.loads(pickle.dumps(doc))
+    assert export(restored) == export(doc)
+
+
+def test_invalid_snapshot_data():
+    with pytest.raises(DXFValueError):
+        Drawing.from_snapshot(b'no snapshot')
+
+
+def test_snapshot_of_other_ezdxf_version(doc):
+    data = bytearray(doc.snapshot())
+    data[11] = ord('x')  # first char of ezdxf version
+    with pytest.raises(DXFValueError):
+        Drawing.from_snapshot(bytes(data))
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,117 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+from io import StringIO
+import ezdxf
+from ezdxf.lldxf.selection import EntitySelection
+
+
+@pytest.fixture(scope='module')
+def dxf_data() -> str:
+    doc = ezdxf.new('R2018')
+    for name in ('PARCEL1', 'Parcel2', 'STREET'):
+        doc.layers.new(name)
+    msp = doc.modelspace()
+    msp.add_lwpolyline([(0, 0), (1, 0), (1, 1)], dxfattribs={'layer': 'PARCEL1'})
+    msp.add_lwpolyline([(0, 0), (2, 0), (2, 2)], dxfattribs={'layer': 'Parcel2'})
+    msp.add_lwpolyline([(0, 0), (3, 0)], dxfattribs={'layer': 'STREET'})
+    msp.add_text('PARCEL', dxfattribs={'layer': 'PARCEL1'})
+    line = msp.add_line((0, 0), (1, 0), dxfattribs={'layer': 'PARCEL1'})
+    line.get_extension_dict()
+    msp.add_polyline3d([(0, 0, 0), (1, 1, 1)], dxfattribs={'layer': 'PARCEL1'})
+
+    nested = doc.blocks.new('NESTED')
+    nested.add_circle((0, 0), 1)
+    block = doc.blocks.new('BLOCK')
+    block.add_blockref('NESTED', (0, 0))
+    block.add_attdef('TAG', (0, 0))
+    unused = doc.blocks.new('UNUSED')
+    unused.add_circle((0, 0), 1)
+    insert = msp.add_blockref('BLOCK', (0, 0), dxfattribs={'layer': 'PARCEL1'})
+    insert.add_attrib('TAG', 'value')
+    msp.add_blockref('UNUSED', (0, 0), dxfattribs={'layer': 'STREET'})
+
+    group = doc.groups.new('GROUP')
+    group.set_data([line, msp[0]])
+    psp = doc.layout()
+    psp.add_text('PAPERSPACE', dxfattribs={'layer': 'PARCEL1'})
+    stream = StringIO()
+    doc.write(stream)
+    return stream.getvalue()
+
+
+def load(data: str, selection: EntitySelection):
+    return ezdxf.read(StringIO(data), selection=selection)
+
+
+def test_without_selection(dxf_data):
+    doc = ezdxf.read(StringIO(dxf_data))
+    assert len(doc.modelspace()) == 8
+
+
+def test_select_by_type_and_layer(dxf_data):
+    selection = EntitySelection(types=['LWPOLYLINE', 'TEXT'], layers=['PARCEL*'], paperspace=False)
+    doc = load(dxf_data, selection)
+    msp = doc.modelspace()
+    assert [e.dxftype() for e in msp] == ['LWPOLYLINE', 'LWPOLYLINE', 'TEXT']
+    assert [e.dxf.layer for e in msp] == ['PARCEL1', 'Parcel2', 'PARCEL1']
+    assert len(doc.layout()) == 0
+    assert selection.skipped > 6
+    assert 'STREET' in doc.layers  # all table entries are loaded
+
+
+def test_remove_unreferenced_blocks(dxf_data):
+    doc = load(dxf_data, EntitySelection(types=['LWPOLYLINE']))
+    assert 'BLOCK' not in doc.blocks
+    assert 'NESTED' not in doc.blocks
+    assert 'UNUSED' not in doc.blocks
+    assert doc.block_records.has_entry('BLOCK') is False
+
+
+def test_keep_referenced_blocks(dxf_data):
+    doc = load(dxf_data, EntitySelection(types=['INSERT'], layers=['PARCEL1']))
+    insert = doc.modelspace()[0]
+    assert insert.dxf.name == 'BLOCK'
+    assert insert.get_attrib_text('TAG') == 'value'
+    assert 'BLOCK' in doc.blocks
+    assert 'NESTED' in doc.blocks
+    assert 'UNUSED' not in doc.blocks
+
+
+def test_sub_entities_share_selection_state(dxf_data):
+    doc = load(dxf_data, EntitySelection(types=['POLYLINE']))
+    polyline = doc.modelspace()[0]
+    assert len(polyline.vertices) == 2
+    assert len(doc.modelspace()) == 1
+
+
+def test_select_paperspace(dxf_data):
+    doc = load(dxf_data, EntitySelection(paperspace=True))
+    assert len(doc.modelspace()) == 0
+    assert [e.dxftype() for e in doc.layout()] == ['TEXT']
+
+
+def test_remove_objects_owned_by_skipped_entities(dxf_data):
+    doc = load(dxf_data, EntitySelection(types=['LWPOLYLINE']))
+    group = doc.groups.get('GROUP')
+    assert list(group.handles()) == [doc.modelspace()[0].dxf.handle]
+    db = doc.entitydb
+    assert all(obj.dxf.owner in db for obj in doc.objects if obj.dxf.owner != '0')
+    assert len(doc.objects.query('DICTIONARY')) < len(ezdxf.read(StringIO(dxf_data)).objects.query('DICTIONARY'))
+
+
+def test_saved_document_is_loadable(dxf_data):
+    doc = load(dxf_data, EntitySelection(types=['INSERT', 'LWPOLYLINE'], layers=['parcel*']))
+    stream = StringIO()
+    doc.write(stream)
+    doc2 = ezdxf.read(StringIO(stream.getvalue()))
+    assert [e.dxftype() for e in doc2.modelspace()] == ['LWPOLYLINE', 'LWPOLYLINE', 'INSERT']
+
+
+def test_selective_loading_in_legacy_mode(dxf_data):
+    doc = ezdxf.read(StringIO(dxf_data), legacy_mode=True, selection=EntitySelection(types=['TEXT']))
+    assert [e.dxftype() for e in doc.modelspace()] == ['TEXT']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -1,6 +1,7 @@
 # Copyright (c) 2020, Manfred Moitzi
 # License: MIT License
 import pytest
+import struct
 from ezdxf.tools.binarydata import BitStream, EndOfBufferError
 
 
@@ -29,6 +30,25 @@ def test_read_bits():
     assert bs.read_bits(3) == 7
 
 
+def test_read_bits_across_multiple_bytes():
+    data = b'\x0f\x0f\xf0'
+    bs = BitStream(data)
+    assert bs.read_bits(2) == 0
+    assert bs.read_bits(17) == 0b00111100001111111
+    assert bs.read_bits(5) == 0b10000
+    with pytest.raises(EndOfBufferError):
+        _ = bs.read_bits(1)
+
+
+def test_read_bits_at_end_of_buffer():
+    bs = BitStream(b'\xff')
+    assert bs.read_bits(6) == 0b111111
+    with pytest.raises(EndOfBufferError):
+        _ = bs.read_bits(3)
+    assert bs.read_bits(2) == 3
+    assert bs.read_bits(0) == 0
+
+
 def test_read_unsigned_byte():
     data = b'\x0f\x0f'
     bs = BitStream(data)
@@ -76,6 +96,53 @@ def test_read_aligned_unsigned_long():
     assert bs.read_unsigned_long() == 0xabcdef00
 
 
+def bits_to_bytes(bits: str) -> bytes:
+    bits += '0' * (-len(bits) % 8)
+    return bytes(int(bits[index: index + 8], 2) for index in range(0, len(bits), 8))
+
+
+def test_read_unaligned_float():
+    data = struct.pack('<d', 1.0)
+    bs = BitStream(bits_to_bytes('0101' + ''.join(f'{byte:08b}' for byte in data)))
+    assert bs.read_bits(4) == 5
+    assert bs.read_float() == 1.0
+
+
+def test_read_multiple_raw_doubles():
+    bs = BitStream(b'\x80' + struct.pack('<2d', 1.0, 2.0))
+    assert bs.read_bit() == 1
+    bs.skip(7)
+    assert bs.read_raw_double(2) == (1.0, 2.0)
+
+
+def test_read_unaligned_text():
+    # bit short 01 + unsigned byte 3, followed by 3 unsigned bytes
+    bs = BitStream(bits_to_bytes('01' + '00000011' + '01000001' + '01000010' + '01000011'))
+    assert bs.read_text() == 'ABC'
+    assert bs.bit_index == 34
+
+
+def test_read_bit_double_default():
+    default = struct.pack('<d', 1.1)
+    value = struct.pack('<d', 1.7)
+    bs = BitStream(bits_to_bytes('00'))
+    assert bs.read_bit_double_default(default=1.1) == 1.1
+    # replace the first 4 bytes
+    bs = BitStream(bits_to_bytes('01' + ''.join(f'{byte:08b}' for byte in value[:4])))
+    expected = struct.unpack('<d', value[:4] + default[4:])[0]
+    assert bs.read_bit_double_default(default=1.1) == expected
+    # replace the first 6 bytes: bytes 4 and 5 first followed by bytes 0 to 3
+    bs = BitStream(bits_to_bytes('10' + ''.join(f'{byte:08b}' for byte in value[4:6] + value[:4])))
+    expected = struct.unpack('<d', value[:6] + default[6:])[0]
+    assert bs.read_bit_double_default(default=1.1) == expected
+
+
+def test_read_handle():
+    # code 0, 2 bytes
+    bs = BitStream(bits_to_bytes('0000' + '0010' + '00000001' + '00000010'))
+    assert bs.read_handle() == 0x0201
+
+
 def test_read_bitshort():
     bs = BitStream(b'\xe0')
     assert bs.read_bit_short() == 256  # 11
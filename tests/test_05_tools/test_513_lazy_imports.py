@@ -0,0 +1,40 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import os
+import sys
+import subprocess
+import ezdxf
+
+
+@pytest.mark.parametrize('name', sorted(ezdxf._LAZY_IMPORTS))
+def test_lazy_name_space_imports(name):
+    assert getattr(ezdxf, name) is not None
+    assert name in dir(ezdxf)
+
+
+def test_lazy_imported_module():
+    from ezdxf.tools import pattern
+    assert ezdxf.pattern is pattern
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        _ = ezdxf.unknown_attribute
+
+
+def test_from_import():
+    from ezdxf import new, ARROWS
+    assert new().dxfversion == ezdxf.DXF2013
+    assert ARROWS.closed_filled == ''
+
+
+def test_import_does_not_load_entity_classes():
+    code = "import sys, ezdxf; print('ezdxf.entities' in sys.modules, 'pyparsing' in sys.modules)"
+    result = subprocess.run([sys.executable, '-c', code], stdout=subprocess.PIPE, universal_newlines=True,
+                            env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)))
+    assert result.stdout.split() == ['False', 'False']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,40 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import sys
+import ezdxf
+from ezdxf.tools.memory import entity_memory_usage, MemoryUsage
+
+
+@pytest.fixture(scope='module')
+def msp():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for x in range(3):
+        msp.add_line((x, 0), (x, 1), dxfattribs={'layer': 'LINES'})
+    msp.add_text('TEXT')
+    return msp
+
+
+def test_memory_usage_by_dxf_type(msp):
+    usage = entity_memory_usage(msp)
+    assert set(usage) == {'LINE', 'TEXT'}
+    assert usage['LINE'].count == 3
+    assert usage['TEXT'].count == 1
+    assert usage['LINE'].size > 0
+    assert usage['LINE'].size_per_entity == usage['LINE'].size / 3
+
+
+def test_shared_objects_are_counted_once(msp):
+    line = msp[0]
+    single = entity_memory_usage([line])['LINE'].size
+    twice = entity_memory_usage([line, line])['LINE']
+    assert twice.count == 2
+    # all objects referenced by the 2. LINE are already counted
+    assert twice.size == single + sys.getsizeof(line)
+    # layer name of the 2. and 3. LINE is shared with the 1. LINE
+    assert entity_memory_usage(msp.query('LINE'))['LINE'].size < 3 * single
+
+
+def test_size_per_entity_of_empty_usage():
+    assert MemoryUsage(0, 0).size_per_entity == 0.
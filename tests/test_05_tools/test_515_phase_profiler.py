@@ -0,0 +1,87 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import json
+from io import StringIO
+import ezdxf
+from ezdxf.tools.profiler import profile_phases, active_profiler, phase
+
+
+@pytest.fixture(scope='module')
+def dxf_data() -> str:
+    doc = ezdxf.new('R2000')
+    msp = doc.modelspace()
+    for x in range(3):
+        msp.add_line((x, 0), (x, 1))
+    msp.add_circle((0, 0), 1)
+    stream = StringIO()
+    doc.write(stream)
+    return stream.getvalue()
+
+
+def test_loading_phases(dxf_data):
+    with profile_phases() as report:
+        ezdxf.read(StringIO(dxf_data))
+    assert list(report.phases) == ['tagging', 'load_dxf_structure', 'fill_database', 'sections', 'layouts']
+    assert report.phases['tagging'].items > 0
+    assert report.loaded_types['LINE'].items == 3
+    assert report.loaded_types['CIRCLE'].items == 1
+    assert report.loaded_types['LINE'].memory == 0  # memory tracing disabled
+
+
+def test_saving_phases(dxf_data):
+    doc = ezdxf.read(StringIO(dxf_data))
+    with profile_phases() as report:
+        doc.write(StringIO())
+    assert 'prepare_export' in report.phases
+    assert report.phases['export:ENTITIES'].items == 4
+    assert report.exported_types['LINE'] == 3
+    assert report.loaded_types == {}
+
+
+def test_trace_memory(dxf_data):
+    with profile_phases(trace_memory=True) as report:
+        ezdxf.read(StringIO(dxf_data))
+    assert report.phases['fill_database'].memory > 0
+
+
+def test_report_is_json_serializable(dxf_data):
+    with profile_phases() as report:
+        ezdxf.read(StringIO(dxf_data))
+    data = json.loads(json.dumps(report.as_dict()))
+    assert data['loaded_types']['CIRCLE']['calls'] == 1
+    assert 'Phase fill_database' in str(report)
+
+
+def test_profiling_is_disabled_outside_of_context():
+    with profile_phases():
+        assert active_profiler() is not None
+    assert active_profiler() is None
+    with phase('test') as record:
+        assert record is None
+
+
+def test_profiler_records_only_its_own_thread(dxf_data):
+    import threading
+    started = threading.Event()
+    stop = threading.Event()
+    other_profiler = []
+
+    def other_thread():
+        other_profiler.append(active_profiler())
+        started.set()
+        stop.wait(5)
+
+    thread = threading.Thread(target=other_thread)
+    with profile_phases() as profiler:
+        thread.start()
+        started.wait(5)
+        ezdxf.read(StringIO(dxf_data))
+        stop.set()
+        thread.join()
+    assert other_profiler == [None], 'profiler should not be active in other threads'
+    assert profiler.loaded_types['LINE'].items == 3
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -89,6 +89,16 @@ def test_deep_copy(vcls):
     assert l3[0] is not v
 
 
+def test_pickle(vcls):
+    import pickle
+
+    v = vcls((1, 2))
+    v2 = pickle.loads(pickle.dumps([v, v]))
+    assert v2[0] == v
+    assert type(v2[0]) is vcls
+    assert v2[0] is v2[1]
+
+
 def test_get_angle(vcls):
     v = vcls((3, 3))
     assert math.isclose(v.angle_deg, 45)
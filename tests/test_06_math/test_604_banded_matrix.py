@@ -4,7 +4,8 @@ from typing import Iterable
 import pytest
 import math
 from ezdxf.math.linalg import (
-    Matrix, detect_banded_matrix, compact_banded_matrix, BandedMatrixLU, gauss_vector_solver, banded_matrix
+    Matrix, detect_banded_matrix, compact_banded_matrix, BandedMatrixLU, gauss_vector_solver, banded_matrix,
+    compact_banded_matrix_from_rows, banded_matrix_batch_solver,
 )
 
 BANDED_MATRIX = Matrix(matrix=[
@@ -87,5 +88,34 @@ def test_solve_banded_matrix_matrix():
     assert math.isclose(lu.determinant(), BANDED_MATRIX.determinant())
 
 
+def test_compact_banded_matrix_from_rows():
+    rows = []
+    for index, row in enumerate(BANDED_MATRIX.rows()):
+        first = min(i for i, v in enumerate(row) if v)
+        last = max(i for i, v in enumerate(row) if v)
+        rows.append((first, row[first:last + 1]))
+    m, m1, m2 = compact_banded_matrix_from_rows(rows)
+    assert (m1, m2) == (2, 1)
+    assert m == compact_banded_matrix(BANDED_MATRIX, m1, m2)
+
+
+def test_banded_matrix_batch_solver():
+    # diagonal dominant matrix, stable without pivoting
+    A = Matrix(matrix=[
+        [9, 1, 0, 0, 0],
+        [2, 8, 3, 0, 0],
+        [1, 2, 9, 1, 0],
+        [0, 1, 2, 7, 1],
+        [0, 0, 1, 3, 9],
+    ])
+    B = list(zip(B1[:5], B2[:5]))
+    m, m1, m2 = banded_matrix(A)
+    results = banded_matrix_batch_solver([m, m], m1, m2, [B, B])
+    assert len(results) == 2
+    for r in results:
+        are_close_vectors(r.col(0), gauss_vector_solver(A, B1[:5]))
+        are_close_vectors(r.col(1), gauss_vector_solver(A, B2[:5]))
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
@@ -1,7 +1,7 @@
 # Copyright (c) 2020 Manfred Moitzi
 # License: MIT License
 import pytest
-from ezdxf.math import intersection_line_line_2d, Vec2
+from ezdxf.math import intersection_line_line_2d, Vec2, intersections_line_line_2d, intersections_segments_2d
 
 
 def vec2(x, y):
@@ -82,5 +82,38 @@ def test_issue_128():
     assert point.isclose(vec2(175.0, 30.1235))
 
 
+def test_intersections_line_line():
+    lines1 = [(vec2(0, 0), vec2(2, 2)), (vec2(0, 0), vec2(2, 2)), (vec2(0, 0), vec2(2, 2))]
+    lines2 = [(vec2(0, 2), vec2(2, 0)), (vec2(0, 1), vec2(2, 3)), (vec2(4, 0), vec2(3, 1))]
+    result = intersections_line_line_2d(lines1, lines2)
+    assert result[0].isclose(vec2(1, 1))
+    assert result[1] is None  # parallel lines
+    assert result[2].isclose(vec2(2, 2))
+    result = intersections_line_line_2d(lines1, lines2, virtual=False)
+    assert result[2] is None
+
+
+def test_intersections_segments():
+    # grid of 3 horizontal and 3 vertical segments
+    horizontal = [((0, y), (10, y)) for y in (1, 5, 9)]
+    vertical = [((x, 0), (x, 10)) for x in (2, 6, 12)]
+    result = intersections_segments_2d(horizontal, vertical)
+    assert len(result) == 6
+    assert [(i1, i2) for i1, i2, _ in result] == [(0, 0), (0, 1), (1, 0), (1, 1), (2, 0), (2, 1)]
+    assert result[3][2].isclose(vec2(6, 5))
+
+
+def test_intersections_segments_matches_brute_force():
+    segments1 = [(vec2(x, 0), vec2(x + 3, 5)) for x in range(10)]
+    segments2 = [(vec2(0, y), vec2(10, y + 0.5)) for y in range(5)]
+    expected = []
+    for i1, s1 in enumerate(segments1):
+        for i2, s2 in enumerate(segments2):
+            ip = intersection_line_line_2d(s1, s2, virtual=False)
+            if ip is not None:
+                expected.append((i1, i2, ip))
+    assert intersections_segments_2d(segments1, segments2) == expected
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
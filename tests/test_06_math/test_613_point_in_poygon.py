@@ -1,7 +1,8 @@
 # Copyright (c) 2020, Manfred Moitzi
 # License: MIT License
 import pytest
-from ezdxf.math.construct2d import is_point_in_polygon_2d, Vec2
+import random
+from ezdxf.math.construct2d import is_point_in_polygon_2d, Vec2, points_in_polygon_2d, PolygonIndex2d
 
 
 def test_inside_horiz_box():
@@ -62,5 +63,36 @@ def test_borders_slanted_box_stable():
     assert is_point_in_polygon_2d(Vec2(-.5, 0.5), square) == 0
 
 
+SLANTED_BOX = Vec2.list([(0, 0), (1, 1), (0, 2), (-1, 1)])
+CONCAVE_POLYGON = Vec2.list([(0, 0), (4, 0), (4, 4), (2, 2), (0, 4)])
+
+
+@pytest.mark.parametrize('polygon', [SLANTED_BOX, CONCAVE_POLYGON])
+def test_points_in_polygon_matches_single_test(polygon):
+    random.seed(0)
+    points = [Vec2(random.uniform(-2, 5), random.uniform(-2, 5)) for _ in range(200)]
+    # vertices and midpoints of edges are on the boundary
+    points.extend(polygon)
+    points.extend(p1.lerp(p2) for p1, p2 in zip(polygon, polygon[1:] + polygon[:1]))
+    expected = [is_point_in_polygon_2d(point, polygon) for point in points]
+    assert points_in_polygon_2d(points, polygon) == expected
+    assert set(expected) == {-1, 0, 1}
+
+
+def test_polygon_index_concave_polygon():
+    index = PolygonIndex2d(CONCAVE_POLYGON)
+    assert index.point_relation(Vec2(1, 1)) == 1
+    assert index.point_relation(Vec2(2, 3)) == -1  # notch
+    assert index.point_relation(Vec2(3, 3)) == 0  # notch border
+    assert index.point_relation(Vec2(2, 2)) == 0  # notch vertex
+    assert index.point_relation(Vec2(5, 1)) == -1
+    assert index.point_relation(Vec2(2, -1)) == -1
+
+
+def test_polygon_index_requires_3_vertices():
+    with pytest.raises(ValueError):
+        PolygonIndex2d(Vec2.list([(0, 0), (1, 0)]))
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
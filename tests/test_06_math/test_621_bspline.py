@@ -237,3 +237,17 @@ def test_bezier_decomposition_issue(weired_spline1):
     assert weired_spline1.is_clamped is False
     with pytest.raises(TypeError):
         list(weired_spline1.bezier_decomposition())
+
+
+def test_bbox():
+    from ezdxf.math import BoundingBox
+    spline = BSpline(DEFPOINTS, order=3)
+    approx = BoundingBox(spline.approximate(1000))
+    hull = spline.bbox()
+    assert hull.extmin == (0, 0, 0)
+    assert hull.extmax == (50, 20, 30)
+    refined = spline.bbox(level=4)
+    for a, h, r in zip(approx.size, hull.size, refined.size):
+        assert a - 1e-9 <= r <= h
+    assert refined.extmax.isclose(approx.extmax, abs_tol=0.1)
+    assert len(spline.control_points) == len(DEFPOINTS), 'refinement should not modify the spline'
@@ -4,7 +4,7 @@ import ezdxf
 from math import isclose
 import math
 from ezdxf.math import Vector
-from ezdxf.math.bspline import global_bspline_interpolation
+from ezdxf.math.bspline import global_bspline_interpolation, global_bspline_interpolation_batch
 from ezdxf.math.parametrize import uniform_t_vector, distance_t_vector, centripetal_t_vector, arc_t_vector, \
     arc_distances, estimate_tangents
 from ezdxf.math.bspline import (
@@ -237,3 +237,22 @@ def test_check_values():
     for p1, p2 in zip(result, expected):
         assert isclose(p1[0], p2[0], abs_tol=1e-6)
         assert isclose(p1[1], p2[1], abs_tol=1e-6)
+
+
+def test_global_bspline_interpolation_batch():
+    curves = [POINTS1, POINTS2, list(reversed(POINTS2))]
+    splines = global_bspline_interpolation_batch(curves, degree=3)
+    assert len(splines) == 3
+    for points, spline in zip(curves, splines):
+        expected = global_bspline_interpolation(points, degree=3)
+        assert spline.knots() == expected.knots()
+        for cp1, cp2 in zip(spline.control_points, expected.control_points):
+            assert cp1.isclose(cp2, abs_tol=1e-9)
+
+
+def test_global_bspline_interpolation_many_fit_points():
+    # uses the banded matrix solver
+    points = [(x, math.sin(x / 10.)) for x in range(100)]
+    spline = global_bspline_interpolation(points, degree=3)
+    for t, p in zip(spline.t_array, points):
+        assert spline.point(t).isclose(p, abs_tol=1e-9)
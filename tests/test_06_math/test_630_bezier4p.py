@@ -142,3 +142,32 @@ TANGENTS2D = [
     (9.5399999999999974, 5.399999999999995),
     (9.0, 0.0),
 ]
+
+
+def test_bbox_2d():
+    from ezdxf.math import BoundingBox2d
+    curve = Bezier4P([(0, 0), (1, 2), (2, -1), (3, 0)])
+    bbox = curve.bbox()
+    assert isinstance(bbox, BoundingBox2d)
+    approx = BoundingBox2d(curve.approximate(1000))
+    assert bbox.extmin.isclose(approx.extmin, abs_tol=1e-5)
+    assert bbox.extmax.isclose(approx.extmax, abs_tol=1e-5)
+
+
+def test_bbox_3d_is_cached():
+    from ezdxf.math import BoundingBox
+    curve = Bezier4P(DEFPOINTS3D[:4])
+    bbox = curve.bbox()
+    assert isinstance(bbox, BoundingBox)
+    approx = BoundingBox(curve.approximate(1000))
+    assert bbox.extmin.isclose(approx.extmin, abs_tol=1e-5)
+    assert bbox.extmax.isclose(approx.extmax, abs_tol=1e-5)
+    bbox.extend([(1000, 1000, 1000)])
+    assert curve.bbox().extmax.isclose(approx.extmax, abs_tol=1e-5), 'returns a new bbox for each call'
+
+
+def test_bbox_of_straight_line():
+    curve = Bezier4P([(0, 0), (1, 1), (2, 2), (3, 3)])
+    bbox = curve.bbox()
+    assert bbox.extmin == (0, 0)
+    assert bbox.extmax == (3, 3)
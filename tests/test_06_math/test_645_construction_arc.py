@@ -118,6 +118,12 @@ def test_bounding_box():
     assert bbox.extmax == (1, 1)
 
 
+def test_bbox_of_full_circle():
+    bbox = ConstructionArc(center=(1, 2), radius=3, start_angle=0, end_angle=360).bbox()
+    assert bbox.extmin == (-2, -1)
+    assert bbox.extmax == (4, 5)
+
+
 def test_angles():
     arc = ConstructionArc(radius=1, start_angle=30, end_angle=60)
     assert tuple(arc.angles(2)) == (30, 60)
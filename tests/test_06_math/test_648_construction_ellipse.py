@@ -234,3 +234,17 @@ def test_params_from_vertices_random():
 def test_to_ocs():
     e = ConstructionEllipse().to_ocs()
     assert e.center == (0, 0)
+
+
+@pytest.mark.parametrize('start, end', [(0, math.tau), (0.3, 4), (5, 1), (1, 1.5)])
+def test_bbox(start, end):
+    from ezdxf.math import BoundingBox
+    e = ConstructionEllipse(center=(1, 2, 3), major_axis=(3, 1, 1), extrusion=(0, 1, 1), ratio=0.5,
+                            start_param=start, end_param=end)
+    bbox = e.bbox()
+    approx = BoundingBox(e.vertices(e.params(2000)))
+    assert bbox.extmin.isclose(approx.extmin, abs_tol=1e-4)
+    assert bbox.extmax.isclose(approx.extmax, abs_tol=1e-4)
+    # exact bbox is never smaller than the approximation
+    assert all(a <= b + 1e-12 for a, b in zip(bbox.extmin, approx.extmin))
+    assert all(a >= b - 1e-12 for a, b in zip(bbox.extmax, approx.extmax))
@@ -0,0 +1,148 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import math
+from ezdxf.math import Vector, VectorArray, Matrix44, BoundingBox, BoundingBox2d
+from ezdxf.render import MeshBuilder
+
+POINTS = [(1, 2, 3), (4, 5, 6), (-1, 0, 2)]
+
+
+@pytest.fixture
+def va():
+    return VectorArray(POINTS)
+
+
+def test_init(va):
+    assert len(va) == 3
+    assert va[0] == (1, 2, 3)
+    assert va[-1] == (-1, 0, 2)
+    assert va.to_list() == POINTS
+    assert list(va) == POINTS
+    assert list(va.tuples()) == POINTS
+
+
+def test_empty_array():
+    va = VectorArray()
+    assert len(va) == 0
+    assert va.to_list() == []
+
+
+def test_from_arrays():
+    va = VectorArray.from_arrays([1, 2], [3, 4])
+    assert va.to_list() == [(1, 3, 0), (2, 4, 0)]
+    with pytest.raises(ValueError):
+        VectorArray.from_arrays([1, 2], [3])
+
+
+def test_2d_vertices():
+    assert VectorArray([(1, 2)])[0] == (1, 2, 0)
+
+
+def test_slicing(va):
+    part = va[1:]
+    assert isinstance(part, VectorArray)
+    assert part.to_list() == POINTS[1:]
+
+
+def test_set_item(va):
+    va[1] = (7, 8, 9)
+    assert va[1] == (7, 8, 9)
+
+
+def test_append_and_extend(va):
+    va.append((7, 8, 9))
+    va.extend(VectorArray([(1, 1, 1)]))
+    va.extend([Vector(2, 2, 2)])
+    assert len(va) == 6
+    assert va[-3:].to_list() == [(7, 8, 9), (1, 1, 1), (2, 2, 2)]
+
+
+def test_copy_is_independent(va):
+    va2 = va.copy()
+    assert va2 == va
+    va2[0] = (0, 0, 0)
+    assert va2 != va
+
+
+def test_add_sub(va):
+    assert (va + va).to_list() == [Vector(p) * 2 for p in POINTS]
+    assert (va + (1, 1, 1)).to_list() == [Vector(p) + (1, 1, 1) for p in POINTS]
+    assert (va - va).to_list() == [(0, 0, 0)] * 3
+    assert (va - (1, 1, 1)).to_list() == [Vector(p) - (1, 1, 1) for p in POINTS]
+    assert ((1, 1, 1) - va).to_list() == [(1, 1, 1) - Vector(p) for p in POINTS]
+    assert (-va).to_list() == [-Vector(p) for p in POINTS]
+
+
+def test_length_mismatch(va):
+    with pytest.raises(ValueError):
+        va + VectorArray([(1, 1, 1)])
+
+
+def test_scaling(va):
+    assert (va * 2).to_list() == [Vector(p) * 2 for p in POINTS]
+    assert (2 * va).to_list() == [Vector(p) * 2 for p in POINTS]
+    assert (va / 2).to_list() == [Vector(p) / 2 for p in POINTS]
+
+
+def test_dot_and_cross(va):
+    other = VectorArray([(3, 2, 1), (1, 0, 0), (0, 1, 0)])
+    assert list(va.dot(other)) == [Vector(a).dot(b) for a, b in zip(va, other)]
+    assert list(va.dot((1, 0, 0))) == [1, 4, -1]
+    assert va.cross(other).to_list() == [Vector(a).cross(b) for a, b in zip(va, other)]
+    assert va.cross((0, 0, 1)).to_list() == [Vector(a).cross((0, 0, 1)) for a in va]
+
+
+def test_normalize(va):
+    for v in va.normalize(2):
+        assert math.isclose(v.magnitude, 2)
+    assert list(va.magnitudes()) == [Vector(p).magnitude for p in POINTS]
+
+
+def test_distances(va):
+    assert list(va.distances((1, 2, 3))) == [Vector(p).distance((1, 2, 3)) for p in POINTS]
+    assert list(va.distances(va)) == [0, 0, 0]
+
+
+def test_sum_and_extents(va):
+    assert va.sum() == (4, 7, 11)
+    assert va.extents() == ((-1, 0, 2), (4, 5, 6))
+
+
+def test_transform(va):
+    m = Matrix44.chain(Matrix44.z_rotate(0.5), Matrix44.translate(1, 2, 3))
+    for v1, v2 in zip(va.transform(m), m.transform_vertices(POINTS)):
+        assert v1.isclose(v2)
+
+
+def test_bounding_box(va):
+    bbox = BoundingBox(va)
+    assert bbox.extmin == (-1, 0, 2)
+    assert bbox.extmax == (4, 5, 6)
+    bbox.extend(VectorArray([(10, 10, 10)]))
+    assert bbox.extmax == (10, 10, 10)
+    assert len(va) == 3, 'should not modify source array'
+
+    bbox2d = BoundingBox2d(va)
+    assert bbox2d.extmin == (-1, 0)
+    assert bbox2d.extmax == (4, 5)
+    bbox2d.extend(VectorArray([(10, -10, 10)]))
+    assert bbox2d.extmin == (-1, -10)
+    assert bbox2d.extmax == (10, 5)
+
+
+def test_extend_bounding_box_by_empty_array(va):
+    bbox = BoundingBox(va)
+    bbox.extend(VectorArray())
+    assert bbox.extmin == (-1, 0, 2)
+    assert bbox.extmax == (4, 5, 6)
+
+    bbox2d = BoundingBox2d()
+    bbox2d.extend(VectorArray())
+    assert bbox2d.has_data is False
+
+
+def test_mesh_builder(va):
+    mesh = MeshBuilder()
+    assert mesh.add_vertices(va) == (0, 1, 2)
+    assert mesh.vertices == POINTS
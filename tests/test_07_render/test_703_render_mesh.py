@@ -169,3 +169,79 @@ def test_from_polyface_type_error(msp):
     line = msp.add_line(start=(0, 0, 0), end=(1, 0, 0))
     with pytest.raises(TypeError):
         MeshBuilder.from_polyface(line)
+
+
+def test_face_normals():
+    normals = cube().face_normals()
+    assert len(normals) == 6
+    for n in normals:
+        assert n.magnitude == pytest.approx(1.0)
+    assert set(n.round(6) for n in normals) == {
+        Vector(1, 0, 0), Vector(-1, 0, 0), Vector(0, 1, 0), Vector(0, -1, 0), Vector(0, 0, 1), Vector(0, 0, -1)
+    }
+
+
+def test_face_normal_of_degenerated_face():
+    mesh = MeshBuilder()
+    mesh.add_face([(0, 0, 0), (1, 0, 0), (2, 0, 0)])
+    assert mesh.face_normals()[0].is_null
+
+
+def test_cube_topology():
+    topology = cube().topology()
+    assert len(topology.edges()) == 12
+    assert topology.is_closed() is True
+    assert topology.boundary_edges() == []
+    assert topology.none_manifold_edges() == []
+    assert len(topology.vertex_faces(0)) == 3
+    assert len(topology.vertex_neighbors(0)) == 3
+    assert len(topology.face_neighbors(0)) == 4
+    assert len(topology.edge_faces(1, 0)) == 2
+
+
+def test_open_mesh_topology():
+    mesh = MeshVertexMerger()
+    mesh.add_face([(0, 0, 0), (1, 0, 0), (1, 1, 0)])
+    mesh.add_face([(0, 0, 0), (1, 1, 0), (0, 1, 0)])
+    topology = mesh.topology()
+    assert topology.is_closed() is False
+    assert len(topology.boundary_edges()) == 4
+    assert topology.edge_faces(0, 2) == [0, 1]
+    assert topology.edge_faces(0, 3) == [1]
+    assert topology.edge_faces(1, 3) == []
+
+
+def test_decimate_requires_target():
+    with pytest.raises(ValueError):
+        cube().decimate()
+
+
+def test_decimate_planar_faces_without_error():
+    mesh = cube().subdivide(2, quads=False)
+    result = mesh.decimate(max_error=1e-9)
+    # each planar side is reduced to 2 triangles
+    assert len(result.faces) == 12
+    assert len(result.vertices) == 8
+    assert result.topology().is_closed() is True
+
+
+def test_decimate_to_target_face_count():
+    from ezdxf.render.forms import sphere
+    mesh = sphere(16, 8).subdivide(1, quads=False)
+    target = len(mesh.faces) // 4
+    result = mesh.decimate(target_faces=target)
+    assert len(result.faces) <= target
+    assert result.topology().is_closed() is True
+    bbox = BoundingBox(result.vertices)
+    assert bbox.size.isclose((2, 2, 2), abs_tol=0.2)
+
+
+def test_decimate_preserves_open_boundary():
+    mesh = MeshTransformer()
+    mesh.add_face([(0, 0, 0), (4, 0, 0), (4, 4, 0), (0, 4, 0)])
+    mesh = mesh.subdivide(3, quads=False)
+    result = mesh.decimate(max_error=1e-9)
+    assert len(result.faces) < len(mesh.faces)
+    bbox = BoundingBox(result.vertices)
+    assert bbox.extmin.isclose((0, 0, 0))
+    assert bbox.extmax.isclose((4, 4, 0))
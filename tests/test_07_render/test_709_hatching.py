@@ -0,0 +1,89 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import math
+from ezdxf.math import Vec2
+from ezdxf.render.hatching import hatch_line_segments, HatchLineDensityError
+
+SQUARE = [(0, 0), (10, 0), (10, 10), (0, 10)]
+HOLE = [(4, 4), (6, 4), (6, 6), (4, 6)]
+
+
+def horizontal_lines(spacing=1, dashes=None):
+    return [(0, (0, 0.5), (0, spacing), dashes or [])]
+
+
+def total_length(segments):
+    return sum(start.distance(end) for start, end in segments)
+
+
+def test_no_boundary_returns_no_segments():
+    assert hatch_line_segments([], horizontal_lines()) == []
+
+
+def test_continuous_lines():
+    segments = hatch_line_segments([SQUARE], horizontal_lines())
+    assert len(segments) == 10
+    assert all(start.x == 0 and end.x == 10 for start, end in segments)
+    assert sorted(start.y for start, _ in segments) == [y + 0.5 for y in range(10)]
+
+
+def test_hole_splits_lines():
+    segments = hatch_line_segments([SQUARE, HOLE], horizontal_lines())
+    # lines y=4.5 and y=5.5 are split by the hole
+    assert len(segments) == 12
+    assert math.isclose(total_length(segments), 100 - 4)
+
+
+ISLAND = [(2, 2), (8, 2), (8, 8), (2, 8)]  # contains HOLE
+
+
+@pytest.mark.parametrize('style,expected', [(0, 100 - 36 + 4), (1, 100 - 36), (2, 100)])
+def test_hatch_style(style, expected):
+    segments = hatch_line_segments([HOLE, SQUARE, ISLAND], horizontal_lines(), hatch_style=style)
+    assert math.isclose(total_length(segments), expected)
+
+
+def test_rotated_pattern_lines():
+    offset = Vec2.from_deg_angle(135)  # perpendicular distance 1
+    segments = hatch_line_segments([SQUARE], [(45, (0, 0), offset, [])])
+    for start, end in segments:
+        assert math.isclose((end - start).angle_deg, 45)
+    # sum of all line lengths is approx. the area of the square for a perpendicular distance of 1
+    assert math.isclose(total_length(segments), 100, rel_tol=0.05)
+
+
+def test_negative_spacing_produces_same_lines():
+    segments1 = hatch_line_segments([SQUARE], horizontal_lines(spacing=1))
+    segments2 = hatch_line_segments([SQUARE], horizontal_lines(spacing=-1))
+    assert sorted(s.y for s, _ in segments1) == sorted(s.y for s, _ in segments2)
+
+
+def test_dashed_lines():
+    segments = hatch_line_segments([SQUARE], horizontal_lines(dashes=[1, -1]))
+    assert len(segments) == 50
+    assert math.isclose(total_length(segments), 50)
+
+
+def test_dots():
+    segments = hatch_line_segments([SQUARE], horizontal_lines(dashes=[0, -2]))
+    assert len(segments) == 50  # 5 dots per line: x = 0, 2, 4, 6, 8
+    assert all(start == end for start, end in segments)
+
+
+def test_coincident_pattern_lines_are_ignored():
+    assert hatch_line_segments([SQUARE], [(0, (0, 0), (1, 0), [])]) == []
+
+
+def test_too_dense_pattern_lines():
+    with pytest.raises(HatchLineDensityError):
+        hatch_line_segments([SQUARE], horizontal_lines(spacing=1e-6))
+
+
+def test_too_dense_dashes():
+    with pytest.raises(HatchLineDensityError):
+        hatch_line_segments([SQUARE], horizontal_lines(dashes=[1e-6, -1e-6]))
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,67 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+from ezdxf.math import Vector
+from ezdxf.render.linetypes import LineTypeRenderer
+
+
+def test_continuous_pattern():
+    renderer = LineTypeRenderer([])
+    assert renderer.is_continuous is True
+    assert renderer.line_dashes([(0, 0), (1, 0), (1, 1)]) == [[(0, 0), (1, 0), (1, 1)]]
+
+
+def test_dashes_of_single_line():
+    renderer = LineTypeRenderer([1, 1])
+    dashes = renderer.line_dashes([(0, 0), (5, 0)])
+    assert dashes == [
+        [(0, 0), (1, 0)],
+        [(2, 0), (3, 0)],
+        [(4, 0), (5, 0)],
+    ]
+
+
+def test_dash_across_polyline_vertex():
+    renderer = LineTypeRenderer([2, 1])
+    dashes = renderer.line_dashes([(0, 0), (1, 0), (1, 3)])
+    assert dashes[0] == [(0, 0), (1, 0), (1, 1)]
+    assert dashes[1] == [(1, 2), (1, 3)]
+
+
+def test_dots():
+    renderer = LineTypeRenderer([1, 0.5, 0, 0.5])
+    dashes = renderer.line_dashes([(0, 0), (4, 0)])
+    assert dashes == [
+        [(0, 0), (1, 0)],
+        [(1.5, 0)],
+        [(2, 0), (3, 0)],
+        [(3.5, 0)],
+    ]
+
+
+def test_too_dense_pattern_renders_continuous_line():
+    renderer = LineTypeRenderer([1e-3, 1e-3], max_dashes=100)
+    assert renderer.line_dashes([(0, 0), (1, 0)]) == [[(0, 0), (1, 0)]]
+
+
+def test_decorations():
+    renderer = LineTypeRenderer([1, 1], decorations=[(1.5, 'X')])
+    decorations = renderer.line_decorations([(0, 0), (2, 0), (2, 3)])
+    assert len(decorations) == 2  # at 1.5 and 3.5
+    item, location, direction = decorations[0]
+    assert item == 'X'
+    assert location.isclose((1.5, 0))
+    assert direction.isclose((1, 0))
+    item, location, direction = decorations[1]
+    assert location.isclose((2, 1.5))
+    assert direction.isclose((0, 1))
+
+
+def test_dashes_are_vectors():
+    renderer = LineTypeRenderer([1, 1])
+    dash = renderer.line_dashes([(0, 0), (5, 0)])[0]
+    assert all(isinstance(v, Vector) for v in dash)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
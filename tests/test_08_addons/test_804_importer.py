@@ -137,6 +137,19 @@ def test_import_block_with_conflict_rename_resolve_block_ref_inside_block_def(im
     assert block_ref_to_conflict_block.dxf.name == 'ConflictBlock0'
 
 
+def test_import_blocks_resolves_all_source_blocks_in_advance(importer):
+    with pytest.raises(ValueError):
+        importer.import_blocks(['TestBlock', 'MissingBlock'])
+    assert 'TestBlock' not in importer.target.blocks, 'target drawing should not be modified'
+
+
+def test_import_blocks_imports_each_block_once(importer):
+    importer.import_blocks(['TestBlock', 'TESTBLOCK', 'TestBlock'], rename=True)
+    importer.finalize()
+    assert 'TestBlock' in importer.target.blocks
+    assert 'TestBlock0' not in importer.target.blocks
+
+
 def test_import_polyline():
     source = ezdxf.new()
     source.modelspace().add_polyline3d([(0, 0), (3, 0), (3, 3), (0, 3)])
@@ -162,3 +175,45 @@ def test_import_insert_with_attribs():
     assert len(tinsert.attribs) == 2
     assert tinsert.seqend is not None
     assert tinsert.seqend.dxf.layer == tinsert.dxf.layer
+
+
+def test_import_entities_in_batches(monkeypatch):
+    import ezdxf.addons.importer
+    monkeypatch.setattr(ezdxf.addons.importer, 'IMPORT_BATCH_SIZE', 3)
+    source = ezdxf.new()
+    msp = source.modelspace()
+    for _ in range(3):  # a whole batch of not supported entities
+        msp.add_3dsolid()
+    for index in range(7):
+        msp.add_line((0, 0), (index, 0), dxfattribs={'layer': 'L{}'.format(index)})
+    target = ezdxf.new()
+    importer = Importer(source, target)
+    importer.import_modelspace()
+    importer.finalize()
+    lines = target.modelspace().query('LINE')
+    assert len(lines) == 7
+    assert len(set(line.dxf.handle for line in lines)) == 7
+    assert all(target.entitydb[line.dxf.handle] is line for line in lines)
+    assert all(line.dxf.owner == target.modelspace().layout_key for line in lines)
+    assert {'L{}'.format(index) for index in range(7)} <= importer.used_layers
+
+
+def test_import_from_iterdxf(tmpdir):
+    from ezdxf.addons import iterdxf
+    source = create_source_drawing('R2000')
+    source.layout().add_text('PAPERSPACE')
+    filename = str(tmpdir.join('source.dxf'))
+    source.saveas(filename)
+
+    doc = iterdxf.opendxf(filename)
+    resources = doc.resources()
+    assert len(resources.modelspace()) == 0
+    assert [e.dxftype() for e in resources.layout()] == ['TEXT'], 'paperspace entities should be preserved'
+    assert 'TestBlock' in resources.blocks
+    target = ezdxf.new('R2000')
+    importer = Importer(resources, target)
+    importer.import_entities(doc.modelspace())
+    importer.finalize()
+    doc.close()
+    assert len(target.modelspace()) == 4
+    assert 'TestBlock' in target.blocks
@@ -0,0 +1,229 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import struct
+from ezdxf.addons.dwg.loader import DwgDocument
+from ezdxf.addons.dwg.const import CRCError, DwgError
+from ezdxf.addons.dwg.crc import crc8
+from ezdxf.addons.dwg.fileheader import FILE_HEADER_MAGIC
+from ezdxf.addons.dwg.objects_section import (
+    object_record, object_type, decode_object, decode_object_records, OBJECT_TYPES, ENTMODE_MODELSPACE, ENTMODE_PAPERSPACE,
+    ENTMODE_NONE,
+)
+
+LINE = 0x13
+LAYER = 0x33
+
+
+class BitWriter:
+    def __init__(self):
+        self.bits = []
+
+    def write_bits(self, value: int, count: int):
+        self.bits.extend((value >> shift) & 1 for shift in range(count - 1, -1, -1))
+
+    def write_byte(self, value: int):
+        self.write_bits(value, 8)
+
+    def write_bit_short(self, value: int):
+        if value == 0:
+            self.write_bits(2, 2)
+        elif 0 < value < 256:
+            self.write_bits(1, 2)
+            self.write_byte(value)
+        else:
+            self.write_bits(0, 2)
+            self.write_byte(value & 0xff)
+            self.write_byte(value >> 8)
+
+    def write_handle(self, handle: int):
+        self.write_bits(0, 4)
+        self.write_bits(1, 4)
+        self.write_byte(handle)
+
+    def bytes(self) -> bytes:
+        bits = self.bits + [0] * (-len(self.bits) % 8)
+        return bytes(
+            int(''.join(str(bit) for bit in bits[index: index + 8]), 2) for index in range(0, len(bits), 8)
+        )
+
+
+def object_data(type_: int, handle: int, entmode: int = None) -> bytes:
+    bw = BitWriter()
+    bw.write_bit_short(type_)
+    bw.write_bits(0, 32)  # object size in bits
+    bw.write_handle(handle)
+    bw.write_bit_short(3)  # extended entity data
+    bw.write_handle(0x12)
+    for byte in b'EED':
+        bw.write_byte(byte)
+    bw.write_bit_short(0)
+    if entmode is not None:
+        bw.write_bits(0, 1)  # no graphic data
+        bw.write_bits(entmode, 2)
+    bw.write_bits(0x55, 8)  # some object data
+    return bw.bytes()
+
+
+def record(data: bytes) -> bytes:
+    chunk = struct.pack('<H', len(data)) + data
+    return chunk + struct.pack('<H', crc8(chunk, seed=0xc0c1))
+
+
+def unsigned_mc(value: int) -> bytes:
+    result = bytearray()
+    while True:
+        byte = value & 0x7f
+        value >>= 7
+        if value:
+            result.append(byte | 0x80)
+        else:
+            result.append(byte)
+            return bytes(result)
+
+
+def signed_mc(value: int) -> bytes:
+    sign = 0x40 if value < 0 else 0
+    value = abs(value)
+    result = bytearray()
+    while value > 0x3f:
+        result.append((value & 0x7f) | 0x80)
+        value >>= 7
+    result.append(value | sign)
+    return bytes(result)
+
+
+def object_map_section(pairs) -> bytes:
+    body = b''.join(unsigned_mc(h) + signed_mc(loc) for h, loc in pairs)
+    chunk = struct.pack('>H', len(body) + 2) + body
+    return chunk + struct.pack('>H', crc8(chunk, seed=0xc0c1))
+
+
+OBJECTS = [
+    (0x20, object_data(LINE, 0x20, ENTMODE_MODELSPACE)),
+    (0x21, object_data(LINE, 0x21, ENTMODE_PAPERSPACE)),
+    (0x23, object_data(LAYER, 0x23)),
+    (0x24, object_data(LINE, 0x24, ENTMODE_MODELSPACE)),
+]
+
+
+def make_dwg() -> bytes:
+    header = bytearray(b'AC1015' + b'\x00' * 15)
+    header[0x13:0x15] = struct.pack('<h', 30)
+    objects_start = 0x15 + 4 + 3 * 9 + 2 + 16
+    objects = b''
+    locations = []
+    for handle, data in OBJECTS:
+        locations.append((handle, objects_start + len(objects)))
+        objects += record(data)
+    # Two sections with offsets relative to the previous pair, restarting with 0 for each section:
+    pairs = []
+    prev_handle, prev_location = 0, 0
+    for handle, location in locations[:2]:
+        pairs.append((handle - prev_handle, location - prev_location))
+        prev_handle, prev_location = handle, location
+    object_map = object_map_section(pairs)
+    object_map += object_map_section([(handle, location) for handle, location in locations[2:3]])
+    object_map += object_map_section([(locations[3][0], locations[3][1])])
+    object_map += struct.pack('>H', 2)  # last empty section
+    map_start = objects_start + len(objects)
+    header += struct.pack('<L', 3)
+    header += struct.pack('<BLL', 0, 0, 0)
+    header += struct.pack('<BLL', 1, 0, 0)
+    header += struct.pack('<BLL', 2, map_start, len(object_map))
+    header += struct.pack('<H', crc8(header, seed=0) ^ FILE_HEADER_MAGIC[3])
+    header += b'\x95\xA0\x4E\x28\x99\x82\x1A\xE5\x5E\x41\xE0\x5F\x9D\x3A\x4D\x00'
+    assert len(header) == objects_start
+    return bytes(header) + objects + object_map
+
+
+@pytest.fixture
+def doc() -> DwgDocument:
+    doc = DwgDocument(make_dwg(), crc_check=True)
+    doc.load_objects()
+    return doc
+
+
+def test_load_object_map(doc):
+    assert list(doc.object_map) == [0x20, 0x21, 0x23, 0x24]
+    assert doc.object_map[0x21] - doc.object_map[0x20] == len(OBJECTS[0][1]) + 4
+
+
+def test_object_map_crc_error():
+    data = bytearray(make_dwg())
+    data[-4] ^= 0xff  # corrupt CRC of the last non-empty section
+    doc = DwgDocument(data, crc_check=True)
+    with pytest.raises(CRCError):
+        doc.load_objects()
+
+
+def test_objects_are_decoded_on_demand(doc):
+    assert len(doc._objects) == 0
+    line = doc.get_object(0x21)
+    assert line.dxftype == 'LINE'
+    assert line.is_entity is True
+    assert line.entmode == ENTMODE_PAPERSPACE
+    assert line.data == OBJECTS[1][1]
+    assert list(doc._objects) == [0x21]
+    assert doc.get_object(0x21) is line
+
+
+def test_decode_non_graphical_object(doc):
+    layer = doc.get_object(0x23)
+    assert layer.dxftype == 'LAYER'
+    assert layer.entmode == ENTMODE_NONE
+    assert layer.is_entity is False
+
+
+def test_get_invalid_object(doc):
+    with pytest.raises(DwgError):
+        doc.get_object(0x22)
+
+
+def test_object_crc_error(doc):
+    data = bytearray(doc.data)
+    location = doc.object_map[0x20]
+    data[location + 3] ^= 0xff
+    with pytest.raises(CRCError):
+        decode_object(0x20, object_record(data, location), 'AC1015', 'cp1252', OBJECT_TYPES, crc_check=True)
+
+
+def test_layout_entities(doc):
+    handles = [obj.handle for obj in doc.layout_entities(ENTMODE_MODELSPACE)]
+    assert handles == [0x20, 0x24]
+    handles = [obj.handle for obj in doc.layout_entities(ENTMODE_PAPERSPACE)]
+    assert handles == [0x21]
+
+
+def test_layout_entities_do_not_decode_non_graphical_objects(doc):
+    doc.layout_entities(ENTMODE_MODELSPACE)
+    assert 0x23 not in doc._objects
+    assert sorted(doc._objects) == [0x20, 0x21, 0x24]
+
+
+def test_object_type(doc):
+    assert object_type(object_record(doc.data, doc.object_map[0x23])) == LAYER
+    assert object_type(object_record(doc.data, doc.object_map[0x24])) == LINE
+
+
+def test_decode_object_records(doc):
+    records = [(handle, bytes(object_record(doc.data, location))) for handle, location in doc.object_map.items()]
+    result = decode_object_records(records, 'AC1015', 'cp1252', doc.object_types, crc_check=True)
+    assert result == doc.get_objects(doc.object_map)
+
+
+def test_get_objects_by_worker_processes(doc):
+    expected = DwgDocument(doc.data.tobytes(), crc_check=True)
+    expected.load_objects()
+    objects = doc.get_objects([0x24, 0x20, 0x21, 0x23], workers=2)
+    assert [obj.handle for obj in objects] == [0x24, 0x20, 0x21, 0x23]
+    assert objects == expected.get_objects([0x24, 0x20, 0x21, 0x23])
+
+
+def test_get_invalid_objects_by_worker_processes(doc):
+    with pytest.raises(DwgError):
+        doc.get_objects([0x20, 0x21, 0x22, 0x23, 0x24], workers=2)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,31 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+from ezdxf.addons.dwg.crc import crc8, crc32, CRC8_TABLE
+
+
+def test_crc8_check_value():
+    # DWG CRC8 is the 16 bit CRC-16/ARC
+    assert crc8(b'123456789') == 0xbb3d
+
+
+@pytest.mark.parametrize('size', [0, 1, 63, 64, 65, 259])
+def test_crc8_word_table_matches_byte_table(size):
+    data = bytes(index & 0xff for index in range(size))
+    result = 0xc0c1
+    for byte in data:  # reference implementation
+        result = (result >> 8) ^ CRC8_TABLE[(result ^ byte) & 0xff]
+    assert crc8(data, seed=0xc0c1) == result
+    assert crc8(memoryview(data), seed=0xc0c1) == result
+
+
+def test_crc32_check_value():
+    assert crc32(b'123456789') == 0xcbf43926
+
+
+def test_crc32_seed():
+    assert crc32(b'456789', seed=crc32(b'123')) == crc32(b'123456789')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
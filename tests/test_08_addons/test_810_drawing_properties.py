@@ -141,6 +141,41 @@ def test_compile_pattern():
     assert compile_line_pattern(1.4, [1.0, -0.2, 0.0, -0.2]) == (1.0, 0.2, 0.0, 0.2)
     assert compile_line_pattern(0.2, [0.0, -0.2]) == (0.0, 0.2)
     assert compile_line_pattern(2.6, [2.0, -0.2, 0.0, -0.2, 0.0, -0.2]) == (2.0, 0.2, 0.0, 0.2, 0.0, 0.2)
+    assert compile_line_pattern(1.0, [0.5, -0.25]) == (0.5, 0.5), 'extend last gap'
+
+
+def test_linetype_renderer_cache(doc):
+    ctx = RenderContext(doc)
+    line = doc.modelspace()[1]  # DASHED
+    properties = ctx.resolve_all(line)
+    renderer = ctx.linetype_renderer(properties)
+    assert renderer.dashes == tuple(e * ctx.linetype_scale for e in properties.linetype_pattern)
+    assert ctx.linetype_renderer(properties) is renderer
+    properties.linetype_scale = 2
+    assert ctx.linetype_renderer(properties) is not renderer
+
+
+def test_continuous_linetype_has_no_renderer(doc):
+    ctx = RenderContext(doc)
+    properties = ctx.resolve_all(doc.modelspace()[1])
+    properties.linetype_pattern = tuple()
+    assert ctx.linetype_renderer(properties) is None
+
+
+def test_complex_linetype_texts():
+    doc = ezdxf.new()
+    doc.linetypes.new('GAS', dxfattribs={
+        'description': 'Gas ----GAS----GAS----GAS----GAS----GAS----GAS--',
+        'length': 0.95,
+        'pattern': 'A,.5,-.2,["GAS",STANDARD,S=.1,U=0.0,X=-0.1,Y=-.05],-.25',
+    })
+    ctx = RenderContext(doc)
+    assert ctx.line_pattern['GAS'] == (0.5, 0.45)
+    location, text = ctx.linetype_texts['GAS'][0]
+    assert location == pytest.approx(0.7)
+    assert text.text == 'GAS'
+    assert text.height == 0.1
+    assert (text.x, text.y) == (-0.1, -0.05)
 
 
 if __name__ == '__main__':
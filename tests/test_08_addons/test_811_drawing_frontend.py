@@ -1,5 +1,6 @@
 # Copyright (c) 2020, Manfred Moitzi
 # License: MIT License
+import math
 from typing import Optional, Tuple, List
 import pytest
 import ezdxf
@@ -138,6 +139,38 @@ def test_line(msp, basic):
     assert result[0][0] == 'line'
 
 
+def test_dashed_line(doc, msp):
+    doc.linetypes.new('TEST_DASHED', dxfattribs={'pattern': [2.0, 1.0, -1.0]})
+    msp.add_line((0, 0), (5, 0), dxfattribs={'linetype': 'TEST_DASHED'})
+    frontend = Frontend(RenderContext(doc), BasicBackend())
+    frontend.draw_entities(msp)
+    result = frontend.out.collector
+    assert len(result) == 3
+    assert [e[1].x for e in result] == [0, 2, 4]
+
+
+def test_disable_linetype_rendering(doc, msp):
+    doc.linetypes.new('TEST_DASHED', dxfattribs={'pattern': [2.0, 1.0, -1.0]})
+    msp.add_line((0, 0), (5, 0), dxfattribs={'linetype': 'TEST_DASHED'})
+    frontend = Frontend(RenderContext(doc), BasicBackend())
+    frontend.linetype_rendering = False
+    frontend.draw_entities(msp)
+    assert len(frontend.out.collector) == 1
+
+
+def test_complex_linetype_text(doc, msp):
+    doc.linetypes.new('GAS', dxfattribs={
+        'length': 0.95,
+        'pattern': 'A,.5,-.2,["GAS",STANDARD,S=.1,U=0.0,X=-0.1,Y=-.05],-.25',
+    })
+    msp.add_line((0, 0), (1.9, 0), dxfattribs={'linetype': 'GAS'})
+    frontend = Frontend(RenderContext(doc), BasicBackend())
+    frontend.draw_entities(msp)
+    result = frontend.out.collector
+    assert [e[0] for e in result] == ['line', 'line', 'text', 'text']
+    assert result[2][1].get_row(3)[:2] == pytest.approx((0.6, -0.05))
+
+
 def test_lwpolyline_basic(msp, basic):
     msp.add_lwpolyline([(0, 0), (1, 0), (2, 0)])
     basic.draw_entities(msp)
@@ -292,6 +325,94 @@ def test_hatch(msp, basic):
     assert result[0][0] == 'filled_polygon'
 
 
+def test_pattern_filled_hatch(msp, basic):
+    hatch = msp.add_hatch()
+    hatch.set_pattern_fill('ANSI31', scale=0.5)
+    hatch.paths.add_polyline_path([(0, 0), (10, 0), (10, 10), (0, 10)])
+    basic.draw_entities(msp)
+    result = basic.out.collector
+    assert len(result) > 1
+    assert all(e[0] == 'line' for e in result)
+
+
+def test_too_dense_pattern_is_drawn_as_filled_polygon(msp, basic):
+    hatch = msp.add_hatch()
+    hatch.set_pattern_fill('ANSI31')
+    hatch.set_pattern_definition([[0, (0, 0), (0, 0.0001), []]])
+    hatch.paths.add_polyline_path([(0, 0), (100, 0), (100, 100), (0, 100)])
+    basic.draw_entities(msp)
+    result = basic.out.collector
+    assert len(result) == 1
+    assert result[0][0] == 'filled_polygon'
+
+
+def test_hatch_geometry_cache(msp, basic):
+    hatch = msp.add_hatch()
+    hatch.set_pattern_fill('ANSI31', scale=0.5)
+    path = hatch.paths.add_polyline_path([(0, 0), (10, 0), (10, 10), (0, 10)])
+    basic.draw_entities(msp)
+    count = len(basic.out.collector)
+    assert len(basic.ctx.hatch_cache) == 1
+
+    basic.out.clear()
+    basic.draw_entities(msp)
+    assert len(basic.out.collector) == count
+    assert len(basic.ctx.hatch_cache) == 1, 'expected cached geometry'
+
+    # modification of the boundary path invalidates the cache
+    path.vertices = [(0, 0, 0), (20, 0, 0), (20, 20, 0), (0, 20, 0)]
+    basic.out.clear()
+    basic.draw_entities(msp)
+    assert len(basic.out.collector) > count
+
+
+def test_reused_render_context_draws_modified_boundary_paths(msp, basic):
+    hatch = msp.add_hatch()
+    hatch.set_pattern_fill('LINE', definition=[[0, (0, 0.5), (0, 1), []]])
+    hatch.paths.add_polyline_path([(0, 0), (10, 0), (10, 10), (0, 10)])
+    basic.draw_entities(msp)
+    assert len(basic.out.collector) == 10
+
+    hatch.paths.clear()
+    hatch.paths.add_polyline_path([(0, 0), (100, 0), (100, 100), (0, 100)])
+    basic.out.clear()
+    basic.draw_entities(msp)
+    assert len(basic.out.collector) == 100
+
+    edge_path = hatch.paths.add_edge_path()
+    edge_path.add_line((40, 40), (60, 40))
+    edge_path.add_line((60, 40), (60, 60))
+    edge_path.add_line((60, 60), (40, 60))
+    edge_path.add_line((40, 60), (40, 40))
+    basic.out.clear()
+    basic.draw_entities(msp)
+    assert len(basic.out.collector) == 120, 'expected 20 lines split by the island'
+
+
+def test_hatch_geometry_cache_key_of_virtual_entities(msp, basic):
+    hatch = msp.add_hatch()
+    hatch.set_pattern_fill('ANSI31', scale=0.5)
+    hatch.paths.add_polyline_path([(0, 0), (10, 0), (10, 10), (0, 10)])
+    virtual_hatch = hatch.copy()
+    assert virtual_hatch.dxf.handle is None
+    basic.draw_entity(virtual_hatch)
+    basic.draw_entity(virtual_hatch.copy())
+    assert len(basic.ctx.hatch_cache) == 1, 'expected content based key'
+    assert isinstance(next(iter(basic.ctx.hatch_cache)), bytes)
+
+
+@pytest.mark.parametrize('style,expected', [(0, 68), (1, 64), (2, 100)])
+def test_hatch_style_islands(msp, basic, style, expected):
+    hatch = msp.add_hatch()
+    hatch.set_pattern_fill('LINE', definition=[[0, (0, 0.5), (0, 1), []]], style=style)
+    hatch.paths.add_polyline_path([(0, 0), (10, 0), (10, 10), (0, 10)])
+    hatch.paths.add_polyline_path([(2, 2), (8, 2), (8, 8), (2, 8)])  # island
+    hatch.paths.add_polyline_path([(4, 4), (6, 4), (6, 6), (4, 6)])  # island in island
+    basic.draw_entities(msp)
+    length = sum(e[1].distance(e[2]) for e in basic.out.collector)
+    assert math.isclose(length, expected)
+
+
 def test_basic_spline(msp, basic):
     msp.add_spline(fit_points=[(0, 0), (3, 2), (4, 5), (6, 4), (12, 0)])
     basic.draw_entities(msp)